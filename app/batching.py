@@ -0,0 +1,81 @@
+import asyncio
+from . import config
+from .inference import process_image_batch
+
+
+class BatchScheduler:
+    """
+    Regroupe les images de plusieurs sessions arrivées dans une courte fenêtre
+    de temps et les envoie ensemble au pool d'inférence, qui répartit le lot
+    entre ses workers (InferenceExecutor.run_batch).
+
+    Un lot part dès qu'il atteint max_batch_size images, ou max_wait_ms après
+    l'arrivée de sa première image. Les lots sont constitués par pool
+    (InferenceExecutor.lane_for) pour respecter l'affinité des sessions en mode
+    process. batch_func reçoit la liste des (session_id, args) d'un worker et
+    retourne un (ok, résultat) par image.
+
+    MediaPipe Hands ne traite qu'une image par appel (un graphe par session,
+    avec son état de suivi) : il n'y a pas de backend de landmarks batché, et
+    un lot ne fait que regrouper les soumissions au pool. Mesuré par
+    benchmarks/bench_batching.py, le regroupement n'améliore ni le débit ni
+    le CPU par image et ajoute jusqu'à max_wait_ms de latence : il reste
+    désactivé par défaut (LSF_BATCH_MAX_SIZE=1).
+    """
+    def __init__(self, executor, max_batch_size=None, max_wait_ms=None, batch_func=None):
+        self.executor = executor
+        self.max_batch_size = max_batch_size or config.BATCH_MAX_SIZE
+        if max_wait_ms is None:
+            max_wait_ms = config.BATCH_MAX_WAIT_MS
+        self.max_wait = max_wait_ms / 1000.0
+        self.batch_func = batch_func or process_image_batch
+        # Lots en cours de constitution : pool -> liste de (session_id, args, future)
+        self._batches = {}
+        self._timers = {}
+        self._tasks = set()
+
+    async def run(self, session_id, *args):
+        """
+        Ajoute une image au lot de son pool et attend son résultat
+        """
+        self.executor.acquire()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        lane = self.executor.lane_for(session_id)
+        batch = self._batches.setdefault(lane, [])
+        batch.append((session_id, args, future))
+        if len(batch) >= self.max_batch_size:
+            self._flush(lane)
+        elif len(batch) == 1:
+            self._timers[lane] = loop.call_later(self.max_wait, self._flush, lane)
+        return await future
+
+    def _flush(self, lane):
+        timer = self._timers.pop(lane, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._batches.pop(lane, None)
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._dispatch(lane, batch))
+        # Garder une référence tant que le lot est en cours de traitement
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, lane, batch):
+        try:
+            results = await self.executor.run_batch(
+                lane, self.batch_func, [(session_id, args) for session_id, args, _ in batch]
+            )
+        except Exception as e:
+            results = [(False, e)] * len(batch)
+        finally:
+            self.executor.release(len(batch))
+        # Renvoyer chaque résultat à la session qui a envoyé l'image
+        for (_, _, future), (ok, value) in zip(batch, results):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
@@ -0,0 +1,33 @@
+import numpy as np
+
+# Tampons d'image réutilisés d'une image à l'autre : à 30 images/s, allouer
+# un nouveau tableau pleine taille à chaque conversion de couleur fait
+# travailler l'allocateur et grossir la mémoire résidente du processus.
+
+
+class FrameBuffers:
+    """
+    Tampons nommés d'une session (ou d'un détecteur), réalloués seulement
+    quand la taille de l'image change.
+
+    Une session traite ses images une à la fois : le contenu d'un tampon
+    n'est valable que jusqu'à l'image suivante.
+    """
+    def __init__(self):
+        self._buffers = {}
+
+    def get(self, name, shape, dtype=np.uint8):
+        """
+        Tampon `name` de forme et de type donnés (contenu non initialisé)
+        """
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = self._buffers[name] = np.empty(shape, dtype)
+        return buffer
+
+    @property
+    def nbytes(self):
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def clear(self):
+        self._buffers.clear()
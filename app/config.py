@@ -0,0 +1,120 @@
+import os
+
+# Configuration du serveur LSF, lue depuis les variables d'environnement
+# (voir Dockerfile / docker-compose.yml)
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    return int(value)
+
+
+def _env_str(name, default):
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    return value
+
+
+def _env_bool(name, default):
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Adresse d'écoute du serveur WebSocket
+HOST = _env_str("LSF_HOST", "0.0.0.0")
+PORT = _env_int("LSF_PORT", 8765)
+# Port HTTP des métriques Prometheus (GET /metrics) ; 0 = désactivé
+METRICS_PORT = _env_int("LSF_METRICS_PORT", 9100)
+# Nombre de processus serveur (SO_REUSEPORT) ; chaque connexion reste sur un seul processus
+SERVER_WORKERS = _env_int("LSF_SERVER_WORKERS", 1)
+
+# Exécuteur d'inférence : "thread" ou "process"
+INFERENCE_MODE = _env_str("LSF_INFERENCE_MODE", "thread")
+# Nombre de workers du pool d'inférence (par processus serveur)
+INFERENCE_WORKERS = _env_int(
+    "LSF_INFERENCE_WORKERS", max(1, (os.cpu_count() or 1) // max(1, SERVER_WORKERS))
+)
+# Nombre maximum d'images en attente ou en cours de traitement
+INFERENCE_QUEUE_SIZE = _env_int("LSF_INFERENCE_QUEUE_SIZE", INFERENCE_WORKERS * 4)
+
+# Taille maximale d'un message WebSocket, en octets (0 = illimitée)
+MAX_MESSAGE_SIZE = _env_int("LSF_MAX_MESSAGE_SIZE", 2 ** 20)
+# Nombre maximal de pixels d'une image (lu dans l'en-tête avant décodage)
+MAX_IMAGE_PIXELS = _env_int("LSF_MAX_IMAGE_PIXELS", 4096 * 4096)
+
+# Décodeur d'image : "opencv", "turbojpeg" (PyTurboJPEG) ou "auto"
+DECODER = _env_str("LSF_DECODER", "auto")
+# Petit côté minimal de l'image décodée : les JPEG plus grands sont décodés
+# directement à 1/2, 1/4 ou 1/8 (0 = toujours pleine résolution). MediaPipe
+# travaille en 192 px (paume) et 224 px (landmarks, sur le recadrage de la main) :
+# une marge est gardée pour que la main reste assez grande dans l'image.
+DECODE_MIN_SIZE = _env_int("LSF_DECODE_MIN_SIZE", 360)
+
+# Recadrer les images autour de la main trouvée sur l'image précédente ;
+# l'image entière n'est retraitée que lorsque la main est perdue
+HAND_ROI = _env_bool("LSF_HAND_ROI", False)
+# Côté du recadrage carré, en pourcentage du plus grand côté de la main
+HAND_ROI_SCALE_PERCENT = _env_int("LSF_HAND_ROI_SCALE_PERCENT", 200)
+
+# Reconnaissance des signes : "tree" (définitions du fichier de règles compilées
+# en arbre de décision), "index" (signes candidats indexés par un code de forme
+# de la main calculé une fois par image), "matrix" (définitions compilées en une
+# matrice de comparaison, évaluée en une passe NumPy) ou "predicates" (méthodes
+# _is_* de LSFRecognizer appelées une par une jusqu'au premier signe reconnu)
+SIGN_MATCHER = _env_str("LSF_SIGN_MATCHER", "tree")
+# Fichier de règles JSON (ou YAML, avec PyYAML) ; vide = app/signs.json
+SIGN_RULES_PATH = _env_str("LSF_SIGN_RULES_PATH", "")
+# Recharger le fichier de règles s'il a changé, vérifié au plus toutes les
+# N millisecondes (0 = jamais)
+SIGN_RULES_RELOAD_MS = _env_int("LSF_SIGN_RULES_RELOAD_MS", 0)
+
+# Mode debug : dessiner les landmarks sur les images dans HandDetector.detect_hand
+DEBUG_ANNOTATE = _env_bool("LSF_DEBUG_ANNOTATE", False)
+
+# Micro-batching entre clients : taille maximale d'un lot (1 = désactivé ;
+# sans backend batché pour MediaPipe, voir batching.py)
+BATCH_MAX_SIZE = _env_int("LSF_BATCH_MAX_SIZE", 1)
+# Attente maximale avant l'envoi d'un lot incomplet, en millisecondes
+BATCH_MAX_WAIT_MS = _env_int("LSF_BATCH_MAX_WAIT_MS", 5)
+
+# Inférence conditionnée au mouvement : réutiliser le signe précédent tant que
+# l'image ne change pas (écart moyen d'un aperçu 32 px en niveaux de gris)
+MOTION_GATE = _env_bool("LSF_MOTION_GATE", False)
+# Écart absolu moyen (niveaux de gris, 0-255) au-delà duquel l'image a changé
+MOTION_THRESHOLD = _env_int("LSF_MOTION_THRESHOLD", 3)
+# Traiter une image au moins toutes les N millisecondes, même sans mouvement
+MOTION_REFRESH_MS = _env_int("LSF_MOTION_REFRESH_MS", 1000)
+
+# Cache des images en double, par connexion : nombre d'images retenues (0 = désactivé)
+FRAME_CACHE_SIZE = _env_int("LSF_FRAME_CACHE_SIZE", 0)
+# Durée de validité d'un résultat en cache, en millisecondes
+FRAME_CACHE_TTL_MS = _env_int("LSF_FRAME_CACHE_TTL_MS", 1000)
+# Reconnaître aussi les images presque identiques (dHash d'un aperçu en niveaux
+# de gris, calculé dans le pool d'inférence, seulement pour les images absentes
+# du cache à l'identique : ~0,5 ms par image JPEG)
+FRAME_CACHE_PERCEPTUAL = _env_bool("LSF_FRAME_CACHE_PERCEPTUAL", False)
+# Distance de Hamming maximale entre deux dHash (sur 64 bits) considérés identiques
+FRAME_CACHE_PHASH_DISTANCE = _env_int("LSF_FRAME_CACHE_PHASH_DISTANCE", 4)
+
+# Mode "dernière image gagnante" activé par défaut pour chaque connexion
+# (un client peut le changer avec un message {"type": "config", "latest_frame_only": ...})
+LATEST_FRAME_ONLY = _env_bool("LSF_LATEST_FRAME_ONLY", False)
+
+# Sérialisation JSON des messages : "json", "orjson" (paquet optionnel) ou "auto"
+JSON_LIBRARY = _env_str("LSF_JSON_LIBRARY", "auto")
+
+# Journalisation
+LOG_LEVEL = _env_str("LSF_LOG_LEVEL", "INFO").upper()
+# Journaliser le début de chaque message reçu (niveau DEBUG) ; désactivé par défaut
+LOG_PAYLOADS = _env_bool("LSF_LOG_PAYLOADS", False)
+# Journaliser un signe détecté sur N (0 = jamais)
+LOG_SAMPLE_EVERY = _env_int("LSF_LOG_SAMPLE_EVERY", 100)
+
+# Répertoire où enregistrer les sessions clientes (.lsfrec) pour les rejouer
+# avec benchmarks/replay.py ; vide = pas d'enregistrement
+RECORD_DIR = _env_str("LSF_RECORD_DIR", "")
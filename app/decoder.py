@@ -0,0 +1,210 @@
+import struct
+import cv2
+import numpy as np
+from . import config
+from .buffers import FrameBuffers
+
+# libjpeg-turbo (paquet PyTurboJPEG) est optionnel
+try:
+    from turbojpeg import TurboJPEG
+except ImportError:
+    TurboJPEG = None
+
+# Décodage des images reçues, à taille réduite quand c'est possible : le
+# décodeur JPEG sait produire directement une image 1/2, 1/4 ou 1/8 en
+# n'appliquant l'IDCT que sur les basses fréquences, bien plus vite qu'un
+# décodage pleine résolution suivi d'un redimensionnement.
+
+SCALE_FACTORS = (8, 4, 2, 1)
+
+_OPENCV_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Marqueurs JPEG SOF (Start Of Frame) : baseline, progressif, etc. (hors DHT, JPG, DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def image_info(data):
+    """
+    Lit le format et les dimensions dans l'en-tête de l'image, sans la décoder.
+    Retourne (format, largeur, hauteur) avec format "jpeg" ou "png", ou None.
+    """
+    view = memoryview(data)
+    if len(view) >= 24 and view[:8] == _PNG_SIGNATURE and view[12:16] == b"IHDR":
+        width, height = struct.unpack_from("!II", view, 16)
+        return "png", width, height
+    if len(view) < 4 or view[0] != 0xFF or view[1] != 0xD8:
+        return None
+    # Parcourir les segments JPEG jusqu'au SOF
+    pos = 2
+    while pos + 4 <= len(view):
+        if view[pos] != 0xFF:
+            return None
+        marker = view[pos + 1]
+        if marker == 0xFF:
+            # Octet de bourrage
+            pos += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            # Marqueurs sans longueur
+            pos += 2
+            continue
+        length = struct.unpack_from("!H", view, pos + 2)[0]
+        if marker in _JPEG_SOF_MARKERS:
+            if pos + 9 > len(view):
+                return None
+            height, width = struct.unpack_from("!HH", view, pos + 5)
+            return "jpeg", width, height
+        if marker == 0xDA:
+            # Début des données compressées sans SOF : image invalide
+            return None
+        pos += 2 + length
+    return None
+
+
+def choose_scale(width, height, min_size=None):
+    """
+    Plus grand facteur de réduction (8, 4, 2 ou 1) qui garde le petit côté
+    de l'image décodée au moins égal à min_size (taille utile au détecteur)
+    """
+    if min_size is None:
+        min_size = config.DECODE_MIN_SIZE
+    if min_size <= 0:
+        return 1
+    shorter = min(width, height)
+    for factor in SCALE_FACTORS:
+        if shorter // factor >= min_size:
+            return factor
+    return 1
+
+
+class OpenCVDecoder:
+    """
+    Décodeur OpenCV ; les modes IMREAD_REDUCED_COLOR_* utilisent le décodage
+    JPEG à l'échelle 1/2, 1/4 ou 1/8 de libjpeg
+    """
+    name = "opencv"
+
+    def decode(self, data, scale=1, image_format=None):
+        nparr = np.frombuffer(data, np.uint8)
+        return cv2.imdecode(nparr, _OPENCV_FLAGS[scale])
+
+
+class TurboJPEGDecoder:
+    """
+    Décodeur libjpeg-turbo (PyTurboJPEG) pour le JPEG, avec mise à
+    l'échelle à la décompression ; les autres formats passent par OpenCV
+    """
+    name = "turbojpeg"
+
+    def __init__(self):
+        if TurboJPEG is None:
+            raise RuntimeError("PyTurboJPEG n'est pas installé (pip install PyTurboJPEG)")
+        self._jpeg = TurboJPEG()
+        self._fallback = OpenCVDecoder()
+
+    def decode(self, data, scale=1, image_format="jpeg"):
+        if image_format != "jpeg":
+            return self._fallback.decode(data, scale)
+        try:
+            return self._jpeg.decode(data, scaling_factor=(1, scale))
+        except (OSError, ValueError):
+            return None
+
+
+def create_decoder(name=None):
+    """
+    Crée le décodeur configuré : "opencv", "turbojpeg", ou "auto"
+    (libjpeg-turbo s'il est installé, sinon OpenCV)
+    """
+    name = name or config.DECODER
+    if name == "auto":
+        name = "turbojpeg" if TurboJPEG is not None else "opencv"
+    if name == "turbojpeg":
+        return TurboJPEGDecoder()
+    if name == "opencv":
+        return OpenCVDecoder()
+    raise ValueError(f"Décodeur d'image inconnu : {name}")
+
+
+_YUV_TO_RGB = {
+    "i420": cv2.COLOR_YUV2RGB_I420,
+    "nv21": cv2.COLOR_YUV2RGB_NV21,
+    "nv12": cv2.COLOR_YUV2RGB_NV12,
+}
+
+
+def yuv_to_rgb(planes, layout, scale=None, buffers=None):
+    """
+    Convertit une image YUV 4:2:0 brute (voir protocol.unpack_yuv) en RGB,
+    directement au format attendu par MediaPipe. La réduction est faite avant
+    la conversion, en sous-échantillonnant les plans Y et chroma : la
+    conversion ne porte que sur les pixels utiles.
+
+    Avec buffers (FrameBuffers), l'image YUV réduite et l'image RGB sont
+    écrites dans des tampons réutilisés au lieu d'être allouées.
+    """
+    width, height = layout.width, layout.height
+    buf = np.frombuffer(planes, np.uint8)
+    y_size = layout.y_stride * height
+    y = buf[:y_size].reshape(height, layout.y_stride)[:, :width]
+    chroma = buf[y_size:]
+
+    if scale is None:
+        scale = choose_scale(width, height)
+    # Les dimensions réduites doivent rester paires (chroma 4:2:0)
+    while scale > 1 and (width // scale % 2 or height // scale % 2):
+        scale //= 2
+    out_w, out_h = width // scale, height // scale
+
+    if buffers is None:
+        buffers = FrameBuffers()
+    # Image YUV réduite et compacte : plan Y puis chroma, (out_h × 3/2, out_w)
+    yuv = buffers.get("yuv", (out_h * 3 // 2, out_w))
+    yuv[:out_h] = y[:out_h * scale:scale, :out_w * scale:scale]
+    chroma_out = yuv[out_h:].reshape(-1)
+    chroma_h = height // 2
+    if layout.layout == "i420":
+        plane_size = layout.uv_stride * chroma_h
+        quarter = (out_h // 2) * (out_w // 2)
+        for i in range(2):
+            plane = chroma[i * plane_size:(i + 1) * plane_size].reshape(chroma_h, layout.uv_stride)
+            chroma_out[i * quarter:(i + 1) * quarter].reshape(out_h // 2, out_w // 2)[:] = \
+                plane[:out_h // 2 * scale:scale, :out_w // 2 * scale:scale]
+    else:
+        # Plan chroma entrelacé (VU ou UV) : sous-échantillonner par paires
+        uv = chroma[:layout.uv_stride * chroma_h].reshape(chroma_h, layout.uv_stride)[:, :width]
+        uv = uv.reshape(chroma_h, width // 2, 2)
+        chroma_out.reshape(out_h // 2, out_w // 2, 2)[:] = \
+            uv[:out_h // 2 * scale:scale, :out_w // 2 * scale:scale]
+    return cv2.cvtColor(
+        yuv, _YUV_TO_RGB[layout.layout],
+        dst=buffers.get("rgb", (out_h, out_w, 3))
+    )
+
+
+_decoder = None
+
+
+def decode_image(data):
+    """
+    Décode l'image reçue, à l'échelle choisie d'après ses dimensions
+    (lues dans l'en-tête) et la taille utile au détecteur
+    """
+    global _decoder
+    if _decoder is None:
+        _decoder = create_decoder()
+    info = image_info(data)
+    scale = 1
+    image_format = None
+    if info is not None:
+        image_format, width, height = info
+        # Seul le JPEG se décode directement à taille réduite
+        if image_format == "jpeg":
+            scale = choose_scale(width, height)
+    return _decoder.decode(data, scale, image_format)
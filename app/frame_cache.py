@@ -0,0 +1,150 @@
+import hashlib
+import time
+from collections import OrderedDict, namedtuple
+import cv2
+import numpy as np
+from . import config
+from . import metrics
+
+# Cache des images en double : une caméra immobile renvoie souvent la même
+# image (ou presque). Une image déjà vue récemment par la connexion reçoit
+# le résultat précédent sans décodage ni MediaPipe.
+#
+# Deux clés par image :
+#   - exacte : empreinte BLAKE2b de la charge utile compressée (quelques µs) ;
+#   - perceptuelle (optionnelle) : dHash 64 bits d'un aperçu en niveaux de gris
+#     (JPEG décodé à 1/8, ou plan Y sous-échantillonné), qui reconnaît aussi
+#     les images presque identiques (bruit du capteur, recompression). Elle
+#     demande un décodage : calculée dans le pool d'inférence (frame_phash),
+#     seulement quand la clé exacte n'est pas dans le cache.
+
+FrameKeys = namedtuple("FrameKeys", ["digest", "phash"])
+
+# Taille de l'aperçu du dHash : 9 × 8 pixels -> 8 × 8 différences horizontales
+_PHASH_SIZE = (9, 8)
+
+
+def _dhash(gray):
+    small = cv2.resize(gray, _PHASH_SIZE, interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def image_phash(data):
+    """
+    dHash d'une image JPEG/PNG, décodée en niveaux de gris à 1/8
+    """
+    gray = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_REDUCED_GRAYSCALE_8)
+    if gray is None:
+        return None
+    return _dhash(gray)
+
+
+def yuv_phash(planes, layout):
+    """
+    dHash d'une image YUV, calculé sur le plan Y sous-échantillonné (sans conversion)
+    """
+    y = np.frombuffer(planes, np.uint8)[:layout.y_stride * layout.height]
+    y = y.reshape(layout.height, layout.y_stride)[:, :layout.width]
+    step = max(1, min(layout.width, layout.height) // 64)
+    return _dhash(np.ascontiguousarray(y[::step, ::step]))
+
+
+def frame_phash(session_id, data, layout=None):
+    """
+    dHash d'une image JPEG/PNG ou YUV, exécuté dans le pool d'inférence
+    (InferenceExecutor.run) : le décodage ne bloque pas la boucle asyncio
+    """
+    return yuv_phash(data, layout) if layout is not None else image_phash(data)
+
+
+def _hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class FrameCache:
+    """
+    Cache LRU, borné en taille et en âge, des signes reconnus sur les
+    dernières images d'une connexion
+    """
+    def __init__(self, max_size=None, ttl_ms=None, perceptual=None, max_distance=None):
+        self.max_size = config.FRAME_CACHE_SIZE if max_size is None else max_size
+        ttl_ms = config.FRAME_CACHE_TTL_MS if ttl_ms is None else ttl_ms
+        self.ttl = ttl_ms / 1000
+        self.perceptual = config.FRAME_CACHE_PERCEPTUAL if perceptual is None else perceptual
+        self.max_distance = config.FRAME_CACHE_PHASH_DISTANCE if max_distance is None else max_distance
+        # clé -> (signe, instant d'insertion), du moins au plus récemment utilisé
+        self._exact = OrderedDict()
+        self._perceptual = OrderedDict()
+
+    def keys(self, data, layout=None):
+        """
+        Clé exacte de l'image (charge utile compressée, ou plans YUV et leur
+        disposition) ; la clé perceptuelle est ajoutée ensuite si besoin
+        (needs_phash, frame_phash)
+        """
+        digest = hashlib.blake2b(data, digest_size=16)
+        if layout is not None:
+            digest.update(repr(tuple(layout)).encode("ascii"))
+        return FrameKeys(digest.digest(), None)
+
+    def needs_phash(self, keys):
+        """
+        Vrai si la recherche perceptuelle est active et que l'image n'est pas
+        déjà dans le cache sous sa clé exacte
+        """
+        return (
+            self.perceptual and keys.phash is None
+            and self._get(self._exact, keys.digest, time.monotonic()) is None
+        )
+
+    def _get(self, entries, key, now):
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        if now - entry[1] > self.ttl:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return entry[0]
+
+    def _find_similar(self, phash, now):
+        for key in list(self._perceptual):
+            if now - self._perceptual[key][1] > self.ttl:
+                del self._perceptual[key]
+            elif _hamming(key, phash) <= self.max_distance:
+                return self._get(self._perceptual, key, now)
+        return None
+
+    def get(self, keys):
+        """
+        Signe déjà reconnu pour cette image, ou None
+        """
+        now = time.monotonic()
+        sign = self._get(self._exact, keys.digest, now)
+        if sign is not None:
+            metrics.FRAME_CACHE.labels("exact_hit").inc()
+            return sign
+        if keys.phash is not None:
+            sign = self._find_similar(keys.phash, now)
+            if sign is not None:
+                metrics.FRAME_CACHE.labels("perceptual_hit").inc()
+                return sign
+        metrics.FRAME_CACHE.labels("miss").inc()
+        return None
+
+    def put(self, keys, sign):
+        now = time.monotonic()
+        self._put(self._exact, keys.digest, sign, now)
+        if keys.phash is not None:
+            self._put(self._perceptual, keys.phash, sign, now)
+
+    def _put(self, entries, key, sign, now):
+        entries[key] = (sign, now)
+        entries.move_to_end(key)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    def clear(self):
+        self._exact.clear()
+        self._perceptual.clear()
@@ -1,11 +1,24 @@
-# Module de détection de la main (placeholder pour extension future) 
+# Module de détection de la main (placeholder pour extension future)
 
+import logging
 import mediapipe as mp
 import cv2
 import numpy as np
+from . import config
+from .buffers import FrameBuffers
+
+logger = logging.getLogger('LSF_Detector')
+
+# Recadrage autour de la main (LSF_HAND_ROI) : taille minimale en pixels,
+# marge intérieure (fraction du côté) que la main ne doit pas franchir avant
+# de recentrer le recadrage, et part maximale de l'image au-delà de laquelle
+# l'image entière est traitée
+ROI_MIN_SIZE = 96
+ROI_INNER_MARGIN = 0.1
+ROI_MAX_AREA = 0.8
 
 class HandDetector:
-    def __init__(self):
+    def __init__(self, annotate=None):
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
@@ -14,36 +27,167 @@ class HandDetector:
             min_tracking_confidence=0.5
         )
         self.mp_draw = mp.solutions.drawing_utils
+        # Mode debug : dessiner les landmarks sur l'image dans detect_hand
+        if annotate is None:
+            annotate = config.DEBUG_ANNOTATE
+        self.annotate = annotate
+        # Destination réutilisée de la conversion BGR -> RGB
+        self.buffers = FrameBuffers()
+        # Recadrage autour de la main trouvée sur l'image précédente
+        self.use_roi = config.HAND_ROI
+        self.roi_scale = config.HAND_ROI_SCALE_PERCENT / 100
+        self.roi = None  # (x0, y0, x1, y1) en pixels, ou None : image entière
+        self.roi_shape = None  # (hauteur, largeur) de l'image du recadrage
 
-    def detect_hand(self, frame):
+    def detect_landmarks(self, frame):
+        """
+        Retourne uniquement les landmarks de la main (ou None),
+        sans jamais modifier l'image
+        """
+        return self._detect(frame, rgb=False)
+
+    def detect_landmarks_rgb(self, image_rgb):
+        """
+        Comme detect_landmarks, pour une image déjà en RGB
+        (par exemple convertie depuis le YUV de la caméra)
+        """
+        return self._detect(image_rgb, rgb=True)
+
+    def _detect(self, image, rgb):
+        roi = self._current_roi(image.shape)
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            try:
+                hand_landmarks = self._process(image[y0:y1, x0:x1], rgb)
+                if hand_landmarks is not None:
+                    self._map_to_frame(hand_landmarks, roi, image.shape)
+                    self._update_roi(hand_landmarks, image.shape)
+                    return hand_landmarks
+            except (cv2.error, ValueError) as error:
+                # Recadrage inutilisable : l'oublier et traiter l'image entière
+                logger.debug(f"Recadrage {roi} inutilisable, image entière traitée : {error}")
+            # Main perdue dans le recadrage : chercher dans l'image entière
+            self.reset_roi()
+        hand_landmarks = self._process(image, rgb)
+        if hand_landmarks is not None and self.use_roi:
+            self._update_roi(hand_landmarks, image.shape)
+        return hand_landmarks
+
+    def _current_roi(self, shape):
         """
-        Détecte la main dans l'image et retourne l'image avec les landmarks
+        Recadrage à utiliser pour cette image, ou None : il est oublié quand
+        la résolution ou l'orientation de l'image change
         """
-        # Convertir l'image en RGB
-        image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
+        if self.roi is not None and self.roi_shape != shape[:2]:
+            self.reset_roi()
+        return self.roi
+
+    def _process(self, image, rgb):
+        if rgb:
+            # MediaPipe attend une image contiguë (un recadrage est une vue)
+            image_rgb = image
+            if not image.flags.c_contiguous:
+                image_rgb = self.buffers.get("roi", image.shape)
+                np.copyto(image_rgb, image)
+        else:
+            # Convertir l'image en RGB, dans le tampon réutilisé
+            image_rgb = cv2.cvtColor(
+                image, cv2.COLOR_BGR2RGB,
+                dst=self.buffers.get("rgb", image.shape)
+            )
+
         # Détecter les mains
         results = self.hands.process(image_rgb)
-        
+
         if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                # Dessiner les landmarks
-                self.mp_draw.draw_landmarks(
-                    frame, 
-                    hand_landmarks, 
-                    self.mp_hands.HAND_CONNECTIONS
-                )
-                return frame, hand_landmarks
-        
-        return frame, None
+            return results.multi_hand_landmarks[0]
+        return None
+
+    def _map_to_frame(self, hand_landmarks, roi, shape):
+        """
+        Ramène les landmarks du recadrage roi en coordonnées normalisées de l'image
+        entière : les prédicats de LSFRecognizer (ex. wrist.y < 0.3) restent valables
+        """
+        height, width = shape[:2]
+        x0, y0, x1, y1 = roi
+        crop_width, crop_height = x1 - x0, y1 - y0
+        for landmark in hand_landmarks.landmark:
+            landmark.x = (x0 + landmark.x * crop_width) / width
+            landmark.y = (y0 + landmark.y * crop_height) / height
+            # z est à l'échelle de la largeur de l'image, comme x
+            landmark.z = landmark.z * crop_width / width
+
+    def _update_roi(self, hand_landmarks, shape):
+        """
+        Recadrage carré autour de la main (boîte englobante agrandie de
+        roi_scale), déplacé seulement quand la main approche de son bord :
+        un recadrage stable garde le suivi de MediaPipe cohérent d'une image à l'autre
+        """
+        height, width = shape[:2]
+        xs = [landmark.x * width for landmark in hand_landmarks.landmark]
+        ys = [landmark.y * height for landmark in hand_landmarks.landmark]
+        left, right, top, bottom = min(xs), max(xs), min(ys), max(ys)
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            inner_x = (x1 - x0) * ROI_INNER_MARGIN
+            inner_y = (y1 - y0) * ROI_INNER_MARGIN
+            if (
+                left >= x0 + inner_x and right <= x1 - inner_x
+                and top >= y0 + inner_y and bottom <= y1 - inner_y
+            ):
+                return
+        side = max(right - left, bottom - top) * self.roi_scale
+        side = max(side, ROI_MIN_SIZE)
+        center_x, center_y = (left + right) / 2, (top + bottom) / 2
+        # Boîte bornée à l'image (les landmarks peuvent en sortir)
+        x0 = min(max(0, int(center_x - side / 2)), width)
+        y0 = min(max(0, int(center_y - side / 2)), height)
+        x1 = min(max(0, int(center_x + side / 2) + 1), width)
+        y1 = min(max(0, int(center_y + side / 2) + 1), height)
+        if x1 - x0 < ROI_MIN_SIZE // 2 or y1 - y0 < ROI_MIN_SIZE // 2:
+            # Main au bord de l'image : le recadrage serait vide ou trop petit
+            self.reset_roi()
+        elif (x1 - x0) * (y1 - y0) >= width * height * ROI_MAX_AREA:
+            # Le recadrage couvrirait presque toute l'image : inutile
+            self.reset_roi()
+        else:
+            self.roi = (x0, y0, x1, y1)
+            self.roi_shape = tuple(shape[:2])
+
+    def reset_roi(self):
+        self.roi = None
+        self.roi_shape = None
+
+    def detect_hand(self, frame):
+        """
+        Détecte la main dans l'image et retourne l'image avec les landmarks.
+        Les landmarks ne sont dessinés qu'en mode annotation (debug).
+        """
+        hand_landmarks = self.detect_landmarks(frame)
+        if hand_landmarks is not None and self.annotate:
+            self.draw_landmarks(frame, hand_landmarks)
+        return frame, hand_landmarks
+
+    def draw_landmarks(self, frame, hand_landmarks):
+        """
+        Dessine les landmarks et les connexions de la main sur l'image
+        """
+        self.mp_draw.draw_landmarks(
+            frame,
+            hand_landmarks,
+            self.mp_hands.HAND_CONNECTIONS
+        )
+        return frame
 
     def get_hand_landmarks(self, frame):
         """
         Retourne uniquement les landmarks de la main
         """
-        image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(image_rgb)
-        
-        if results.multi_hand_landmarks:
-            return results.multi_hand_landmarks[0]
-        return None 
\ No newline at end of file
+        return self.detect_landmarks(frame)
+
+    def close(self):
+        """
+        Libère le graphe MediaPipe et les tampons
+        """
+        self.hands.close()
+        self.buffers.clear()
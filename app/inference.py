@@ -0,0 +1,226 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from . import config
+from .decoder import decode_image, yuv_to_rgb
+from .logging_config import setup_logging
+from .session import open_session, close_session, get_session, use_session
+
+
+def process_image(session_id, image_data):
+    """
+    Décode l'image reçue et reconnaît le signe LSF dans la session du client
+    (exécuté dans le pool). Retourne (signe, durées par étape).
+    """
+    start = time.perf_counter()
+    frame = decode_image(image_data)
+    if frame is None:
+        raise ValueError("Impossible de décoder l'image envoyée.")
+    decode_time = time.perf_counter() - start
+    with use_session(session_id) as session:
+        sign = session.recognize(frame)
+        return sign, dict(session.recognizer.timings, imdecode=decode_time)
+
+
+def process_yuv(session_id, planes, layout):
+    """
+    Convertit l'image YUV brute de la caméra en RGB (réduite à la taille utile)
+    et reconnaît le signe, sans compression ni décodage JPEG.
+    Retourne (signe, durées par étape).
+    """
+    with use_session(session_id) as session:
+        start = time.perf_counter()
+        image_rgb = yuv_to_rgb(planes, layout, buffers=session.buffers)
+        convert_time = time.perf_counter() - start
+        sign = session.recognize_rgb(image_rgb)
+        return sign, dict(session.recognizer.timings, yuv_convert=convert_time)
+
+
+def process_stream(session_id, chunk, codec, latest_only=False):
+    """
+    Décode un morceau de flux vidéo avec le décodeur de la session et reconnaît
+    le signe sur chaque image complète (ou seulement sur la plus récente si
+    latest_only). Retourne (signe de la dernière image ou None, durées par étape).
+    """
+    with use_session(session_id) as session:
+        start = time.perf_counter()
+        frames = session.feed_stream(codec, chunk)
+        decode_time = time.perf_counter() - start
+        if not frames:
+            return None, {"stream_decode": decode_time}
+        if latest_only:
+            frames = frames[-1:]
+        # Images RGB pour H.264 (PyAV), BGR pour MJPEG (OpenCV)
+        rgb = codec == "h264"
+        for frame in frames:
+            sign = session.recognizer.recognize_sign(frame, rgb=rgb)
+        return sign, dict(session.recognizer.timings, stream_decode=decode_time)
+
+
+def process_stream_end(session_id):
+    """
+    Ferme le décodeur du flux vidéo de la session
+    """
+    with use_session(session_id) as session:
+        session.close_stream()
+
+
+def process_landmarks(session_id, points):
+    """
+    Reconnaît le signe à partir des landmarks envoyés par le client,
+    sans décodage d'image ni MediaPipe. Retourne (signe, durées par étape).
+    """
+    with use_session(session_id) as session:
+        sign = session.recognize_landmarks(points)
+        return sign, dict(session.recognizer.timings)
+
+
+def process_image_batch(items):
+    """
+    Traite un lot d'images de plusieurs sessions dans un worker du pool
+    (InferenceExecutor.run_batch répartit le lot entre les workers). Retourne, pour chaque image et dans l'ordre, (True, résultat) ou (False, exception).
+    """
+    results = []
+    for session_id, args in items:
+        try:
+            results.append((True, process_image(session_id, *args)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+class InferenceQueueFull(RuntimeError):
+    """
+    Levée quand la file d'attente de l'exécuteur d'inférence est pleine
+    """
+    def __init__(self, queue_depth):
+        super().__init__(f"Serveur surchargé : {queue_depth} images en attente")
+        self.queue_depth = queue_depth
+
+
+class InferenceExecutor:
+    """
+    Exécute la reconnaissance hors de la boucle asyncio, dans un pool
+    de threads ou de processus, avec une file d'attente bornée.
+
+    En mode process, chaque session est rattachée à un processus unique
+    pour toute sa durée de vie, afin que son état de suivi reste local.
+    """
+    def __init__(self, mode=None, max_workers=None, max_queue=None):
+        self.mode = mode or config.INFERENCE_MODE
+        self.max_workers = max_workers or config.INFERENCE_WORKERS
+        self.max_queue = max_queue or config.INFERENCE_QUEUE_SIZE
+        if self.mode == "thread":
+            self._pools = [ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="lsf-inference"
+            )]
+        elif self.mode == "process":
+            # Chaque processus du pool a son propre thread d'écriture des logs
+            # (celui du parent n'existe pas dans le processus fils)
+            self._pools = [
+                ProcessPoolExecutor(max_workers=1, initializer=setup_logging)
+                for _ in range(self.max_workers)
+            ]
+        else:
+            raise ValueError(f"Mode d'inférence inconnu : {self.mode}")
+        self._pending = 0
+
+    @property
+    def queue_depth(self):
+        """
+        Nombre d'images en attente ou en cours de traitement
+        """
+        return self._pending
+
+    def lane_for(self, session_id):
+        """
+        Index du pool qui traite la session (toujours 0 en mode thread)
+        """
+        return session_id % len(self._pools)
+
+    def _prepare_args(self, args):
+        if self.mode == "process":
+            # Les memoryview ne sont pas sérialisables vers un autre processus
+            return tuple(bytes(arg) if isinstance(arg, memoryview) else arg for arg in args)
+        return args
+
+    async def _submit(self, lane, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pools[lane], func, *args)
+
+    def acquire(self):
+        """
+        Réserve une place dans la file d'attente, ou lève InferenceQueueFull
+        """
+        if self._pending >= self.max_queue:
+            raise InferenceQueueFull(self._pending)
+        self._pending += 1
+
+    def release(self, count=1):
+        self._pending -= count
+
+    async def open_session(self, session_id):
+        await self._submit(self.lane_for(session_id), open_session, session_id)
+
+    async def close_session(self, session_id):
+        await self._submit(self.lane_for(session_id), close_session, session_id)
+
+    async def run(self, session_id, func, *args):
+        """
+        Exécute func(session_id, *args) dans le pool et attend son résultat
+        """
+        self.acquire()
+        try:
+            return await self._submit(
+                self.lane_for(session_id), func, session_id, *self._prepare_args(args)
+            )
+        finally:
+            self.release()
+
+    async def run_inline(self, session_id, func, *args):
+        """
+        Exécute une tâche de quelques microsecondes (ex. process_landmarks)
+        directement sur la boucle asyncio en mode thread, où les sessions
+        vivent dans ce processus ; en mode process, passe par le pool de la session.
+        Si un thread du pool tient la session (image en cours), la tâche passe
+        aussi par le pool plutôt que de bloquer la boucle en attendant le verrou.
+        """
+        if self.mode == "thread":
+            lock = get_session(session_id).lock
+            if lock.acquire(blocking=False):
+                try:
+                    return func(session_id, *args)
+                finally:
+                    lock.release()
+        return await self.run(session_id, func, *args)
+
+    async def run_batch(self, lane, func, items):
+        """
+        Exécute func sur un lot d'images de plusieurs sessions (items : liste
+        de (session_id, args)) dans le pool lane. Le lot est réparti entre les
+        workers du pool (un seul par pool en mode process) en parts de tailles
+        voisines ; les images d'une même session restent dans la même part,
+        dans l'ordre. Retourne les résultats de func dans l'ordre de items. Les
+        places dans la file sont réservées et libérées par l'appelant (voir batching.py).
+        """
+        groups = {}
+        for position, (session_id, args) in enumerate(items):
+            groups.setdefault(session_id, []).append((position, (session_id, self._prepare_args(args))))
+        workers = self.max_workers if self.mode == "thread" else 1
+        parts = [[] for _ in range(min(workers, len(groups)))]
+        # Sessions les plus chargées d'abord, chacune dans la part la moins chargée
+        for group in sorted(groups.values(), key=len, reverse=True):
+            min(parts, key=len).extend(group)
+        part_results = await asyncio.gather(*(
+            self._submit(lane, func, [item for _, item in part]) for part in parts
+        ))
+        results = [None] * len(items)
+        for part, values in zip(parts, part_results):
+            for (position, _), value in zip(part, values):
+                results[position] = value
+        return results
+
+    def shutdown(self, wait=True):
+        for pool in self._pools:
+            pool.shutdown(wait=wait)
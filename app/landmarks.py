@@ -0,0 +1,2 @@
+# Nombre de landmarks d'une main (modèle MediaPipe Hands)
+NUM_LANDMARKS = 21
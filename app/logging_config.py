@@ -0,0 +1,72 @@
+import atexit
+import itertools
+import logging
+import logging.handlers
+import queue
+from . import config
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener = None
+
+
+def setup_logging():
+    """
+    Configure la journalisation : les handlers de la racine sont remplacés par
+    un QueueHandler, et l'écriture (formatage + I/O) se fait dans un thread
+    dédié (QueueListener), hors de la boucle asyncio.
+
+    À rappeler dans chaque processus créé par fork : le thread d'écriture
+    du parent n'existe pas dans le processus fils.
+    """
+    global _listener
+    stop_logging()
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(config.LOG_LEVEL)
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """
+    Vide la file de journalisation et arrête le thread d'écriture
+    """
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        try:
+            listener.stop()
+        except (RuntimeError, AttributeError):
+            # Listener hérité d'un fork : son thread n'existe pas dans ce processus
+            pass
+
+
+atexit.register(stop_logging)
+
+
+def format_fields(**fields):
+    """
+    Formate des champs structurés : "cle=valeur cle2=valeur2"
+    """
+    return " ".join(f"{key}={value}" for key, value in fields.items())
+
+
+class LogSampler:
+    """
+    Échantillonnage des messages du chemin critique : seul un appel sur
+    `every` est journalisé (every <= 0 désactive ces messages)
+    """
+    def __init__(self, every):
+        self.every = every
+        self._counter = itertools.count()
+
+    def should_log(self):
+        if self.every <= 0:
+            return False
+        return next(self._counter) % self.every == 0
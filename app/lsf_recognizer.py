@@ -1,79 +1,105 @@
+import time
 import cv2
 import numpy as np
+from . import config
 from .hand_detector import HandDetector
+from .motion import MotionGate
+from .pose import HandPose, FINGER_PIPS, FINGER_TIPS
+from .sign_rules import DEFAULT_PATH, load_definitions, predicates, shared_rules
+
+# Réponses qui ne sont ni un signe connu ni une phrase
+NO_HAND = "Pas de main détectée"
+UNKNOWN_SIGN = "Signe non reconnu"
+
+# Bout et articulation de chaque doigt pour la forme de la main (doigt tendu :
+# bout au-dessus de l'articulation), du pouce à l'auriculaire
+HANDSHAPE_FINGERS = ((4, 3),) + tuple(zip(FINGER_TIPS, FINGER_PIPS))
 
 class LSFRecognizer:
     def __init__(self):
-        self.hand_detector = HandDetector()
+        # Détecteur créé à la première image : une session qui n'envoie
+        # que des landmarks n'instancie jamais MediaPipe
+        self._hand_detector = None
+        # Inférence conditionnée au mouvement (LSF_MOTION_GATE)
+        self.motion_gate = MotionGate() if config.MOTION_GATE else None
+        self.last_result = None  # Dernier signe reconnu sur une image
+        self.last_landmarks = None  # Landmarks de la main sur la dernière image traitée
         self.last_signs = []  # Pour stocker l'historique des signes
         self.max_history = 5  # Nombre maximum de signes à mémoriser
-        # Dictionnaire des signes connus
-        self.known_signs = {
-            "bonjour": self._is_bonjour,
-            "merci": self._is_merci,
-            "oui": self._is_oui,
-            "non": self._is_non,
-            "au_revoir": self._is_au_revoir,
-            "poing_ferme": self._is_poing_ferme,
-            "s_il_vous_plait": self._is_s_il_vous_plait,
-            "je_t_aime": self._is_je_t_aime,
-            "bien": self._is_bien,
-            "manger": self._is_manger,
-            "aide": self._is_aide,
-            "attendre": self._is_attendre,
-            "comprendre": self._is_comprendre,
-            "faim": self._is_faim,
-            "fatigue": self._is_fatigue,
-            "dormir": self._is_dormir,
-            "boire": self._is_boire,
-            "froid": self._is_froid,
-            "chaud": self._is_chaud,
-            "pardon": self._is_pardon,
-            "aujourd_hui": self._is_aujourd_hui,
-            "demain": self._is_demain,
-            "bonne_nuit": self._is_bonne_nuit,
-            "sante": self._is_sante,
-            "amitie": self._is_amitie,
-            "famille": self._is_famille,
-            "ecole": self._is_ecole,
-            "un": self._is_un,
-            "deux": self._is_deux,
-            "trois": self._is_trois,
-            "quatre": self._is_quatre,
-            "cinq": self._is_cinq,
-            "soleil": self._is_soleil,
-            "lune": self._is_lune,
-            "etoile": self._is_etoile,
-            "pluie": self._is_pluie,
-            "neige": self._is_neige,
-            "vent": self._is_vent,
-            "feu": self._is_feu,
-            "eau": self._is_eau,
-            "terre": self._is_terre,
-            "ciel": self._is_ciel,
-            "rock_and_roll": self._is_rock_and_roll,  # Nouveau signe
-            "telephone": self._is_telephone,  # Nouveau signe
-        }
+        self.timings = {}  # Durée (s) de chaque étape de la dernière reconnaissance
+        # Reconnaissance : définitions du fichier de règles (arbre de décision
+        # ou matrice, partagés par les sessions du processus), ou prédicats
+        # _is_* appelés un par un (LSF_SIGN_MATCHER=predicates)
+        self.sign_rules = None
+        self.known_signs = {}
+        if config.SIGN_MATCHER == "predicates":
+            # Signes connus : prédicats des signes activés du fichier de règles,
+            # dans son ordre de priorité
+            definitions = load_definitions(config.SIGN_RULES_PATH or DEFAULT_PATH)
+            self.known_signs = predicates(self, definitions)
+        else:
+            self.sign_rules = shared_rules(config.SIGN_MATCHER)
+
+    @property
+    def hand_detector(self):
+        if self._hand_detector is None:
+            self._hand_detector = HandDetector()
+        return self._hand_detector
+
+    def recognize_sign(self, frame, rgb=False):
+        """
+        Reconnaît le signe LSF dans l'image (BGR, ou RGB si rgb=True)
+        """
+        motion_time = None
+        if self.motion_gate is not None:
+            start = time.perf_counter()
+            changed = self.motion_gate.changed(frame, rgb)
+            motion_time = time.perf_counter() - start
+            if not changed and self.last_result is not None:
+                # Scène inchangée : réutiliser le résultat précédent
+                self.timings = {"motion_skip": motion_time}
+                return self.last_result
 
-    def recognize_sign(self, frame):
-        """
-        Reconnaît le signe LSF dans l'image
-        """
         # Détecter la main
-        frame_with_landmarks, landmarks = self.hand_detector.detect_hand(frame)
+        start = time.perf_counter()
+        if rgb:
+            landmarks = self.hand_detector.detect_landmarks_rgb(frame)
+        else:
+            landmarks = self.hand_detector.detect_landmarks(frame)
+        detect_time = time.perf_counter() - start
         
         if landmarks is None:
-            return "Pas de main détectée"
-
-        # Vérifier chaque signe connu
-        detected_sign = None
-        for sign_name, check_function in self.known_signs.items():
-            if check_function(landmarks):
-                detected_sign = sign_name
-                break
+            self.timings = {"detect_hand": detect_time}
+            sign = NO_HAND
+        else:
+            sign = self.recognize_landmarks(landmarks)
+            self.timings["detect_hand"] = detect_time
+        if motion_time is not None:
+            self.timings["motion_check"] = motion_time
+        self.last_landmarks = landmarks
+        self.last_result = sign
+        return sign
+
+    def recognize_landmarks(self, landmarks):
+        """
+        Reconnaît le signe LSF à partir des landmarks de la main,
+        détectés sur le serveur ou envoyés directement par le client
+        """
+        # Vérifier chaque signe connu, sur la pose calculée une seule fois
+        start = time.perf_counter()
+        pose = HandPose.from_landmarks(landmarks)
+        if self.sign_rules is not None:
+            detected_sign = self.sign_rules.current().match(pose)
+        else:
+            detected_sign = None
+            for sign_name, check_function in self.known_signs.items():
+                if check_function(pose):
+                    detected_sign = sign_name
+                    break
+        scan_time = time.perf_counter() - start
 
         if detected_sign is None:
-            detected_sign = "Signe non reconnu"
+            detected_sign = UNKNOWN_SIGN
 
         # Mettre à jour l'historique des signes
         self.last_signs.append(detected_sign)
@@ -81,12 +107,159 @@ class LSFRecognizer:
             self.last_signs.pop(0)
 
         # Vérifier les phrases
+        start = time.perf_counter()
         phrase = self._check_phrases()
+        self.timings = {
+            "known_signs": scan_time,
+            "check_phrases": time.perf_counter() - start
+        }
         if phrase:
             return phrase
 
         return detected_sign
 
+    def sign_names(self):
+        """
+        Signes que la reconnaissance peut retourner, dans l'ordre de priorité
+        """
+        if self.sign_rules is not None:
+            return list(self.sign_rules.current().signs)
+        return list(self.known_signs)
+
+    def reset(self):
+        """
+        Vide l'historique des signes
+        """
+        self.last_signs = []
+        self.last_result = None
+        self.last_landmarks = None
+        if self._hand_detector is not None:
+            self._hand_detector.reset_roi()
+        if self.motion_gate is not None:
+            self.motion_gate.reset()
+
+    def close(self):
+        """
+        Libère les ressources du détecteur de main
+        """
+        if self._hand_detector is not None:
+            self._hand_detector.close()
+            self._hand_detector = None
+
+    # Phrases courantes : phrase -> suite de signes (la première trouvée l'emporte)
+    PHRASES = {
+        "bonjour comment ca vas": ["bonjour", "comment", "ca", "vas"],
+        "bonjour comment allez vous": ["bonjour", "comment", "allez", "vous"],
+        "je m appelle": ["je", "m", "appelle"],
+        "enchanté de vous rencontrer": ["enchanté", "de", "vous", "rencontrer"],
+        "au revoir à bientôt": ["au_revoir", "à", "bientôt"],
+        "merci beaucoup": ["merci", "beaucoup"],
+        "s il vous plait": ["s_il_vous_plait"],
+        "je t aime": ["je_t_aime"],
+        "bonne nuit": ["bonne_nuit"],
+        "bonne journée": ["bonne", "journée"],
+        "à tout à l heure": ["à", "tout", "à", "l", "heure"],
+        "je ne comprends pas": ["je", "ne", "comprends", "pas"],
+        "pouvez vous répéter": ["pouvez", "vous", "répéter"],
+        "je suis fatigué": ["je", "suis", "fatigue"],
+        "je suis malade": ["je", "suis", "malade"],
+        "je suis heureux": ["je", "suis", "heureux"],
+        "je suis triste": ["je", "suis", "triste"],
+        "je suis en colère": ["je", "suis", "en", "colere"],
+        "je suis surpris": ["je", "suis", "surpris"],
+        "je suis désolé": ["je", "suis", "desole"],
+        "je suis perdu": ["je", "suis", "perdu"],
+        "je suis pressé": ["je", "suis", "presse"],
+        "je suis en retard": ["je", "suis", "en", "retard"],
+        "je suis à l heure": ["je", "suis", "à", "l", "heure"],
+        "je suis occupé": ["je", "suis", "occupe"],
+        "je suis libre": ["je", "suis", "libre"],
+        "je suis prêt": ["je", "suis", "pret"],
+        "je suis là": ["je", "suis", "la"],
+        "je suis parti": ["je", "suis", "parti"],
+        "je suis revenu": ["je", "suis", "revenu"],
+        "je suis arrivé": ["je", "suis", "arrive"],
+        "je suis en train de": ["je", "suis", "en", "train", "de"],
+        "je suis en train de manger": ["je", "suis", "en", "train", "de", "manger"],
+        "je suis en train de boire": ["je", "suis", "en", "train", "de", "boire"],
+        "je suis en train de dormir": ["je", "suis", "en", "train", "de", "dormir"],
+        "je suis en train de travailler": ["je", "suis", "en", "train", "de", "travailler"],
+        "je suis en train d apprendre": ["je", "suis", "en", "train", "d", "apprendre"],
+        "je suis en train de comprendre": ["je", "suis", "en", "train", "de", "comprendre"],
+        "je suis en train de réfléchir": ["je", "suis", "en", "train", "de", "réfléchir"],
+        "je suis en train de parler": ["je", "suis", "en", "train", "de", "parler"],
+        "je suis en train d écouter": ["je", "suis", "en", "train", "d", "écouter"],
+        "je suis en train de regarder": ["je", "suis", "en", "train", "de", "regarder"],
+        "je suis en train de chercher": ["je", "suis", "en", "train", "de", "chercher"],
+        "je suis en train de trouver": ["je", "suis", "en", "train", "de", "trouver"],
+        "je suis en train de perdre": ["je", "suis", "en", "train", "de", "perdre"],
+        "je suis en train de gagner": ["je", "suis", "en", "train", "de", "gagner"],
+        "je suis en train de jouer": ["je", "suis", "en", "train", "de", "jouer"],
+        "je suis en train de gagner": ["je", "suis", "en", "train", "de", "gagner"],
+        "je suis en train de perdre": ["je", "suis", "en", "train", "de", "perdre"],
+        "je suis en train de gagner": ["je", "suis", "en", "train", "de", "gagner"],
+        "je suis en train de perdre": ["je", "suis", "en", "train", "de", "perdre"],
+        "je vais à l école": ["je", "vais", "à", "l", "ecole"],
+        "je vais au travail": ["je", "vais", "au", "travail"],
+        "je vais à la maison": ["je", "vais", "à", "la", "maison"],
+        "je vais au magasin": ["je", "vais", "au", "magasin"],
+        "je vais au restaurant": ["je", "vais", "au", "restaurant"],
+        "je vais au cinéma": ["je", "vais", "au", "cinema"],
+        "je vais au parc": ["je", "vais", "au", "parc"],
+        "je vais à la plage": ["je", "vais", "à", "la", "plage"],
+        "je vais à la montagne": ["je", "vais", "à", "la", "montagne"],
+        "je vais à la campagne": ["je", "vais", "à", "la", "campagne"],
+        "je vais à la ville": ["je", "vais", "à", "la", "ville"],
+        "je vais à la gare": ["je", "vais", "à", "la", "gare"],
+        "je vais à l aéroport": ["je", "vais", "à", "l", "aeroport"],
+        "je vais à l hôpital": ["je", "vais", "à", "l", "hopital"],
+        "je vais au docteur": ["je", "vais", "au", "docteur"],
+        "je vais à la pharmacie": ["je", "vais", "à", "la", "pharmacie"],
+        "je vais à la banque": ["je", "vais", "à", "la", "banque"],
+        "je vais à la poste": ["je", "vais", "à", "la", "poste"],
+        "je vais à la bibliothèque": ["je", "vais", "à", "la", "bibliotheque"],
+        "je vais au musée": ["je", "vais", "au", "musee"],
+        "je vais au théâtre": ["je", "vais", "au", "theatre"],
+        "je vais au concert": ["je", "vais", "au", "concert"],
+        "je vais au stade": ["je", "vais", "au", "stade"],
+        "je vais à la piscine": ["je", "vais", "à", "la", "piscine"],
+        "je vais au gymnase": ["je", "vais", "au", "gymnase"],
+        "je vais à la salle de sport": ["je", "vais", "à", "la", "salle", "de", "sport"],
+        "je vais à la salle de bain": ["je", "vais", "à", "la", "salle", "de", "bain"],
+        "je vais à la cuisine": ["je", "vais", "à", "la", "cuisine"],
+        "je vais au salon": ["je", "vais", "au", "salon"],
+        "je vais à la chambre": ["je", "vais", "à", "la", "chambre"],
+        "je vais au jardin": ["je", "vais", "au", "jardin"],
+        "je vais au garage": ["je", "vais", "au", "garage"],
+        "je vais au sous-sol": ["je", "vais", "au", "sous-sol"],
+        "je vais au grenier": ["je", "vais", "au", "grenier"],
+        "je vais au balcon": ["je", "vais", "au", "balcon"],
+        "je vais à la terrasse": ["je", "vais", "à", "la", "terrasse"],
+        "je vais à la cave": ["je", "vais", "à", "la", "cave"],
+        "je vais à l ascenseur": ["je", "vais", "à", "l", "ascenseur"],
+        "je vais à l escalier": ["je", "vais", "à", "l", "escalier"],
+        "je vais à la porte": ["je", "vais", "à", "la", "porte"],
+        "je vais à la fenêtre": ["je", "vais", "à", "la", "fenetre"],
+        "je vais au toit": ["je", "vais", "au", "toit"],
+        "je vais au mur": ["je", "vais", "au", "mur"],
+        "je vais au plafond": ["je", "vais", "au", "plafond"],
+        "je vais au sol": ["je", "vais", "au", "sol"],
+        "je vais au coin": ["je", "vais", "au", "coin"],
+        "je vais au centre": ["je", "vais", "au", "centre"],
+        "je vais à côté": ["je", "vais", "à", "côté"],
+        "je vais devant": ["je", "vais", "devant"],
+        "je vais derrière": ["je", "vais", "derrière"],
+        "je vais à gauche": ["je", "vais", "à", "gauche"],
+        "je vais à droite": ["je", "vais", "à", "droite"],
+        "je vais en haut": ["je", "vais", "en", "haut"],
+        "je vais en bas": ["je", "vais", "en", "bas"],
+        "je vais au milieu": ["je", "vais", "au", "milieu"],
+        "je vais au début": ["je", "vais", "au", "début"],
+        "je vais à la fin": ["je", "vais", "à", "la", "fin"],
+        "je vais au début": ["je", "vais", "au", "début"],
+        "je vais à la fin": ["je", "vais", "à", "la", "fin"]
+    }
+
     def _check_phrases(self):
         """
         Vérifie si la séquence de signes forme une phrase connue
@@ -94,122 +267,8 @@ class LSFRecognizer:
         # Convertir la séquence en chaîne pour faciliter la recherche
         sequence = " ".join(self.last_signs)
         
-        # Phrases courantes
-        phrases = {
-            "bonjour comment ca vas": ["bonjour", "comment", "ca", "vas"],
-            "bonjour comment allez vous": ["bonjour", "comment", "allez", "vous"],
-            "je m appelle": ["je", "m", "appelle"],
-            "enchanté de vous rencontrer": ["enchanté", "de", "vous", "rencontrer"],
-            "au revoir à bientôt": ["au_revoir", "à", "bientôt"],
-            "merci beaucoup": ["merci", "beaucoup"],
-            "s il vous plait": ["s_il_vous_plait"],
-            "je t aime": ["je_t_aime"],
-            "bonne nuit": ["bonne_nuit"],
-            "bonne journée": ["bonne", "journée"],
-            "à tout à l heure": ["à", "tout", "à", "l", "heure"],
-            "je ne comprends pas": ["je", "ne", "comprends", "pas"],
-            "pouvez vous répéter": ["pouvez", "vous", "répéter"],
-            "je suis fatigué": ["je", "suis", "fatigue"],
-            "je suis malade": ["je", "suis", "malade"],
-            "je suis heureux": ["je", "suis", "heureux"],
-            "je suis triste": ["je", "suis", "triste"],
-            "je suis en colère": ["je", "suis", "en", "colere"],
-            "je suis surpris": ["je", "suis", "surpris"],
-            "je suis désolé": ["je", "suis", "desole"],
-            "je suis perdu": ["je", "suis", "perdu"],
-            "je suis pressé": ["je", "suis", "presse"],
-            "je suis en retard": ["je", "suis", "en", "retard"],
-            "je suis à l heure": ["je", "suis", "à", "l", "heure"],
-            "je suis occupé": ["je", "suis", "occupe"],
-            "je suis libre": ["je", "suis", "libre"],
-            "je suis prêt": ["je", "suis", "pret"],
-            "je suis là": ["je", "suis", "la"],
-            "je suis parti": ["je", "suis", "parti"],
-            "je suis revenu": ["je", "suis", "revenu"],
-            "je suis arrivé": ["je", "suis", "arrive"],
-            "je suis en train de": ["je", "suis", "en", "train", "de"],
-            "je suis en train de manger": ["je", "suis", "en", "train", "de", "manger"],
-            "je suis en train de boire": ["je", "suis", "en", "train", "de", "boire"],
-            "je suis en train de dormir": ["je", "suis", "en", "train", "de", "dormir"],
-            "je suis en train de travailler": ["je", "suis", "en", "train", "de", "travailler"],
-            "je suis en train d apprendre": ["je", "suis", "en", "train", "d", "apprendre"],
-            "je suis en train de comprendre": ["je", "suis", "en", "train", "de", "comprendre"],
-            "je suis en train de réfléchir": ["je", "suis", "en", "train", "de", "réfléchir"],
-            "je suis en train de parler": ["je", "suis", "en", "train", "de", "parler"],
-            "je suis en train d écouter": ["je", "suis", "en", "train", "d", "écouter"],
-            "je suis en train de regarder": ["je", "suis", "en", "train", "de", "regarder"],
-            "je suis en train de chercher": ["je", "suis", "en", "train", "de", "chercher"],
-            "je suis en train de trouver": ["je", "suis", "en", "train", "de", "trouver"],
-            "je suis en train de perdre": ["je", "suis", "en", "train", "de", "perdre"],
-            "je suis en train de gagner": ["je", "suis", "en", "train", "de", "gagner"],
-            "je suis en train de jouer": ["je", "suis", "en", "train", "de", "jouer"],
-            "je suis en train de gagner": ["je", "suis", "en", "train", "de", "gagner"],
-            "je suis en train de perdre": ["je", "suis", "en", "train", "de", "perdre"],
-            "je suis en train de gagner": ["je", "suis", "en", "train", "de", "gagner"],
-            "je suis en train de perdre": ["je", "suis", "en", "train", "de", "perdre"],
-            "je vais à l école": ["je", "vais", "à", "l", "ecole"],
-            "je vais au travail": ["je", "vais", "au", "travail"],
-            "je vais à la maison": ["je", "vais", "à", "la", "maison"],
-            "je vais au magasin": ["je", "vais", "au", "magasin"],
-            "je vais au restaurant": ["je", "vais", "au", "restaurant"],
-            "je vais au cinéma": ["je", "vais", "au", "cinema"],
-            "je vais au parc": ["je", "vais", "au", "parc"],
-            "je vais à la plage": ["je", "vais", "à", "la", "plage"],
-            "je vais à la montagne": ["je", "vais", "à", "la", "montagne"],
-            "je vais à la campagne": ["je", "vais", "à", "la", "campagne"],
-            "je vais à la ville": ["je", "vais", "à", "la", "ville"],
-            "je vais à la gare": ["je", "vais", "à", "la", "gare"],
-            "je vais à l aéroport": ["je", "vais", "à", "l", "aeroport"],
-            "je vais à l hôpital": ["je", "vais", "à", "l", "hopital"],
-            "je vais au docteur": ["je", "vais", "au", "docteur"],
-            "je vais à la pharmacie": ["je", "vais", "à", "la", "pharmacie"],
-            "je vais à la banque": ["je", "vais", "à", "la", "banque"],
-            "je vais à la poste": ["je", "vais", "à", "la", "poste"],
-            "je vais à la bibliothèque": ["je", "vais", "à", "la", "bibliotheque"],
-            "je vais au musée": ["je", "vais", "au", "musee"],
-            "je vais au théâtre": ["je", "vais", "au", "theatre"],
-            "je vais au concert": ["je", "vais", "au", "concert"],
-            "je vais au stade": ["je", "vais", "au", "stade"],
-            "je vais à la piscine": ["je", "vais", "à", "la", "piscine"],
-            "je vais au gymnase": ["je", "vais", "au", "gymnase"],
-            "je vais à la salle de sport": ["je", "vais", "à", "la", "salle", "de", "sport"],
-            "je vais à la salle de bain": ["je", "vais", "à", "la", "salle", "de", "bain"],
-            "je vais à la cuisine": ["je", "vais", "à", "la", "cuisine"],
-            "je vais au salon": ["je", "vais", "au", "salon"],
-            "je vais à la chambre": ["je", "vais", "à", "la", "chambre"],
-            "je vais au jardin": ["je", "vais", "au", "jardin"],
-            "je vais au garage": ["je", "vais", "au", "garage"],
-            "je vais au sous-sol": ["je", "vais", "au", "sous-sol"],
-            "je vais au grenier": ["je", "vais", "au", "grenier"],
-            "je vais au balcon": ["je", "vais", "au", "balcon"],
-            "je vais à la terrasse": ["je", "vais", "à", "la", "terrasse"],
-            "je vais à la cave": ["je", "vais", "à", "la", "cave"],
-            "je vais à l ascenseur": ["je", "vais", "à", "l", "ascenseur"],
-            "je vais à l escalier": ["je", "vais", "à", "l", "escalier"],
-            "je vais à la porte": ["je", "vais", "à", "la", "porte"],
-            "je vais à la fenêtre": ["je", "vais", "à", "la", "fenetre"],
-            "je vais au toit": ["je", "vais", "au", "toit"],
-            "je vais au mur": ["je", "vais", "au", "mur"],
-            "je vais au plafond": ["je", "vais", "au", "plafond"],
-            "je vais au sol": ["je", "vais", "au", "sol"],
-            "je vais au coin": ["je", "vais", "au", "coin"],
-            "je vais au centre": ["je", "vais", "au", "centre"],
-            "je vais à côté": ["je", "vais", "à", "côté"],
-            "je vais devant": ["je", "vais", "devant"],
-            "je vais derrière": ["je", "vais", "derrière"],
-            "je vais à gauche": ["je", "vais", "à", "gauche"],
-            "je vais à droite": ["je", "vais", "à", "droite"],
-            "je vais en haut": ["je", "vais", "en", "haut"],
-            "je vais en bas": ["je", "vais", "en", "bas"],
-            "je vais au milieu": ["je", "vais", "au", "milieu"],
-            "je vais au début": ["je", "vais", "au", "début"],
-            "je vais à la fin": ["je", "vais", "à", "la", "fin"],
-            "je vais au début": ["je", "vais", "au", "début"],
-            "je vais à la fin": ["je", "vais", "à", "la", "fin"]
-        }
-
         # Vérifier chaque phrase
-        for phrase, required_signs in phrases.items():
+        for phrase, required_signs in self.PHRASES.items():
             if all(sign in self.last_signs for sign in required_signs):
                 # Vérifier l'ordre des signes
                 last_signs_str = " ".join(self.last_signs)
@@ -218,1403 +277,1495 @@ class LSFRecognizer:
 
         return None
 
-    def _is_bonjour(self, landmarks):
+    def _has_handshape(self, pose, fingers, hand_up, wrist):
+        """
+        Vérifie la forme de la main qui distingue un signe des signes aux
+        conditions voisines (mêmes conditions que dans signs.json) :
+        fingers donne chaque doigt tendu ("1") ou replié ("0"), du pouce à
+        l'auriculaire ; hand_up, le majeur au-dessus du poignet ; wrist, la
+        position du poignet : "haut" (y0 < 0.3), "milieu" ou "bas" (y0 > 0.4)
+        """
+        y = pose.y
+        for (tip, joint), extended in zip(HANDSHAPE_FINGERS, fingers):
+            if not (y[tip] < y[joint] if extended == "1" else y[tip] > y[joint]):
+                return False
+        if not (y[12] < y[0] if hand_up else y[12] > y[0]):
+            return False
+        if wrist == "haut":
+            return y[0] < 0.3
+        if wrist == "milieu":
+            return 0.3 < y[0] < 0.4
+        return y[0] > 0.4
+
+    def _is_bonjour(self, pose):
         """
         Vérifie si le signe est "Bonjour"
         """
+        y = pose.y
         # Logique simplifiée : vérifie si l'index et le majeur sont levés
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        return index_tip.y < landmarks.landmark[6].y and middle_tip.y < landmarks.landmark[10].y
+        return y[8] < y[6] and y[12] < y[10]
 
-    def _is_merci(self, landmarks):
+    def _is_merci(self, pose):
         """
         Vérifie si le signe est "Merci"
         """
+        y = pose.y
         # Logique simplifiée : vérifie si le pouce est levé
-        thumb_tip = landmarks.landmark[4]
-        return thumb_tip.y < landmarks.landmark[3].y
+        return y[4] < y[3]
 
-    def _is_oui(self, landmarks):
+    def _is_oui(self, pose):
         """
         Vérifie si le signe est "Oui"
         """
+        y = pose.y
         # Logique simplifiée : vérifie si l'index est levé
-        index_tip = landmarks.landmark[8]
-        return index_tip.y < landmarks.landmark[6].y
+        return y[8] < y[6]
 
-    def _is_non(self, landmarks):
+    def _is_non(self, pose):
         """
         Vérifie si le signe est "Non"
         """
+        x = pose.x
         # Logique simplifiée : vérifie si l'index fait un mouvement horizontal
-        index_tip = landmarks.landmark[8]
-        index_mcp = landmarks.landmark[5]
-        return abs(index_tip.x - index_mcp.x) > 0.1
+        return abs(x[8] - x[5]) > 0.1
 
-    def _is_au_revoir(self, landmarks):
+    def _is_au_revoir(self, pose):
         """
         Vérifie si le signe est "Au revoir"
         """
+        y = pose.y
         # Logique simplifiée : vérifie si la main est ouverte
-        pinky_tip = landmarks.landmark[20]
-        pinky_mcp = landmarks.landmark[17]
-        return pinky_tip.y < pinky_mcp.y
+        return y[20] < y[17]
 
-    def _is_poing_ferme(self, landmarks):
+    def _is_poing_ferme(self, pose):
         """
         Vérifie si le signe est "Poing fermé"
         """
         # Logique simplifiée : vérifie si tous les doigts sont repliés
-        finger_tips = [8, 12, 16, 20]  # Index, majeur, annulaire, auriculaire
-        finger_mcps = [5, 9, 13, 17]   # Points de référence
-        return all(landmarks.landmark[tip].y > landmarks.landmark[mcp].y 
-                  for tip, mcp in zip(finger_tips, finger_mcps))
+        return all(pose.tips_below_mcp)
 
-    def _is_s_il_vous_plait(self, landmarks):
+    def _is_s_il_vous_plait(self, pose):
         """
         Vérifie si le signe est "S'il vous plaît"
         """
+        x, y = pose.x, pose.y
         # Vérifie si la main est plate et tournée vers le haut
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y < wrist.y and abs(middle_tip.x - wrist.x) < 0.1
+        return y[12] < y[0] and abs(x[12] - x[0]) < 0.1
 
-    def _is_je_t_aime(self, landmarks):
+    def _is_je_t_aime(self, pose):
         """
         Vérifie si le signe est "Je t'aime"
         """
+        x, y = pose.x, pose.y
         # Vérifie si l'index et le majeur sont croisés
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        return abs(index_tip.x - middle_tip.x) < 0.05 and abs(index_tip.y - middle_tip.y) < 0.05
+        return abs(x[8] - x[12]) < 0.05 and abs(y[8] - y[12]) < 0.05
 
-    def _is_bien(self, landmarks):
+    def _is_bien(self, pose):
         """
         Vérifie si le signe est "Bien"
         """
+        if not self._has_handshape(pose, "10000", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si le pouce est levé et les autres doigts sont repliés
-        thumb_tip = landmarks.landmark[4]
-        thumb_mcp = landmarks.landmark[2]
-        finger_tips = [8, 12, 16, 20]  # Index, majeur, annulaire, auriculaire
-        finger_mcps = [5, 9, 13, 17]   # Points de référence
-        return (thumb_tip.y < thumb_mcp.y and 
-                all(landmarks.landmark[tip].y > landmarks.landmark[mcp].y 
-                    for tip, mcp in zip(finger_tips, finger_mcps)))
+        return (y[4] < y[2] and 
+                all(pose.tips_below_mcp))
 
-    def _is_manger(self, landmarks):
+    def _is_manger(self, pose):
         """
         Vérifie si le signe est "Manger"
         """
+        y = pose.y
         # Vérifie si la main est près du visage
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.3  # La main doit être dans la partie supérieure de l'image
+        return y[0] < 0.3  # La main doit être dans la partie supérieure de l'image
 
-    def _is_aide(self, landmarks):
+    def _is_aide(self, pose):
         """
         Vérifie si le signe est "Aide"
         """
         # Vérifie si la main est ouverte et tournée vers le haut
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]  # Index, majeur, annulaire, auriculaire
-        return all(landmarks.landmark[tip].y < wrist.y for tip in finger_tips)
+        return all(pose.tips_above_wrist)
 
-    def _is_attendre(self, landmarks):
+    def _is_attendre(self, pose):
         """
         Vérifie si le signe est "Attendre"
         """
+        x, y = pose.x, pose.y
         # Vérifie si la main est immobile (position neutre)
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.x - wrist.x) < 0.05 and abs(middle_tip.y - wrist.y) < 0.05
+        return abs(x[12] - x[0]) < 0.05 and abs(y[12] - y[0]) < 0.05
 
-    def _is_comprendre(self, landmarks):
+    def _is_comprendre(self, pose):
         """
         Vérifie si le signe est "Comprendre"
         """
+        y = pose.y
         # Vérifie si l'index est près du front
-        index_tip = landmarks.landmark[8]
-        return index_tip.y < 0.2  # La main doit être dans la partie supérieure de l'image
+        return y[8] < 0.2  # La main doit être dans la partie supérieure de l'image
 
-    def _is_faim(self, landmarks):
+    def _is_faim(self, pose):
         """
         Vérifie si le signe est "Faim"
         """
+        y = pose.y
         # Vérifie si la main est dans la partie centrale de l'image
-        wrist = landmarks.landmark[0]
-        return 0.3 < wrist.y < 0.7  # La main doit être dans la partie centrale
+        return 0.3 < y[0] < 0.7  # La main doit être dans la partie centrale
 
-    def _is_fatigue(self, landmarks):
+    def _is_fatigue(self, pose):
         """
         Vérifie si le signe est "Fatigué"
         """
+        if not self._has_handshape(pose, "01101", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est près du front
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.25  # La main doit être dans la partie supérieure de l'image
+        return y[0] < 0.25  # La main doit être dans la partie supérieure de l'image
 
-    def _is_dormir(self, landmarks):
+    def _is_dormir(self, pose):
         """
         Vérifie si le signe est "Dormir"
         """
+        if not self._has_handshape(pose, "01010", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main est près de la joue
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.3 and abs(wrist.x - 0.5) < 0.2  # Main près du visage
+        return y[0] < 0.3 and abs(x[0] - 0.5) < 0.2  # Main près du visage
 
-    def _is_boire(self, landmarks):
+    def _is_boire(self, pose):
         """
         Vérifie si le signe est "Boire"
         """
+        if not self._has_handshape(pose, "00111", True, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main est près de la bouche
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.35 and abs(wrist.x - 0.5) < 0.15  # Main près de la bouche
+        return y[0] < 0.35 and abs(x[0] - 0.5) < 0.15  # Main près de la bouche
 
-    def _is_froid(self, landmarks):
+    def _is_froid(self, pose):
         """
         Vérifie si le signe est "Froid"
         """
         # Vérifie si les doigts sont légèrement écartés
-        finger_tips = [8, 12, 16, 20]  # Index, majeur, annulaire, auriculaire
-        return all(abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.05 
-                  for tip in finger_tips)
+        return all(dx > 0.05 for dx in pose.tip_dip_dx)
 
-    def _is_chaud(self, landmarks):
+    def _is_chaud(self, pose):
         """
         Vérifie si le signe est "Chaud"
         """
+        if not self._has_handshape(pose, "01011", True, "bas"):
+            return False
         # Vérifie si la main est ouverte et les doigts sont écartés
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return all(landmarks.landmark[tip].y < wrist.y and 
-                  abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.1 
-                  for tip in finger_tips)
+        return all(pose.tips_above_wrist) and all(dx > 0.1 for dx in pose.tip_dip_dx)
 
-    def _is_pardon(self, landmarks):
+    def _is_pardon(self, pose):
         """
         Vérifie si le signe est "Pardon"
         """
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement circulaire
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.x - wrist.x) > 0.1 and abs(middle_tip.y - wrist.y) > 0.1
+        return abs(x[12] - x[0]) > 0.1 and abs(y[12] - y[0]) > 0.1
 
-    def _is_aujourd_hui(self, landmarks):
+    def _is_aujourd_hui(self, pose):
         """
         Vérifie si le signe est "Aujourd'hui"
         """
+        x, y = pose.x, pose.y
         # Vérifie si l'index pointe vers le bas
-        index_tip = landmarks.landmark[8]
-        index_mcp = landmarks.landmark[5]
-        return index_tip.y > index_mcp.y and abs(index_tip.x - index_mcp.x) < 0.05
+        return y[8] > y[5] and abs(x[8] - x[5]) < 0.05
 
-    def _is_demain(self, landmarks):
+    def _is_demain(self, pose):
         """
         Vérifie si le signe est "Demain"
         """
+        x, y = pose.x, pose.y
         # Vérifie si l'index pointe vers l'avant
-        index_tip = landmarks.landmark[8]
-        index_mcp = landmarks.landmark[5]
-        return abs(index_tip.y - index_mcp.y) < 0.05 and index_tip.x > index_mcp.x
+        return abs(y[8] - y[5]) < 0.05 and x[8] > x[5]
 
-    def _is_bonne_nuit(self, landmarks):
+    def _is_bonne_nuit(self, pose):
         """
         Vérifie si le signe est "Bonne nuit"
         """
+        if not self._has_handshape(pose, "10111", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est près du visage et les doigts sont légèrement écartés
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]  # Index, majeur, annulaire, auriculaire
-        return (wrist.y < 0.3 and  # Main près du visage
-                all(0.05 < abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) < 0.15 
-                    for tip in finger_tips))
+        return (y[0] < 0.3 and  # Main près du visage
+                all(0.05 < dx < 0.15 for dx in pose.tip_dip_dx))
 
-    def _is_sante(self, landmarks):
+    def _is_sante(self, pose):
         """
         Vérifie si le signe est "Santé"
         """
+        if not self._has_handshape(pose, "01111", True, "milieu"):
+            return False
+        y = pose.y
         # Vérifie si la main est levée et les doigts sont écartés
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y and 
-                    abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_above_wrist) and all(dx > 0.1 for dx in pose.tip_dip_dx))
 
-    def _is_amitie(self, landmarks):
+    def _is_amitie(self, pose):
         """
         Vérifie si le signe est "Amitié"
         """
+        if not self._has_handshape(pose, "01100", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si l'index et le majeur sont croisés
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        return (abs(index_tip.x - middle_tip.x) < 0.05 and 
-                abs(index_tip.y - middle_tip.y) < 0.05 and
-                index_tip.y < landmarks.landmark[6].y)  # Doigts levés
+        return (abs(x[8] - x[12]) < 0.05 and 
+                abs(y[8] - y[12]) < 0.05 and
+                y[8] < y[6])  # Doigts levés
 
-    def _is_famille(self, landmarks):
+    def _is_famille(self, pose):
         """
         Vérifie si le signe est "Famille"
         """
+        if not self._has_handshape(pose, "00110", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est ouverte et les doigts sont légèrement écartés
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.5 and  # Main dans la partie supérieure
-                all(0.05 < abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) < 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.5 and  # Main dans la partie supérieure
+                all(0.05 < dx < 0.1 for dx in pose.tip_dip_dx))
 
-    def _is_ecole(self, landmarks):
+    def _is_ecole(self, pose):
         """
         Vérifie si le signe est "École"
         """
+        if not self._has_handshape(pose, "10000", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est plate et tournée vers le haut
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(abs(landmarks.landmark[tip].y - wrist.y) < 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(dy < 0.1 for dy in pose.tip_wrist_dy))
 
-    def _is_un(self, landmarks):
+    def _is_un(self, pose):
         """
         Vérifie si le signe est "Un"
         """
+        if not self._has_handshape(pose, "01000", True, "bas"):
+            return False
+        y = pose.y
         # Vérifie si seul l'index est levé
-        index_tip = landmarks.landmark[8]
-        other_tips = [12, 16, 20]  # Majeur, annulaire, auriculaire
-        return (index_tip.y < landmarks.landmark[6].y and  # Index levé
-                all(landmarks.landmark[tip].y > landmarks.landmark[tip-2].y 
-                    for tip in other_tips))  # Autres doigts baissés
+        return (y[8] < y[6] and  # Index levé
+                all(pose.tips_below_pip[1:]))  # Autres doigts baissés
 
-    def _is_deux(self, landmarks):
+    def _is_deux(self, pose):
         """
         Vérifie si le signe est "Deux"
         """
+        if not self._has_handshape(pose, "01100", True, "bas"):
+            return False
+        y = pose.y
         # Vérifie si l'index et le majeur sont levés
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        other_tips = [16, 20]  # Annulaire, auriculaire
-        return (index_tip.y < landmarks.landmark[6].y and  # Index levé
-                middle_tip.y < landmarks.landmark[10].y and  # Majeur levé
-                all(landmarks.landmark[tip].y > landmarks.landmark[tip-2].y 
-                    for tip in other_tips))  # Autres doigts baissés
+        return (y[8] < y[6] and  # Index levé
+                y[12] < y[10] and  # Majeur levé
+                all(pose.tips_below_pip[2:]))  # Autres doigts baissés
 
-    def _is_trois(self, landmarks):
+    def _is_trois(self, pose):
         """
         Vérifie si le signe est "Trois"
         """
+        if not self._has_handshape(pose, "11110", True, "bas"):
+            return False
+        y = pose.y
         # Vérifie si l'index, le majeur et l'annulaire sont levés
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        ring_tip = landmarks.landmark[16]
-        pinky_tip = landmarks.landmark[20]
-        return (index_tip.y < landmarks.landmark[6].y and  # Index levé
-                middle_tip.y < landmarks.landmark[10].y and  # Majeur levé
-                ring_tip.y < landmarks.landmark[14].y and  # Annulaire levé
-                pinky_tip.y > landmarks.landmark[18].y)  # Auriculaire baissé
+        return (y[8] < y[6] and  # Index levé
+                y[12] < y[10] and  # Majeur levé
+                y[16] < y[14] and  # Annulaire levé
+                y[20] > y[18])  # Auriculaire baissé
 
-    def _is_quatre(self, landmarks):
+    def _is_quatre(self, pose):
         """
         Vérifie si le signe est "Quatre"
         """
+        if not self._has_handshape(pose, "11111", True, "bas"):
+            return False
         # Vérifie si tous les doigts sauf le pouce sont levés
-        finger_tips = [8, 12, 16, 20]  # Index, majeur, annulaire, auriculaire
-        finger_mcps = [5, 9, 13, 17]   # Points de référence
-        return all(landmarks.landmark[tip].y < landmarks.landmark[mcp].y 
-                  for tip, mcp in zip(finger_tips, finger_mcps))
+        return all(pose.tips_above_mcp)
 
-    def _is_cinq(self, landmarks):
+    def _is_cinq(self, pose):
         """
         Vérifie si le signe est "Cinq"
         """
+        if not self._has_handshape(pose, "11111", False, "haut"):
+            return False
         # Vérifie si tous les doigts sont écartés
-        finger_tips = [8, 12, 16, 20]  # Index, majeur, annulaire, auriculaire
-        return all(abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.1 
-                  for tip in finger_tips)
+        return all(dx > 0.1 for dx in pose.tip_dip_dx)
 
-    def _is_soleil(self, landmarks):
+    def _is_soleil(self, pose):
         """
         Vérifie si le signe est "Soleil"
         """
+        if not self._has_handshape(pose, "01011", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est ouverte et les doigts sont écartés vers le haut
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.3 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y and 
-                    abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.15 
-                    for tip in finger_tips))
+        return (y[0] < 0.3 and  # Main levée
+                all(pose.tips_above_wrist) and all(dx > 0.15 for dx in pose.tip_dip_dx))
 
-    def _is_lune(self, landmarks):
+    def _is_lune(self, pose):
         """
         Vérifie si le signe est "Lune"
         """
+        x, y = pose.x, pose.y
         # Vérifie si l'index et le majeur forment un croissant
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        return (abs(index_tip.x - middle_tip.x) > 0.2 and  # Doigts écartés horizontalement
-                abs(index_tip.y - middle_tip.y) < 0.1)  # Même hauteur
+        return (abs(x[8] - x[12]) > 0.2 and  # Doigts écartés horizontalement
+                abs(y[8] - y[12]) < 0.1)  # Même hauteur
 
-    def _is_etoile(self, landmarks):
+    def _is_etoile(self, pose):
         """
         Vérifie si le signe est "Étoile"
         """
+        if not self._has_handshape(pose, "10100", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si tous les doigts sont écartés en étoile
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(abs(landmarks.landmark[tip].x - wrist.x) > 0.2 and 
-                    abs(landmarks.landmark[tip].y - wrist.y) > 0.2 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(dx > 0.2 for dx in pose.tip_wrist_dx) and all(dy > 0.2 for dy in pose.tip_wrist_dy))
 
-    def _is_pluie(self, landmarks):
+    def _is_pluie(self, pose):
         """
         Vérifie si le signe est "Pluie"
         """
+        if not self._has_handshape(pose, "00000", False, "bas"):
+            return False
         # Vérifie si les doigts pointent vers le bas
-        finger_tips = [8, 12, 16, 20]
-        finger_mcps = [5, 9, 13, 17]
-        return all(landmarks.landmark[tip].y > landmarks.landmark[mcp].y 
-                  for tip, mcp in zip(finger_tips, finger_mcps))
+        return all(pose.tips_below_mcp)
 
-    def _is_neige(self, landmarks):
+    def _is_neige(self, pose):
         """
         Vérifie si le signe est "Neige"
         """
+        if not self._has_handshape(pose, "10000", True, "bas"):
+            return False
         # Vérifie si les doigts sont écartés et pointent vers le bas
-        finger_tips = [8, 12, 16, 20]
-        return all(abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.1 and
-                  landmarks.landmark[tip].y > landmarks.landmark[tip-2].y 
-                  for tip in finger_tips)
+        return all(dx > 0.1 for dx in pose.tip_dip_dx) and all(pose.tips_below_pip)
 
-    def _is_vent(self, landmarks):
+    def _is_vent(self, pose):
         """
         Vérifie si le signe est "Vent"
         """
+        if not self._has_handshape(pose, "10010", True, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main est horizontale et les doigts sont écartés
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (abs(wrist.y - landmarks.landmark[8].y) < 0.1 and  # Main horizontale
-                all(abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.15 
-                    for tip in finger_tips))
+        return (abs(y[0] - y[8]) < 0.1 and  # Main horizontale
+                all(dx > 0.15 for dx in pose.tip_dip_dx))
 
-    def _is_feu(self, landmarks):
+    def _is_feu(self, pose):
         """
         Vérifie si le signe est "Feu"
         """
+        if not self._has_handshape(pose, "00111", True, "milieu"):
+            return False
+        y = pose.y
         # Vérifie si les doigts sont écartés vers le haut
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y and 
-                    abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_above_wrist) and all(dx > 0.1 for dx in pose.tip_dip_dx))
 
-    def _is_eau(self, landmarks):
+    def _is_eau(self, pose):
         """
         Vérifie si le signe est "Eau"
         """
+        y = pose.y
         # Vérifie si la main est plate et fait un mouvement ondulant
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (abs(wrist.y - landmarks.landmark[8].y) < 0.1 and  # Main horizontale
-                all(abs(landmarks.landmark[tip].y - wrist.y) < 0.1 
-                    for tip in finger_tips))
+        return (abs(y[0] - y[8]) < 0.1 and  # Main horizontale
+                all(dy < 0.1 for dy in pose.tip_wrist_dy))
 
-    def _is_terre(self, landmarks):
+    def _is_terre(self, pose):
         """
         Vérifie si le signe est "Terre"
         """
+        if not self._has_handshape(pose, "11111", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main est plate et tournée vers le bas
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y > 0.6 and  # Main baissée
-                all(abs(landmarks.landmark[tip].y - wrist.y) < 0.1 
-                    for tip in finger_tips))
+        return (y[0] > 0.6 and  # Main baissée
+                all(dy < 0.1 for dy in pose.tip_wrist_dy))
 
-    def _is_ciel(self, landmarks):
+    def _is_ciel(self, pose):
         """
         Vérifie si le signe est "Ciel"
         """
+        if not self._has_handshape(pose, "01111", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est levée et les doigts sont écartés vers le haut
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.3 and  # Main très levée
-                all(landmarks.landmark[tip].y < wrist.y and 
-                    abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.3 and  # Main très levée
+                all(pose.tips_above_wrist) and all(dx > 0.1 for dx in pose.tip_dip_dx))
 
-    def _is_comment(self, landmarks):
+    def _is_comment(self, pose):
         """
         Vérifie si le signe est "Comment"
         """
+        if not self._has_handshape(pose, "11000", True, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si l'index fait un mouvement circulaire
-        index_tip = landmarks.landmark[8]
-        index_mcp = landmarks.landmark[5]
-        return abs(index_tip.x - index_mcp.x) > 0.1 and abs(index_tip.y - index_mcp.y) > 0.1
+        return abs(x[8] - x[5]) > 0.1 and abs(y[8] - y[5]) > 0.1
 
-    def _is_ca(self, landmarks):
+    def _is_ca(self, pose):
         """
         Vérifie si le signe est "Ça"
         """
+        if not self._has_handshape(pose, "01001", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main est plate et fait un mouvement de va-et-vient
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.x - wrist.x) > 0.1
+        return abs(x[12] - x[0]) > 0.1
 
-    def _is_vas(self, landmarks):
+    def _is_vas(self, pose):
         """
         Vérifie si le signe est "Vas"
         """
+        if not self._has_handshape(pose, "00110", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si l'index pointe vers l'avant
-        index_tip = landmarks.landmark[8]
-        index_mcp = landmarks.landmark[5]
-        return index_tip.x > index_mcp.x and abs(index_tip.y - index_mcp.y) < 0.1
+        return x[8] > x[5] and abs(y[8] - y[5]) < 0.1
 
-    def _is_je(self, landmarks):
+    def _is_je(self, pose):
         """
         Vérifie si le signe est "Je"
         """
+        if not self._has_handshape(pose, "00001", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si l'index pointe vers soi
-        index_tip = landmarks.landmark[8]
-        return index_tip.x < 0.3  # Main du côté gauche
+        return x[8] < 0.3  # Main du côté gauche
 
-    def _is_suis(self, landmarks):
+    def _is_suis(self, pose):
         """
         Vérifie si le signe est "Suis"
         """
+        if not self._has_handshape(pose, "00011", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main est plate et fait un mouvement vers le bas
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y > wrist.y
+        return y[12] > y[0]
 
-    def _is_il(self, landmarks):
+    def _is_il(self, pose):
         """
         Vérifie si le signe est "Il"
         """
+        if not self._has_handshape(pose, "11010", False, "bas"):
+            return False
+        x = pose.x
         # Vérifie si l'index pointe vers l'extérieur
-        index_tip = landmarks.landmark[8]
-        return index_tip.x > 0.7  # Main du côté droit
+        return x[8] > 0.7  # Main du côté droit
 
-    def _is_fait(self, landmarks):
+    def _is_fait(self, pose):
         """
         Vérifie si le signe est "Fait"
         """
+        if not self._has_handshape(pose, "00010", False, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main est plate et fait un mouvement vers l'avant
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x > wrist.x
+        return x[12] > x[0]
 
-    def _is_beau(self, landmarks):
+    def _is_beau(self, pose):
         """
         Vérifie si le signe est "Beau"
         """
+        if not self._has_handshape(pose, "10011", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est ouverte et tournée vers le haut
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_above_wrist))
 
-    def _is_pleut(self, landmarks):
+    def _is_pleut(self, pose):
         """
         Vérifie si le signe est "Pleut"
         """
+        if not self._has_handshape(pose, "10000", False, "bas"):
+            return False
         # Vérifie si les doigts pointent vers le bas et font un mouvement de va-et-vient
-        finger_tips = [8, 12, 16, 20]
-        finger_mcps = [5, 9, 13, 17]
-        return all(landmarks.landmark[tip].y > landmarks.landmark[mcp].y 
-                  for tip, mcp in zip(finger_tips, finger_mcps))
+        return all(pose.tips_below_mcp)
 
-    def _is_quel(self, landmarks):
+    def _is_quel(self, pose):
         """
         Vérifie si le signe est "Quel"
         """
+        if not self._has_handshape(pose, "01111", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si l'index et le majeur sont levés et font un mouvement de question
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        return (index_tip.y < landmarks.landmark[6].y and 
-                middle_tip.y < landmarks.landmark[10].y and
-                abs(index_tip.x - middle_tip.x) < 0.1)
+        return (y[8] < y[6] and 
+                y[12] < y[10] and
+                abs(x[8] - x[12]) < 0.1)
 
-    def _is_votre(self, landmarks):
+    def _is_votre(self, pose):
         """
         Vérifie si le signe est "Votre"
         """
+        if not self._has_handshape(pose, "01110", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main est ouverte et pointe vers l'extérieur
-        wrist = landmarks.landmark[0]
-        return wrist.x > 0.5  # Main du côté droit
+        return x[0] > 0.5  # Main du côté droit
 
-    def _is_nom(self, landmarks):
+    def _is_nom(self, pose):
         """
         Vérifie si le signe est "Nom"
         """
+        if not self._has_handshape(pose, "00100", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si l'index et le majeur sont croisés
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        return (abs(index_tip.x - middle_tip.x) < 0.05 and 
-                abs(index_tip.y - middle_tip.y) < 0.05)
+        return (abs(x[8] - x[12]) < 0.05 and 
+                abs(y[8] - y[12]) < 0.05)
 
-    def _is_content(self, landmarks):
+    def _is_content(self, pose):
         """
         Vérifie si le signe est "Content"
         """
+        if not self._has_handshape(pose, "01010", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est ouverte et fait un mouvement vers le haut
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_above_wrist))
 
-    def _is_triste(self, landmarks):
+    def _is_triste(self, pose):
         """
         Vérifie si le signe est "Triste"
         """
+        if not self._has_handshape(pose, "10100", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main est baissée et les doigts sont repliés
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y > 0.6 and  # Main baissée
-                all(landmarks.landmark[tip].y > wrist.y 
-                    for tip in finger_tips))
+        return (y[0] > 0.6 and  # Main baissée
+                all(pose.tips_below_wrist))
 
-    def _is_colere(self, landmarks):
+    def _is_colere(self, pose):
         """
         Vérifie si le signe est "Colère"
         """
+        if not self._has_handshape(pose, "00100", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est fermée et fait un mouvement vers l'avant
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y > wrist.y 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_below_wrist))
 
-    def _is_surpris(self, landmarks):
+    def _is_surpris(self, pose):
         """
         Vérifie si le signe est "Surpris"
         """
+        if not self._has_handshape(pose, "10110", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si tous les doigts sont écartés
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(abs(landmarks.landmark[tip].x - landmarks.landmark[tip-1].x) > 0.15 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(dx > 0.15 for dx in pose.tip_dip_dx))
 
-    def _is_malade(self, landmarks):
+    def _is_malade(self, pose):
         """
         Vérifie si le signe est "Malade"
         """
+        if not self._has_handshape(pose, "00110", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est près du front
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.3  # Main près du front
+        return y[0] < 0.3  # Main près du front
 
-    def _is_heureux(self, landmarks):
+    def _is_heureux(self, pose):
         """
         Vérifie si le signe est "Heureux"
         """
+        if not self._has_handshape(pose, "10010", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main est ouverte et fait un mouvement circulaire
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                abs(middle_tip.x - wrist.x) > 0.1 and 
-                abs(middle_tip.y - wrist.y) > 0.1)
+        return (y[0] < 0.4 and  # Main levée
+                abs(x[12] - x[0]) > 0.1 and 
+                abs(y[12] - y[0]) > 0.1)
 
-    def _is_desole(self, landmarks):
+    def _is_desole(self, pose):
         """
         Vérifie si le signe est "Désolé"
         """
+        if not self._has_handshape(pose, "11011", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main est plate et fait un mouvement vers le bas
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y > wrist.y
+        return y[12] > y[0]
 
-    def _is_perdu(self, landmarks):
+    def _is_perdu(self, pose):
         """
         Vérifie si le signe est "Perdu"
         """
+        if not self._has_handshape(pose, "11010", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main fait un mouvement de recherche
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.x - wrist.x) > 0.2
+        return abs(x[12] - x[0]) > 0.2
 
-    def _is_presse(self, landmarks):
+    def _is_presse(self, pose):
         """
         Vérifie si le signe est "Pressé"
         """
+        if not self._has_handshape(pose, "10001", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main fait un mouvement rapide
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.x - wrist.x) > 0.15
+        return abs(x[12] - x[0]) > 0.15
 
-    def _is_retard(self, landmarks):
+    def _is_retard(self, pose):
         """
         Vérifie si le signe est "Retard"
         """
+        if not self._has_handshape(pose, "01000", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main pointe vers le bas
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y > wrist.y
+        return y[12] > y[0]
 
-    def _is_heure(self, landmarks):
+    def _is_heure(self, pose):
         """
         Vérifie si le signe est "Heure"
         """
+        if not self._has_handshape(pose, "00000", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main pointe vers la montre
-        wrist = landmarks.landmark[0]
-        return wrist.x > 0.5  # Main du côté droit
+        return x[0] > 0.5  # Main du côté droit
 
-    def _is_occupe(self, landmarks):
+    def _is_occupe(self, pose):
         """
         Vérifie si le signe est "Occupé"
         """
+        if not self._has_handshape(pose, "00000", False, "haut"):
+            return False
         # Vérifie si la main est fermée
-        finger_tips = [8, 12, 16, 20]
-        finger_mcps = [5, 9, 13, 17]
-        return all(landmarks.landmark[tip].y > landmarks.landmark[mcp].y 
-                  for tip, mcp in zip(finger_tips, finger_mcps))
+        return all(pose.tips_below_mcp)
 
-    def _is_libre(self, landmarks):
+    def _is_libre(self, pose):
         """
         Vérifie si le signe est "Libre"
         """
+        if not self._has_handshape(pose, "11011", True, "bas"):
+            return False
         # Vérifie si la main est ouverte
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return all(landmarks.landmark[tip].y < wrist.y 
-                  for tip in finger_tips)
+        return all(pose.tips_above_wrist)
 
-    def _is_pret(self, landmarks):
+    def _is_pret(self, pose):
         """
         Vérifie si le signe est "Prêt"
         """
+        if not self._has_handshape(pose, "11100", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main est ouverte et tournée vers l'avant
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x > wrist.x
+        return x[12] > x[0]
 
-    def _is_la(self, landmarks):
+    def _is_la(self, pose):
         """
         Vérifie si le signe est "Là"
         """
+        if not self._has_handshape(pose, "10110", True, "bas"):
+            return False
+        y = pose.y
         # Vérifie si l'index pointe vers le bas
-        index_tip = landmarks.landmark[8]
-        return index_tip.y > landmarks.landmark[6].y
+        return y[8] > y[6]
 
-    def _is_parti(self, landmarks):
+    def _is_parti(self, pose):
         """
         Vérifie si le signe est "Parti"
         """
+        if not self._has_handshape(pose, "00010", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main fait un mouvement vers l'extérieur
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x > wrist.x
+        return x[12] > x[0]
 
-    def _is_revenu(self, landmarks):
+    def _is_revenu(self, pose):
         """
         Vérifie si le signe est "Revenu"
         """
+        if not self._has_handshape(pose, "10111", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main fait un mouvement vers l'intérieur
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x < wrist.x
+        return x[12] < x[0]
 
-    def _is_arrive(self, landmarks):
+    def _is_arrive(self, pose):
         """
         Vérifie si le signe est "Arrivé"
         """
+        if not self._has_handshape(pose, "10011", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main est plate et fait un mouvement vers le bas
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y > wrist.y
+        return y[12] > y[0]
 
-    def _is_train(self, landmarks):
+    def _is_train(self, pose):
         """
         Vérifie si le signe est "Train"
         """
+        if not self._has_handshape(pose, "01000", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement circulaire
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.1 and 
-                abs(middle_tip.y - wrist.y) > 0.1)
+        return (abs(x[12] - x[0]) > 0.1 and 
+                abs(y[12] - y[0]) > 0.1)
 
-    def _is_apprendre(self, landmarks):
+    def _is_apprendre(self, pose):
         """
         Vérifie si le signe est "Apprendre"
         """
+        if not self._has_handshape(pose, "01101", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est près du front
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.3  # Main près du front
+        return y[0] < 0.3  # Main près du front
 
-    def _is_reflechir(self, landmarks):
+    def _is_reflechir(self, pose):
         """
         Vérifie si le signe est "Réfléchir"
         """
+        if not self._has_handshape(pose, "11110", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si l'index est près du front
-        index_tip = landmarks.landmark[8]
-        return index_tip.y < 0.2  # Index près du front
+        return y[8] < 0.2  # Index près du front
 
-    def _is_parler(self, landmarks):
+    def _is_parler(self, pose):
         """
         Vérifie si le signe est "Parler"
         """
+        if not self._has_handshape(pose, "11011", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est près de la bouche
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.35  # Main près de la bouche
+        return y[0] < 0.35  # Main près de la bouche
 
-    def _is_ecouter(self, landmarks):
+    def _is_ecouter(self, pose):
         """
         Vérifie si le signe est "Écouter"
         """
+        if not self._has_handshape(pose, "10101", True, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main est près de l'oreille
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.3 and wrist.x > 0.7  # Main près de l'oreille droite
+        return y[0] < 0.3 and x[0] > 0.7  # Main près de l'oreille droite
 
-    def _is_regarder(self, landmarks):
+    def _is_regarder(self, pose):
         """
         Vérifie si le signe est "Regarder"
         """
+        if not self._has_handshape(pose, "11101", False, "bas"):
+            return False
+        x = pose.x
         # Vérifie si l'index et le majeur pointent vers l'avant
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        return (index_tip.x > landmarks.landmark[5].x and 
-                middle_tip.x > landmarks.landmark[9].x)
+        return (x[8] > x[5] and 
+                x[12] > x[9])
 
-    def _is_chercher(self, landmarks):
+    def _is_chercher(self, pose):
         """
         Vérifie si le signe est "Chercher"
         """
+        if not self._has_handshape(pose, "00100", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main fait un mouvement de recherche
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.x - wrist.x) > 0.2
+        return abs(x[12] - x[0]) > 0.2
 
-    def _is_trouver(self, landmarks):
+    def _is_trouver(self, pose):
         """
         Vérifie si le signe est "Trouver"
         """
+        if not self._has_handshape(pose, "00011", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si l'index pointe vers l'avant
-        index_tip = landmarks.landmark[8]
-        return index_tip.x > landmarks.landmark[5].x
+        return x[8] > x[5]
 
-    def _is_perdre(self, landmarks):
+    def _is_perdre(self, pose):
         """
         Vérifie si le signe est "Perdre"
         """
+        if not self._has_handshape(pose, "11000", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main fait un mouvement vers le bas
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y > wrist.y
+        return y[12] > y[0]
 
-    def _is_gagner(self, landmarks):
+    def _is_gagner(self, pose):
         """
         Vérifie si le signe est "Gagner"
         """
+        if not self._has_handshape(pose, "10001", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est levée
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.4  # Main levée
+        return y[0] < 0.4  # Main levée
 
-    def _is_jouer(self, landmarks):
+    def _is_jouer(self, pose):
         """
         Vérifie si le signe est "Jouer"
         """
+        if not self._has_handshape(pose, "01111", True, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de jeu
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.1 and 
-                abs(middle_tip.y - wrist.y) > 0.1)
+        return (abs(x[12] - x[0]) > 0.1 and 
+                abs(y[12] - y[0]) > 0.1)
 
-    def _is_travail(self, landmarks):
+    def _is_travail(self, pose):
         """
         Vérifie si le signe est "Travail"
         """
+        if not self._has_handshape(pose, "10111", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de travail
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                abs(middle_tip.x - wrist.x) > 0.1)
+        return (y[0] < 0.4 and  # Main levée
+                abs(x[12] - x[0]) > 0.1)
 
-    def _is_maison(self, landmarks):
+    def _is_maison(self, pose):
         """
         Vérifie si le signe est "Maison"
         """
+        if not self._has_handshape(pose, "01001", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme un toit
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_above_wrist))
 
-    def _is_magasin(self, landmarks):
+    def _is_magasin(self, pose):
         """
         Vérifie si le signe est "Magasin"
         """
+        if not self._has_handshape(pose, "01010", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main fait un mouvement d'ouverture
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x > wrist.x
+        return x[12] > x[0]
 
-    def _is_restaurant(self, landmarks):
+    def _is_restaurant(self, pose):
         """
         Vérifie si le signe est "Restaurant"
         """
+        if not self._has_handshape(pose, "11000", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est près de la bouche
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.35  # Main près de la bouche
+        return y[0] < 0.35  # Main près de la bouche
 
-    def _is_cinema(self, landmarks):
+    def _is_cinema(self, pose):
         """
         Vérifie si le signe est "Cinéma"
         """
+        if not self._has_handshape(pose, "11010", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme un cadre
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(abs(landmarks.landmark[tip].x - wrist.x) > 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(dx > 0.1 for dx in pose.tip_wrist_dx))
 
-    def _is_parc(self, landmarks):
+    def _is_parc(self, pose):
         """
         Vérifie si le signe est "Parc"
         """
+        if not self._has_handshape(pose, "00011", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement circulaire
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.1 and 
-                abs(middle_tip.y - wrist.y) > 0.1)
+        return (abs(x[12] - x[0]) > 0.1 and 
+                abs(y[12] - y[0]) > 0.1)
 
-    def _is_plage(self, landmarks):
+    def _is_plage(self, pose):
         """
         Vérifie si le signe est "Plage"
         """
+        if not self._has_handshape(pose, "01100", False, "haut"):
+            return False
+        x = pose.x
         # Vérifie si la main est plate et fait un mouvement horizontal
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.x - wrist.x) > 0.2
+        return abs(x[12] - x[0]) > 0.2
 
-    def _is_montagne(self, landmarks):
+    def _is_montagne(self, pose):
         """
         Vérifie si le signe est "Montagne"
         """
+        if not self._has_handshape(pose, "10110", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme un pic
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                middle_tip.y < wrist.y)
+        return (y[0] < 0.4 and  # Main levée
+                y[12] < y[0])
 
-    def _is_campagne(self, landmarks):
+    def _is_campagne(self, pose):
         """
         Vérifie si le signe est "Campagne"
         """
+        if not self._has_handshape(pose, "01101", True, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement ondulant
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.1 and 
-                abs(middle_tip.y - wrist.y) > 0.1)
+        return (abs(x[12] - x[0]) > 0.1 and 
+                abs(y[12] - y[0]) > 0.1)
 
-    def _is_ville(self, landmarks):
+    def _is_ville(self, pose):
         """
         Vérifie si le signe est "Ville"
         """
+        if not self._has_handshape(pose, "11111", True, "milieu"):
+            return False
+        y = pose.y
         # Vérifie si la main forme des bâtiments
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_above_wrist))
 
-    def _is_gare(self, landmarks):
+    def _is_gare(self, pose):
         """
         Vérifie si le signe est "Gare"
         """
+        if not self._has_handshape(pose, "10101", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de train
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.2 and 
-                abs(middle_tip.y - wrist.y) < 0.1)
+        return (abs(x[12] - x[0]) > 0.2 and 
+                abs(y[12] - y[0]) < 0.1)
 
-    def _is_aeroport(self, landmarks):
+    def _is_aeroport(self, pose):
         """
         Vérifie si le signe est "Aéroport"
         """
+        if not self._has_handshape(pose, "00100", True, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement d'avion
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                middle_tip.x > wrist.x)
+        return (y[0] < 0.4 and  # Main levée
+                x[12] > x[0])
 
-    def _is_hopital(self, landmarks):
+    def _is_hopital(self, pose):
         """
         Vérifie si le signe est "Hôpital"
         """
+        if not self._has_handshape(pose, "01111", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme une croix
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(abs(landmarks.landmark[tip].x - wrist.x) > 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(dx > 0.1 for dx in pose.tip_wrist_dx))
 
-    def _is_docteur(self, landmarks):
+    def _is_docteur(self, pose):
         """
         Vérifie si le signe est "Docteur"
         """
+        if not self._has_handshape(pose, "11001", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main est près du front
-        wrist = landmarks.landmark[0]
-        return wrist.y < 0.3  # Main près du front
+        return y[0] < 0.3  # Main près du front
 
-    def _is_pharmacie(self, landmarks):
+    def _is_pharmacie(self, pose):
         """
         Vérifie si le signe est "Pharmacie"
         """
+        if not self._has_handshape(pose, "01011", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme une croix
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(abs(landmarks.landmark[tip].x - wrist.x) > 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(dx > 0.1 for dx in pose.tip_wrist_dx))
 
-    def _is_banque(self, landmarks):
+    def _is_banque(self, pose):
         """
         Vérifie si le signe est "Banque"
         """
+        if not self._has_handshape(pose, "00101", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement d'argent
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.1 and 
-                abs(middle_tip.y - wrist.y) < 0.1)
+        return (abs(x[12] - x[0]) > 0.1 and 
+                abs(y[12] - y[0]) < 0.1)
 
-    def _is_poste(self, landmarks):
+    def _is_poste(self, pose):
         """
         Vérifie si le signe est "Poste"
         """
+        if not self._has_handshape(pose, "11101", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement d'enveloppe
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                middle_tip.x > wrist.x)
+        return (y[0] < 0.4 and  # Main levée
+                x[12] > x[0])
 
-    def _is_bibliotheque(self, landmarks):
+    def _is_bibliotheque(self, pose):
         """
         Vérifie si le signe est "Bibliothèque"
         """
+        if not self._has_handshape(pose, "11100", True, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de livre
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                abs(middle_tip.x - wrist.x) < 0.1)
+        return (y[0] < 0.4 and  # Main levée
+                abs(x[12] - x[0]) < 0.1)
 
-    def _is_musee(self, landmarks):
+    def _is_musee(self, pose):
         """
         Vérifie si le signe est "Musée"
         """
+        if not self._has_handshape(pose, "00111", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de tableau
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                abs(middle_tip.x - wrist.x) > 0.1)
+        return (y[0] < 0.4 and  # Main levée
+                abs(x[12] - x[0]) > 0.1)
 
-    def _is_theatre(self, landmarks):
+    def _is_theatre(self, pose):
         """
         Vérifie si le signe est "Théâtre"
         """
+        if not self._has_handshape(pose, "01100", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main fait un mouvement de rideau
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                middle_tip.y < wrist.y)
+        return (y[0] < 0.4 and  # Main levée
+                y[12] < y[0])
 
-    def _is_concert(self, landmarks):
+    def _is_concert(self, pose):
         """
         Vérifie si le signe est "Concert"
         """
+        if not self._has_handshape(pose, "00010", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de musique
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.1 and 
-                abs(middle_tip.y - wrist.y) > 0.1)
+        return (abs(x[12] - x[0]) > 0.1 and 
+                abs(y[12] - y[0]) > 0.1)
 
-    def _is_stade(self, landmarks):
+    def _is_stade(self, pose):
         """
         Vérifie si le signe est "Stade"
         """
+        if not self._has_handshape(pose, "11110", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme un ovale
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(abs(landmarks.landmark[tip].x - wrist.x) > 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(dx > 0.1 for dx in pose.tip_wrist_dx))
 
-    def _is_piscine(self, landmarks):
+    def _is_piscine(self, pose):
         """
         Vérifie si le signe est "Piscine"
         """
+        if not self._has_handshape(pose, "00111", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de nage
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.2 and 
-                abs(middle_tip.y - wrist.y) < 0.1)
+        return (abs(x[12] - x[0]) > 0.2 and 
+                abs(y[12] - y[0]) < 0.1)
 
-    def _is_gymnase(self, landmarks):
+    def _is_gymnase(self, pose):
         """
         Vérifie si le signe est "Gymnase"
         """
+        if not self._has_handshape(pose, "01001", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement d'exercice
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                abs(middle_tip.x - wrist.x) > 0.1)
+        return (y[0] < 0.4 and  # Main levée
+                abs(x[12] - x[0]) > 0.1)
 
-    def _is_salle(self, landmarks):
+    def _is_salle(self, pose):
         """
         Vérifie si le signe est "Salle"
         """
+        if not self._has_handshape(pose, "01110", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme un rectangle
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(abs(landmarks.landmark[tip].x - wrist.x) > 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(dx > 0.1 for dx in pose.tip_wrist_dx))
 
-    def _is_sport(self, landmarks):
+    def _is_sport(self, pose):
         """
         Vérifie si le signe est "Sport"
         """
+        if not self._has_handshape(pose, "10101", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement d'activité
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                abs(middle_tip.x - wrist.x) > 0.1)
+        return (y[0] < 0.4 and  # Main levée
+                abs(x[12] - x[0]) > 0.1)
 
-    def _is_bain(self, landmarks):
+    def _is_bain(self, pose):
         """
         Vérifie si le signe est "Bain"
         """
+        if not self._has_handshape(pose, "00111", True, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de lavage
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.1 and 
-                abs(middle_tip.y - wrist.y) > 0.1)
+        return (abs(x[12] - x[0]) > 0.1 and 
+                abs(y[12] - y[0]) > 0.1)
 
-    def _is_cuisine(self, landmarks):
+    def _is_cuisine(self, pose):
         """
         Vérifie si le signe est "Cuisine"
         """
+        if not self._has_handshape(pose, "11100", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de cuisson
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                abs(middle_tip.x - wrist.x) > 0.1)
+        return (y[0] < 0.4 and  # Main levée
+                abs(x[12] - x[0]) > 0.1)
 
-    def _is_salon(self, landmarks):
+    def _is_salon(self, pose):
         """
         Vérifie si le signe est "Salon"
         """
+        if not self._has_handshape(pose, "01110", True, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de confort
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                abs(middle_tip.x - wrist.x) < 0.1)
+        return (y[0] < 0.4 and  # Main levée
+                abs(x[12] - x[0]) < 0.1)
 
-    def _is_chambre(self, landmarks):
+    def _is_chambre(self, pose):
         """
         Vérifie si le signe est "Chambre"
         """
+        if not self._has_handshape(pose, "11101", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main fait un mouvement de lit
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                middle_tip.y < wrist.y)
+        return (y[0] < 0.4 and  # Main levée
+                y[12] < y[0])
 
-    def _is_jardin(self, landmarks):
+    def _is_jardin(self, pose):
         """
         Vérifie si le signe est "Jardin"
         """
+        if not self._has_handshape(pose, "00101", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main fait un mouvement de plante
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (wrist.y < 0.4 and  # Main levée
-                middle_tip.y < wrist.y)
+        return (y[0] < 0.4 and  # Main levée
+                y[12] < y[0])
 
-    def _is_garage(self, landmarks):
+    def _is_garage(self, pose):
         """
         Vérifie si le signe est "Garage"
         """
+        if not self._has_handshape(pose, "01101", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement de voiture
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.2 and 
-                abs(middle_tip.y - wrist.y) < 0.1)
+        return (abs(x[12] - x[0]) > 0.2 and 
+                abs(y[12] - y[0]) < 0.1)
 
-    def _is_sous_sol(self, landmarks):
+    def _is_sous_sol(self, pose):
         """
         Vérifie si le signe est "Sous-sol"
         """
+        if not self._has_handshape(pose, "10001", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main pointe vers le bas
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y > wrist.y
+        return y[12] > y[0]
 
-    def _is_grenier(self, landmarks):
+    def _is_grenier(self, pose):
         """
         Vérifie si le signe est "Grenier"
         """
+        if not self._has_handshape(pose, "10100", True, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main pointe vers le haut
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y < wrist.y
+        return y[12] < y[0]
 
-    def _is_balcon(self, landmarks):
+    def _is_balcon(self, pose):
         """
         Vérifie si le signe est "Balcon"
         """
+        if not self._has_handshape(pose, "11001", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme une plateforme
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_above_wrist))
 
-    def _is_terrasse(self, landmarks):
+    def _is_terrasse(self, pose):
         """
         Vérifie si le signe est "Terrasse"
         """
+        if not self._has_handshape(pose, "11011", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme une plateforme
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_above_wrist))
 
-    def _is_cave(self, landmarks):
+    def _is_cave(self, pose):
         """
         Vérifie si le signe est "Cave"
         """
+        if not self._has_handshape(pose, "11001", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main pointe vers le bas
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y > wrist.y
+        return y[12] > y[0]
 
-    def _is_ascenseur(self, landmarks):
+    def _is_ascenseur(self, pose):
         """
         Vérifie si le signe est "Ascenseur"
         """
+        if not self._has_handshape(pose, "10011", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main fait un mouvement vertical
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.y - wrist.y) > 0.2
+        return abs(y[12] - y[0]) > 0.2
 
-    def _is_escalier(self, landmarks):
+    def _is_escalier(self, pose):
         """
         Vérifie si le signe est "Escalier"
         """
+        if not self._has_handshape(pose, "00001", False, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main fait un mouvement d'escalier
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) > 0.1 and 
-                abs(middle_tip.y - wrist.y) > 0.1)
+        return (abs(x[12] - x[0]) > 0.1 and 
+                abs(y[12] - y[0]) > 0.1)
 
-    def _is_porte(self, landmarks):
+    def _is_porte(self, pose):
         """
         Vérifie si le signe est "Porte"
         """
+        if not self._has_handshape(pose, "10010", False, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main fait un mouvement d'ouverture
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x > wrist.x
+        return x[12] > x[0]
 
-    def _is_fenetre(self, landmarks):
+    def _is_fenetre(self, pose):
         """
         Vérifie si le signe est "Fenêtre"
         """
+        if not self._has_handshape(pose, "00101", False, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme un cadre
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(abs(landmarks.landmark[tip].x - wrist.x) > 0.1 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(dx > 0.1 for dx in pose.tip_wrist_dx))
 
-    def _is_toit(self, landmarks):
+    def _is_toit(self, pose):
         """
         Vérifie si le signe est "Toit"
         """
+        if not self._has_handshape(pose, "11111", True, "haut"):
+            return False
+        y = pose.y
         # Vérifie si la main forme un toit
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].y < wrist.y 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(pose.tips_above_wrist))
 
-    def _is_mur(self, landmarks):
+    def _is_mur(self, pose):
         """
         Vérifie si le signe est "Mur"
         """
+        if not self._has_handshape(pose, "01011", False, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main est plate et verticale
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.x - wrist.x) < 0.1
+        return abs(x[12] - x[0]) < 0.1
 
-    def _is_plafond(self, landmarks):
+    def _is_plafond(self, pose):
         """
         Vérifie si le signe est "Plafond"
         """
+        if not self._has_handshape(pose, "11110", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main est plate et horizontale
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.y - wrist.y) < 0.1
+        return abs(y[12] - y[0]) < 0.1
 
-    def _is_sol(self, landmarks):
+    def _is_sol(self, pose):
         """
         Vérifie si le signe est "Sol"
         """
+        if not self._has_handshape(pose, "11100", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main est plate et horizontale
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.y - wrist.y) < 0.1
+        return abs(y[12] - y[0]) < 0.1
 
-    def _is_coin(self, landmarks):
+    def _is_coin(self, pose):
         """
         Vérifie si le signe est "Coin"
         """
+        if not self._has_handshape(pose, "10100", True, "haut"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main forme un angle
-        wrist = landmarks.landmark[0]
-        finger_tips = [8, 12, 16, 20]
-        return (wrist.y < 0.4 and  # Main levée
-                all(landmarks.landmark[tip].x != wrist.x 
-                    for tip in finger_tips))
+        return (y[0] < 0.4 and  # Main levée
+                all(x[tip] != x[0] for tip in FINGER_TIPS))
 
-    def _is_centre(self, landmarks):
+    def _is_centre(self, pose):
         """
         Vérifie si le signe est "Centre"
         """
+        if not self._has_handshape(pose, "10111", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main pointe vers le centre
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) < 0.1 and 
-                abs(middle_tip.y - wrist.y) < 0.1)
+        return (abs(x[12] - x[0]) < 0.1 and 
+                abs(y[12] - y[0]) < 0.1)
 
-    def _is_cote(self, landmarks):
+    def _is_cote(self, pose):
         """
         Vérifie si le signe est "Côté"
         """
+        if not self._has_handshape(pose, "10011", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main pointe sur le côté
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return abs(middle_tip.x - wrist.x) > 0.2
+        return abs(x[12] - x[0]) > 0.2
 
-    def _is_devant(self, landmarks):
+    def _is_devant(self, pose):
         """
         Vérifie si le signe est "Devant"
         """
+        if not self._has_handshape(pose, "01010", False, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main pointe vers l'avant
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x > wrist.x
+        return x[12] > x[0]
 
-    def _is_derriere(self, landmarks):
+    def _is_derriere(self, pose):
         """
         Vérifie si le signe est "Derrière"
         """
+        if not self._has_handshape(pose, "10101", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main pointe vers l'arrière
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x < wrist.x
+        return x[12] < x[0]
 
-    def _is_gauche(self, landmarks):
+    def _is_gauche(self, pose):
         """
         Vérifie si le signe est "Gauche"
         """
+        if not self._has_handshape(pose, "00110", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main pointe vers la gauche
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x < wrist.x
+        return x[12] < x[0]
 
-    def _is_droite(self, landmarks):
+    def _is_droite(self, pose):
         """
         Vérifie si le signe est "Droite"
         """
+        if not self._has_handshape(pose, "10110", False, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main pointe vers la droite
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x > wrist.x
+        return x[12] > x[0]
 
-    def _is_haut(self, landmarks):
+    def _is_haut(self, pose):
         """
         Vérifie si le signe est "Haut"
         """
+        if not self._has_handshape(pose, "11101", True, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main pointe vers le haut
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y < wrist.y
+        return y[12] < y[0]
 
-    def _is_bas(self, landmarks):
+    def _is_bas(self, pose):
         """
         Vérifie si le signe est "Bas"
         """
+        if not self._has_handshape(pose, "00001", False, "bas"):
+            return False
+        y = pose.y
         # Vérifie si la main pointe vers le bas
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.y > wrist.y
+        return y[12] > y[0]
 
-    def _is_milieu(self, landmarks):
+    def _is_milieu(self, pose):
         """
         Vérifie si le signe est "Milieu"
         """
+        if not self._has_handshape(pose, "01110", False, "bas"):
+            return False
+        x, y = pose.x, pose.y
         # Vérifie si la main pointe vers le milieu
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return (abs(middle_tip.x - wrist.x) < 0.1 and 
-                abs(middle_tip.y - wrist.y) < 0.1)
+        return (abs(x[12] - x[0]) < 0.1 and 
+                abs(y[12] - y[0]) < 0.1)
 
-    def _is_debut(self, landmarks):
+    def _is_debut(self, pose):
         """
         Vérifie si le signe est "Début"
         """
+        if not self._has_handshape(pose, "00101", True, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main pointe vers le début
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x < wrist.x
+        return x[12] < x[0]
 
-    def _is_fin(self, landmarks):
+    def _is_fin(self, pose):
         """
         Vérifie si le signe est "Fin"
         """
+        if not self._has_handshape(pose, "01001", False, "bas"):
+            return False
+        x = pose.x
         # Vérifie si la main pointe vers la fin
-        wrist = landmarks.landmark[0]
-        middle_tip = landmarks.landmark[12]
-        return middle_tip.x > wrist.x
+        return x[12] > x[0]
 
-    def _is_rock_and_roll(self, landmarks):
+    def _is_rock_and_roll(self, pose):
         """
         Vérifie si le signe est "Rock and Roll"
         Le signe du rock and roll est fait avec l'index et l'auriculaire levés
         """
-        index_tip = landmarks.landmark[8]
-        pinky_tip = landmarks.landmark[20]
-        middle_tip = landmarks.landmark[12]
-        ring_tip = landmarks.landmark[16]
-        
+        if not self._has_handshape(pose, "11001", True, "bas"):
+            return False
+        y = pose.y
         # Vérifie si l'index et l'auriculaire sont levés
         # et si le majeur et l'annulaire sont baissés
-        return (index_tip.y < landmarks.landmark[6].y and  # Index levé
-                pinky_tip.y < landmarks.landmark[18].y and  # Auriculaire levé
-                middle_tip.y > landmarks.landmark[10].y and  # Majeur baissé
-                ring_tip.y > landmarks.landmark[14].y)  # Annulaire baissé
+        return (y[8] < y[6] and  # Index levé
+                y[20] < y[18] and  # Auriculaire levé
+                y[12] > y[10] and  # Majeur baissé
+                y[16] > y[14])  # Annulaire baissé
 
-    def _is_telephone(self, landmarks):
+    def _is_telephone(self, pose):
         """
         Vérifie si le signe est "Téléphone"
         Le signe du téléphone est fait avec le pouce et l'auriculaire formant un téléphone
         """
-        thumb_tip = landmarks.landmark[4]
-        pinky_tip = landmarks.landmark[20]
-        wrist = landmarks.landmark[0]
-        
+        x, y = pose.x, pose.y
         # Vérifie si le pouce et l'auriculaire sont proches l'un de l'autre
         # et si les autres doigts sont repliés
-        return (abs(thumb_tip.x - pinky_tip.x) < 0.1 and  # Pouce et auriculaire proches
-                abs(thumb_tip.y - pinky_tip.y) < 0.1 and  # Même hauteur
-                landmarks.landmark[8].y > landmarks.landmark[6].y and  # Index baissé
-                landmarks.landmark[12].y > landmarks.landmark[10].y and  # Majeur baissé
-                landmarks.landmark[16].y > landmarks.landmark[14].y)  # Annulaire baissé
+        return (abs(x[4] - x[20]) < 0.1 and  # Pouce et auriculaire proches
+                abs(y[4] - y[20]) < 0.1 and  # Même hauteur
+                y[8] > y[6] and  # Index baissé
+                y[12] > y[10] and  # Majeur baissé
+                y[16] > y[14])  # Annulaire baissé
+
+
+def vocabulary():
+    """
+    Toutes les réponses possibles de la reconnaissance : signes connus,
+    phrases, absence de main et signe non reconnu
+    """
+    signs = LSFRecognizer().sign_names()
+    return signs + list(LSFRecognizer.PHRASES) + [NO_HAND, UNKNOWN_SIGN]
+
 
-# Instance globale du reconnaisseur
-recognizer = LSFRecognizer()
+# Instance globale du reconnaisseur, créée à la première utilisation.
+# Le serveur WebSocket utilise une session par connexion (voir session.py).
+recognizer = None
 
 def recognize_lsf_sign(frame):
     """
     Fonction utilitaire pour reconnaître un signe LSF
     """
-    return recognizer.recognize_sign(frame) 
\ No newline at end of file
+    global recognizer
+    if recognizer is None:
+        recognizer = LSFRecognizer()
+    return recognizer.recognize_sign(frame)
@@ -0,0 +1,296 @@
+import asyncio
+import bisect
+import logging
+
+# Métriques du serveur au format texte Prometheus, exposées en HTTP sur /metrics
+# à côté du serveur WebSocket (voir start_metrics_server).
+
+logger = logging.getLogger('LSF_Metrics')
+
+# Bornes des histogrammes de durée, en secondes
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _format_labels(labelnames, labelvalues, extra=None):
+    pairs = list(zip(labelnames, labelvalues))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    inner = ",".join(f'{name}="{value}"' for name, value in pairs)
+    return "{" + inner + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def labels(self, *labelvalues):
+        """
+        Série de la métrique pour les valeurs d'étiquettes données
+        """
+        key = tuple(str(value) for value in labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} attend les étiquettes {self.labelnames}")
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _default(self):
+        return self._children[()]
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}"
+        ]
+        for labelvalues, child in sorted(self._children.items()):
+            lines.extend(self._render_child(labelvalues, child))
+        return lines
+
+
+class _CounterValue:
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterValue()
+
+    def inc(self, amount=1):
+        self._default().inc(amount)
+
+    def _render_child(self, labelvalues, child):
+        yield f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(child.value)}"
+
+
+class _GaugeValue:
+    def __init__(self):
+        self.value = 0.0
+        self.function = None
+
+    def set(self, value):
+        self.value = value
+
+    def set_function(self, function):
+        self.function = function
+
+    def get(self):
+        if self.function is not None:
+            return float(self.function())
+        return self.value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeValue()
+
+    def set(self, value):
+        self._default().set(value)
+
+    def set_function(self, function):
+        """
+        La valeur est calculée par function() à chaque lecture de /metrics
+        """
+        self._default().set_function(function)
+
+    def _render_child(self, labelvalues, child):
+        yield f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(child.get())}"
+
+
+class _HistogramValue:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS, registry=None):
+        self.buckets = tuple(buckets)
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value):
+        self._default().observe(value)
+
+    def _render_child(self, labelvalues, child):
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+            cumulative += count
+            labels = _format_labels(self.labelnames, labelvalues, ("le", _format_value(float(bound))))
+            yield f"{self.name}_bucket{labels} {cumulative}"
+        labels = _format_labels(self.labelnames, labelvalues)
+        yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+        yield f"{self.name}_count{labels} {child.count}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+
+    def render(self):
+        """
+        Toutes les métriques au format texte Prometheus
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# Métriques du serveur LSF
+STAGE_DURATION = Histogram(
+    "lsf_stage_duration_seconds",
+    "Durée de chaque étape du traitement d'une image",
+    ["stage"]
+)
+FRAME_DURATION = Histogram(
+    "lsf_frame_duration_seconds",
+    "Durée totale du traitement d'une image côté serveur (réception -> envoi de la réponse)"
+)
+FRAMES = Counter("lsf_frames_total", "Images (ou landmarks) traitées", ["format"])
+DROPPED_FRAMES = Counter("lsf_dropped_frames_total", "Images abandonnées (mode dernière image gagnante)")
+ERRORS = Counter("lsf_errors_total", "Erreurs renvoyées aux clients", ["type"])
+FRAME_CACHE = Counter(
+    "lsf_frame_cache_total",
+    "Recherches dans le cache des images en double",
+    ["result"]
+)
+FRAME_CACHE_HIT_RATIO = Gauge(
+    "lsf_frame_cache_hit_ratio",
+    "Part des images servies par le cache des images en double"
+)
+MOTION_GATE = Counter(
+    "lsf_motion_gate_total",
+    "Images examinées par la détection de mouvement (skipped : signe précédent réutilisé)",
+    ["result"]
+)
+MOTION_SKIP_RATIO = Gauge(
+    "lsf_motion_skip_ratio",
+    "Part des images sans mouvement pour lesquelles MediaPipe n'a pas été exécuté"
+)
+REJECTED_PAYLOADS = Counter(
+    "lsf_rejected_payloads_total",
+    "Images refusées avant décodage (format, dimensions)",
+    ["code"]
+)
+QUEUE_DEPTH = Gauge("lsf_queue_depth", "Images en attente ou en cours dans le pool d'inférence")
+ACTIVE_CLIENTS = Gauge("lsf_active_clients", "Clients WebSocket connectés")
+
+
+def _frame_cache_hit_ratio():
+    hits = sum(child.value for key, child in FRAME_CACHE._children.items() if key != ("miss",))
+    total = hits + FRAME_CACHE.labels("miss").value
+    return hits / total if total else 0.0
+
+
+FRAME_CACHE_HIT_RATIO.set_function(_frame_cache_hit_ratio)
+
+
+def _motion_skip_ratio():
+    skipped = MOTION_GATE.labels("skipped").value
+    total = skipped + MOTION_GATE.labels("processed").value
+    return skipped / total if total else 0.0
+
+
+MOTION_SKIP_RATIO.set_function(_motion_skip_ratio)
+
+
+def observe_stages(timings):
+    """
+    Enregistre les durées par étape retournées par le pool d'inférence
+    """
+    for stage, duration in timings.items():
+        STAGE_DURATION.labels(stage).observe(duration)
+    if "motion_skip" in timings:
+        MOTION_GATE.labels("skipped").inc()
+    elif "motion_check" in timings:
+        MOTION_GATE.labels("processed").inc()
+
+
+async def _handle_http(reader, writer, registry):
+    try:
+        try:
+            request_line = await reader.readline()
+            # Ignorer les en-têtes de la requête
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+        except (asyncio.LimitOverrunError, ValueError):
+            # Ligne plus longue que la limite du StreamReader (64 Kio) : requête
+            # refusée, la connexion est fermée sans lire la suite
+            request_line = b""
+        parts = request_line.split()
+        if len(parts) != 3 or not parts[2].startswith(b"HTTP/"):
+            status = "400 Bad Request"
+            body = b"Bad Request\n"
+        elif parts[0] == b"GET" and parts[1].split(b"?")[0] == b"/metrics":
+            status = "200 OK"
+            body = registry.render().encode("utf-8")
+        else:
+            status = "404 Not Found"
+            body = b"Not Found\n"
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode("ascii") + body
+        )
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(host, port, registry=REGISTRY):
+    """
+    Démarre le serveur HTTP des métriques (GET /metrics)
+    """
+    server = await asyncio.start_server(
+        lambda reader, writer: _handle_http(reader, writer, registry), host, port
+    )
+    logger.info(f"Métriques disponibles sur http://{host}:{port}/metrics")
+    return server
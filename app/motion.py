@@ -0,0 +1,52 @@
+import time
+import cv2
+from . import config
+
+# Détection de mouvement entre images : quand la scène n'a pas changé depuis
+# la dernière image traitée (pose tenue, caméra immobile), le signe précédent
+# est réutilisé sans MediaPipe ni parcours des signes connus.
+
+# Largeur de l'aperçu en niveaux de gris comparé d'une image à l'autre
+PREVIEW_WIDTH = 32
+
+
+class MotionGate:
+    """
+    Compare un aperçu minuscule en niveaux de gris de chaque image à celui
+    de la dernière image traitée. L'image est considérée inchangée si l'écart
+    absolu moyen reste sous le seuil ; une image est de toute façon traitée
+    au moins toutes les refresh_ms millisecondes.
+    """
+    def __init__(self, threshold=None, refresh_ms=None):
+        self.threshold = config.MOTION_THRESHOLD if threshold is None else threshold
+        refresh_ms = config.MOTION_REFRESH_MS if refresh_ms is None else refresh_ms
+        self.refresh = refresh_ms / 1000
+        self._reference = None
+        self._reference_time = 0.0
+
+    def _preview(self, frame, rgb):
+        height, width = frame.shape[:2]
+        size = (PREVIEW_WIDTH, max(1, round(PREVIEW_WIDTH * height / width)))
+        small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_RGB2GRAY if rgb else cv2.COLOR_BGR2GRAY)
+
+    def changed(self, frame, rgb=False):
+        """
+        True si l'image doit être traitée (mouvement, première image ou
+        rafraîchissement forcé) ; elle devient alors la nouvelle référence
+        """
+        preview = self._preview(frame, rgb)
+        now = time.monotonic()
+        if (
+            self._reference is None
+            or self._reference.shape != preview.shape
+            or now - self._reference_time >= self.refresh
+            or cv2.absdiff(preview, self._reference).mean() > self.threshold
+        ):
+            self._reference = preview
+            self._reference_time = now
+            return True
+        return False
+
+    def reset(self):
+        self._reference = None
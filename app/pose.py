@@ -0,0 +1,92 @@
+from functools import cached_property
+import numpy as np
+from .landmarks import NUM_LANDMARKS
+
+# Pose de la main pour une image : les landmarks sont convertis une seule fois
+# en tableau (21, 3) float32, et les grandeurs dérivées utilisées par les
+# prédicats de LSFRecognizer sont calculées à la première demande puis gardées.
+
+WRIST = 0
+# Index, majeur, annulaire, auriculaire
+FINGER_MCPS = (5, 9, 13, 17)
+FINGER_PIPS = (6, 10, 14, 18)
+FINGER_DIPS = (7, 11, 15, 19)
+FINGER_TIPS = (8, 12, 16, 20)
+
+
+class HandPose:
+    """
+    Landmarks d'une main : points (21, 3) float32 en coordonnées normalisées,
+    x / y / z en flottants Python pour les comparaisons scalaires, et
+    grandeurs dérivées mises en cache (une valeur par doigt, de l'index à
+    l'auriculaire)
+    """
+    def __init__(self, points):
+        self.points = np.asarray(points, dtype=np.float32).reshape(NUM_LANDMARKS, 3)
+        # Valeurs float32 converties exactement en flottants Python : mêmes
+        # résultats que les comparaisons sur les landmarks MediaPipe
+        self.x, self.y, self.z = self.points.T.tolist()
+
+    @classmethod
+    def from_landmarks(cls, landmarks):
+        """
+        Pose à partir de landmarks MediaPipe (NormalizedLandmarkList),
+        ou d'une HandPose (retournée telle quelle)
+        """
+        if isinstance(landmarks, cls):
+            return landmarks
+        # Une seule lecture de chaque champ protobuf (accès coûteux)
+        return cls([(point.x, point.y, point.z) for point in landmarks.landmark])
+
+    # Grandeurs par doigt utilisées par les prédicats : tuples de 4 valeurs
+    # Python (index, majeur, annulaire, auriculaire), calculés sur x / y en
+    # double précision, comme sur les landmarks MediaPipe
+
+    @cached_property
+    def tips_below_pip(self):
+        """
+        Doigts repliés : bout sous l'articulation PIP
+        """
+        y = self.y
+        return tuple(y[tip] > y[pip] for tip, pip in zip(FINGER_TIPS, FINGER_PIPS))
+
+    @cached_property
+    def tips_above_mcp(self):
+        y = self.y
+        return tuple(y[tip] < y[mcp] for tip, mcp in zip(FINGER_TIPS, FINGER_MCPS))
+
+    @cached_property
+    def tips_below_mcp(self):
+        y = self.y
+        return tuple(y[tip] > y[mcp] for tip, mcp in zip(FINGER_TIPS, FINGER_MCPS))
+
+    @cached_property
+    def tips_above_wrist(self):
+        y = self.y
+        return tuple(y[tip] < y[WRIST] for tip in FINGER_TIPS)
+
+    @cached_property
+    def tips_below_wrist(self):
+        y = self.y
+        return tuple(y[tip] > y[WRIST] for tip in FINGER_TIPS)
+
+    @cached_property
+    def tip_dip_dx(self):
+        """
+        Écart horizontal absolu entre le bout de chaque doigt et son articulation DIP
+        """
+        x = self.x
+        return tuple(abs(x[tip] - x[dip]) for tip, dip in zip(FINGER_TIPS, FINGER_DIPS))
+
+    @cached_property
+    def tip_wrist_dx(self):
+        """
+        Écart horizontal absolu entre le bout de chaque doigt et le poignet
+        """
+        x = self.x
+        return tuple(abs(x[tip] - x[WRIST]) for tip in FINGER_TIPS)
+
+    @cached_property
+    def tip_wrist_dy(self):
+        y = self.y
+        return tuple(abs(y[tip] - y[WRIST]) for tip in FINGER_TIPS)
@@ -0,0 +1,162 @@
+import struct
+from collections import namedtuple
+import numpy as np
+from .landmarks import NUM_LANDMARKS
+
+# Protocole binaire des images envoyées par le client.
+#
+# Un message binaire WebSocket est composé d'un en-tête fixe de 16 octets
+# (big-endian) suivi des octets bruts de l'image :
+#
+#   version    uint8   version du protocole (PROTOCOL_VERSION)
+#   format     uint8   format de la charge utile (FORMAT_*)
+#   flags      uint16  réservé, 0
+#   frame_id   uint32  identifiant de l'image, renvoyé dans la réponse
+#   timestamp  uint64  horodatage client en millisecondes, renvoyé dans la réponse
+#
+# Formats YUV bruts (caméra mobile, sans compression) : la charge utile commence
+# par un sous-en-tête YUV_HEADER de 8 octets (big-endian) :
+#   width      uint16  largeur de l'image (paire)
+#   height     uint16  hauteur de l'image (paire)
+#   y_stride   uint16  octets par ligne du plan Y
+#   uv_stride  uint16  octets par ligne du plan chroma (NV21/NV12 : plan VU/UV
+#                      entrelacé ; I420 : chacun des plans U et V)
+# suivi des plans, à la suite : Y (y_stride × height), puis
+#   FORMAT_NV21 / FORMAT_NV12  VU / UV entrelacé (uv_stride × height / 2)
+#   FORMAT_I420                U puis V (uv_stride × height / 2 chacun)
+#
+# Formats flux vidéo : la charge utile est un morceau quelconque d'un flux
+# continu, transmis dans l'ordre au décodeur de la session (un seul décodeur
+# ouvert par connexion ; message JSON {"type": "stream_end"} pour le fermer) :
+#   FORMAT_MJPEG_STREAM  images JPEG concaténées
+#   FORMAT_H264_STREAM   H.264 Annex B (nécessite le paquet optionnel PyAV)
+# La réponse porte le signe de la dernière image complète du morceau ; un
+# morceau qui ne termine aucune image ne reçoit pas de réponse.
+#
+# Formats landmarks : le client a déjà détecté la main sur l'appareil et envoie
+# les 21 landmarks (x, y, z) normalisés, en little-endian, ligne par ligne :
+#   FORMAT_LANDMARKS_F32  21 × 3 float32 (252 octets)
+#   FORMAT_LANDMARKS_I16  21 × 3 int16 quantifiés, valeur = entier × LANDMARK_I16_SCALE (126 octets)
+# Le serveur saute alors le décodage de l'image et MediaPipe.
+#
+# Les messages texte JSON ({"type": "image", "data": "<base64>"}) restent acceptés.
+
+PROTOCOL_VERSION = 1
+
+FORMAT_JPEG = 1
+FORMAT_PNG = 2
+
+FORMAT_LANDMARKS_F32 = 16
+FORMAT_LANDMARKS_I16 = 17
+
+FORMAT_I420 = 32
+FORMAT_NV21 = 33
+FORMAT_NV12 = 34
+
+FORMAT_MJPEG_STREAM = 48
+FORMAT_H264_STREAM = 49
+
+FORMAT_NAMES = {
+    FORMAT_JPEG: "jpeg",
+    FORMAT_PNG: "png",
+    FORMAT_LANDMARKS_F32: "landmarks_f32",
+    FORMAT_LANDMARKS_I16: "landmarks_i16",
+    FORMAT_I420: "i420",
+    FORMAT_NV21: "nv21",
+    FORMAT_NV12: "nv12",
+    FORMAT_MJPEG_STREAM: "mjpeg",
+    FORMAT_H264_STREAM: "h264",
+}
+
+IMAGE_FORMATS = (FORMAT_JPEG, FORMAT_PNG)
+YUV_FORMATS = (FORMAT_I420, FORMAT_NV21, FORMAT_NV12)
+STREAM_FORMATS = (FORMAT_MJPEG_STREAM, FORMAT_H264_STREAM)
+LANDMARK_FORMATS = (FORMAT_LANDMARKS_F32, FORMAT_LANDMARKS_I16)
+
+# Pas de quantification des landmarks int16 (plage représentable : ±2)
+LANDMARK_I16_SCALE = 1.0 / 16384
+
+FRAME_HEADER = struct.Struct("!BBHIQ")
+
+YUV_HEADER = struct.Struct("!HHHH")
+
+# Disposition des plans d'une image YUV ("i420", "nv21" ou "nv12")
+YuvLayout = namedtuple("YuvLayout", ["layout", "width", "height", "y_stride", "uv_stride"])
+
+FrameHeader = namedtuple("FrameHeader", ["version", "format", "flags", "frame_id", "timestamp"])
+
+
+class ProtocolError(ValueError):
+    """
+    Message binaire mal formé
+    """
+
+
+def parse_frame(message):
+    """
+    Découpe un message binaire en (en-tête, charge utile) sans copier l'image
+    """
+    view = memoryview(message)
+    if len(view) < FRAME_HEADER.size:
+        raise ProtocolError(
+            f"Message binaire trop court : {len(view)} octets (en-tête de {FRAME_HEADER.size} octets)"
+        )
+    header = FrameHeader(*FRAME_HEADER.unpack_from(view))
+    if header.version != PROTOCOL_VERSION:
+        raise ProtocolError(f"Version de protocole non supportée : {header.version}")
+    payload = view[FRAME_HEADER.size:]
+    if not payload:
+        raise ProtocolError("Image vide dans le message binaire.")
+    return header, payload
+
+
+def unpack_yuv(payload, frame_format):
+    """
+    Lit le sous-en-tête d'une image YUV et vérifie la taille des plans.
+    Retourne (YuvLayout, plans sans copie).
+    """
+    if len(payload) < YUV_HEADER.size:
+        raise ProtocolError("Sous-en-tête YUV manquant.")
+    width, height, y_stride, uv_stride = YUV_HEADER.unpack_from(payload)
+    if width == 0 or height == 0 or width % 2 or height % 2:
+        raise ProtocolError(f"Dimensions YUV invalides : {width}x{height} (paires et non nulles)")
+    layout = FORMAT_NAMES[frame_format]
+    chroma_width = width if layout != "i420" else width // 2
+    if y_stride < width or uv_stride < chroma_width:
+        raise ProtocolError(f"Pas de ligne YUV invalide : y={y_stride}, uv={uv_stride}")
+    chroma_planes = 2 if layout == "i420" else 1
+    expected = y_stride * height + chroma_planes * uv_stride * (height // 2)
+    planes = payload[YUV_HEADER.size:]
+    if len(planes) < expected:
+        raise ProtocolError(f"Image YUV tronquée : {len(planes)} octets (attendu : {expected})")
+    return YuvLayout(layout, width, height, y_stride, uv_stride), planes[:expected]
+
+
+def unpack_landmarks(payload, frame_format):
+    """
+    Convertit la charge utile d'un message landmarks en tableau (21, 3) float32
+    """
+    if frame_format == FORMAT_LANDMARKS_F32:
+        dtype = np.dtype("<f4")
+    elif frame_format == FORMAT_LANDMARKS_I16:
+        dtype = np.dtype("<i2")
+    else:
+        raise ProtocolError(f"Format de landmarks non supporté : {frame_format}")
+    expected = NUM_LANDMARKS * 3 * dtype.itemsize
+    if len(payload) != expected:
+        raise ProtocolError(
+            f"Taille de landmarks invalide : {len(payload)} octets (attendu : {expected})"
+        )
+    points = np.frombuffer(payload, dtype).reshape(NUM_LANDMARKS, 3)
+    if frame_format == FORMAT_LANDMARKS_I16:
+        return points.astype(np.float32) * np.float32(LANDMARK_I16_SCALE)
+    if not np.isfinite(points).all():
+        raise ProtocolError("Landmarks invalides (NaN ou infini).")
+    return points.astype(np.float32)
+
+
+def pack_frame(payload, frame_format=FORMAT_JPEG, frame_id=0, timestamp=0, flags=0):
+    """
+    Construit un message binaire (utilisé par les clients de test et les benchmarks)
+    """
+    return FRAME_HEADER.pack(PROTOCOL_VERSION, frame_format, flags, frame_id, timestamp) + bytes(payload)
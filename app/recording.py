@@ -0,0 +1,111 @@
+import gzip
+import logging
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Enregistrement des sessions clientes, pour les rejouer hors ligne
+# (voir benchmarks/replay.py).
+#
+# Fichier .lsfrec : flux gzip commençant par RECORDING_MAGIC, suivi d'un
+# enregistrement par message reçu :
+#
+#   offset   float64  secondes depuis le début de la session
+#   kind     uint8    KIND_TEXT (message JSON) ou KIND_BINARY
+#   length   uint32   taille du message en octets
+#   data     length octets (UTF-8 pour les messages texte)
+
+RECORDING_MAGIC = b"LSFREC1\n"
+
+KIND_TEXT = 0
+KIND_BINARY = 1
+
+RECORD_HEADER = struct.Struct("!dBI")
+
+# Compression rapide : l'enregistrement ne doit pas ralentir le serveur
+COMPRESS_LEVEL = 1
+
+logger = logging.getLogger('LSF_Recorder')
+
+
+def _encode_record(offset, message):
+    if isinstance(message, str):
+        kind, data = KIND_TEXT, message.encode("utf-8")
+    else:
+        kind, data = KIND_BINARY, bytes(message)
+    return RECORD_HEADER.pack(offset, kind, len(data)) + data
+
+
+class SessionRecorder:
+    """
+    Écrit les messages reçus d'une connexion, avec leur instant d'arrivée.
+    La compression et l'écriture se font dans un thread dédié, hors de la
+    boucle asyncio ; après une erreur d'écriture, l'enregistrement s'arrête
+    (failed) sans interrompre la connexion.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.failed = False
+        self._file = gzip.open(path, "wb", compresslevel=COMPRESS_LEVEL)
+        self._start = time.perf_counter()
+        # Un seul worker : les messages sont écrits dans l'ordre de réception
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lsf-recorder")
+        self._writer.submit(self._write, RECORDING_MAGIC)
+
+    def write(self, message):
+        if not self.failed:
+            self._writer.submit(self._write_message, time.perf_counter() - self._start, message)
+
+    def _write_message(self, offset, message):
+        self._write(_encode_record(offset, message))
+
+    def _write(self, data):
+        if self.failed:
+            return
+        try:
+            self._file.write(data)
+        except OSError as error:
+            self.failed = True
+            logger.error(f"Enregistrement de session arrêté ({self.path}) : {error}")
+
+    def close(self):
+        self._writer.submit(self._close)
+        self._writer.shutdown(wait=False)
+
+    def _close(self):
+        try:
+            self._file.close()
+        except OSError as error:
+            logger.error(f"Enregistrement de session incomplet ({self.path}) : {error}")
+
+
+def write_recording(path, records):
+    """
+    Écrit une liste de (offset, message) dans un fichier .lsfrec
+    """
+    with gzip.open(path, "wb", compresslevel=COMPRESS_LEVEL) as f:
+        f.write(RECORDING_MAGIC)
+        for offset, message in records:
+            f.write(_encode_record(offset, message))
+
+
+def read_recording(path):
+    """
+    Lit un fichier .lsfrec et retourne la liste des (offset, message)
+    """
+    records = []
+    with gzip.open(path, "rb") as f:
+        if f.read(len(RECORDING_MAGIC)) != RECORDING_MAGIC:
+            raise ValueError(f"{path} n'est pas un enregistrement de session LSF")
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if not header:
+                break
+            if len(header) < RECORD_HEADER.size:
+                raise ValueError(f"Enregistrement tronqué : {path}")
+            offset, kind, length = RECORD_HEADER.unpack(header)
+            data = f.read(length)
+            if len(data) < length:
+                raise ValueError(f"Enregistrement tronqué : {path}")
+            records.append((offset, data.decode("utf-8") if kind == KIND_TEXT else data))
+    return records
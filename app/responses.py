@@ -0,0 +1,68 @@
+import json
+from . import config
+
+# orjson (sérialisation JSON en Rust) est optionnel
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Réponses envoyées aux clients. Le vocabulaire des signes est petit et fixe :
+# la réponse sign_detected de chaque signe est sérialisée une fois pour toutes,
+# seuls les champs numériques (frame_id, timestamp, dropped_frames) sont
+# ajoutés à chaque image. Les réponses restent des messages texte.
+
+
+def _use_orjson():
+    name = config.JSON_LIBRARY
+    if name == "auto":
+        return orjson is not None
+    if name == "orjson":
+        if orjson is None:
+            raise RuntimeError("orjson n'est pas installé (pip install orjson)")
+        return True
+    if name == "json":
+        return False
+    raise ValueError(f"Bibliothèque JSON inconnue : {name}")
+
+
+if _use_orjson():
+    def dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+    loads = orjson.loads
+else:
+    dumps = json.dumps
+    loads = json.loads
+
+
+class SignResponses:
+    """
+    Réponses sign_detected pré-sérialisées, une par signe. Le début de la
+    réponse (type et signe) est calculé à la première utilisation d'un signe,
+    ou à l'avance pour tout le vocabulaire.
+    """
+    def __init__(self, signs=()):
+        self._prefixes = {}
+        for sign in signs:
+            self._prefix(sign)
+
+    def _prefix(self, sign):
+        prefix = self._prefixes.get(sign)
+        if prefix is None:
+            prefix = json.dumps({"type": "sign_detected", "sign": sign})[:-1]
+            self._prefixes[sign] = prefix
+        return prefix
+
+    def render(self, sign, fields=None):
+        """
+        Réponse sign_detected ; fields : champs entiers ajoutés après le signe
+        (mêmes clés et même ordre qu'un json.dumps du dictionnaire complet)
+        """
+        prefix = self._prefix(sign)
+        if not fields:
+            return prefix + "}"
+        return prefix + "".join(f', "{key}": {int(value)}' for key, value in fields.items()) + "}"
+
+    def __len__(self):
+        return len(self._prefixes)
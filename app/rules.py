@@ -0,0 +1,699 @@
+import ast
+from collections import namedtuple
+import numpy as np
+from .landmarks import NUM_LANDMARKS
+
+# Signes définis comme des conjonctions de comparaisons sur les coordonnées
+# des landmarks, ex. "y8 < y6" (bout de l'index au-dessus de son articulation
+# PIP), "abs(x8 - x12) < 0.05" ou "y0 < 0.3". Toutes les conditions du
+# vocabulaire sont compilées en une seule matrice de comparaison : une image
+# coûte une dizaine d'opérations NumPy, quel que soit le nombre de signes.
+#
+# Grammaire d'une condition :
+#   terme      := x<i> | y<i> | z<i> | nombre | terme - terme | abs(terme)
+#   condition  := terme op terme [op terme]     op : <, >, !=
+# Chaque ligne de la matrice a au plus deux coefficients non nuls (+1 et -1) :
+# elle est stockée sous forme de deux index dans le vecteur de
+# caractéristiques, et le calcul en float64 donne exactement le même résultat
+# que la comparaison Python équivalente sur les landmarks.
+
+# Vecteur de caractéristiques : les points (x, y, z) 0 à 20 à la suite, 0, puis
+# les constantes soustraites dans les conditions (ex. 0.5 pour "abs(x0 - 0.5)")
+AXES = "xyz"
+NUM_COORDINATES = len(AXES) * NUM_LANDMARKS
+_ZERO = NUM_COORDINATES
+_CONSTANT = -1  # Clé des constantes dans les termes analysés
+
+_LT, _GT, _NE = 0, 1, 2
+_OPS = {ast.Lt: _LT, ast.Gt: _GT, ast.NotEq: _NE}
+# a < b s'écrit b > a, pour garder la constante à droite
+_SWAPPED = {_LT: _GT, _GT: _LT, _NE: _NE}
+
+
+class RuleError(ValueError):
+    """
+    Condition hors de la grammaire des règles
+    """
+
+
+def _feature(name):
+    axis, index = name[:1], name[1:]
+    if axis not in AXES or not index.isdigit() or int(index) >= NUM_LANDMARKS:
+        raise RuleError(f"Coordonnée inconnue : {name}")
+    return int(index) * len(AXES) + AXES.index(axis)
+
+
+def _linear(node):
+    """
+    Terme sans abs : dictionnaire {caractéristique: coefficient}
+    """
+    if isinstance(node, ast.Name):
+        return {_feature(node.id): 1.0}
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return {_CONSTANT: float(node.value)} if node.value else {}
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return {key: -value for key, value in _linear(node.operand).items()}
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Sub):
+        terms = dict(_linear(node.left))
+        for key, value in _linear(node.right).items():
+            terms[key] = terms.get(key, 0.0) - value
+        return {key: value for key, value in terms.items() if value}
+    raise RuleError(f"Terme non supporté : {ast.unparse(node)}")
+
+
+def _term(node):
+    """
+    Terme d'une comparaison : (coefficients, abs)
+    """
+    if (
+        isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+        and node.func.id == "abs" and len(node.args) == 1 and not node.keywords
+    ):
+        return _linear(node.args[0]), True
+    return _linear(node), False
+
+
+def _constant(terms):
+    if set(terms) - {_CONSTANT}:
+        return None
+    return terms.get(_CONSTANT, 0.0)
+
+
+def _comparison(left, op, right, source):
+    """
+    Une comparaison élémentaire : (coefficients, abs, op, seuil)
+    """
+    (left_terms, left_abs), (right_terms, right_abs) = left, right
+    threshold = _constant(right_terms)
+    if threshold is not None and not right_abs:
+        terms, use_abs = left_terms, left_abs
+    elif _constant(left_terms) is not None and not left_abs:
+        # 0.05 < abs(...) : constante à gauche
+        terms, use_abs, op = right_terms, right_abs, _SWAPPED[op]
+        threshold = _constant(left_terms)
+    elif not left_abs and not right_abs:
+        # x8 < x6  ->  x8 - x6 < 0
+        terms = dict(left_terms)
+        for key, value in right_terms.items():
+            terms[key] = terms.get(key, 0.0) - value
+        terms = {key: value for key, value in terms.items() if value}
+        use_abs, threshold = False, 0.0
+    else:
+        raise RuleError(f"Comparaison non supportée : {source}")
+    if len(terms) > 2:
+        raise RuleError(f"Plus de deux valeurs dans une comparaison : {source}")
+    return terms, use_abs, op, float(threshold)
+
+
+def parse_condition(source):
+    """
+    Condition texte -> liste de comparaisons élémentaires
+    (une par opérateur : "0.05 < abs(x8 - x7) < 0.15" en donne deux)
+    """
+    try:
+        node = ast.parse(source.strip(), mode="eval").body
+    except SyntaxError as error:
+        raise RuleError(f"Condition invalide : {source}") from error
+    if not isinstance(node, ast.Compare):
+        raise RuleError(f"Comparaison attendue : {source}")
+    operands = [_term(operand) for operand in [node.left] + node.comparators]
+    comparisons = []
+    for index, op in enumerate(node.ops):
+        if type(op) not in _OPS:
+            raise RuleError(f"Opérateur non supporté dans : {source}")
+        comparisons.append(_comparison(
+            operands[index], _OPS[type(op)], operands[index + 1], source
+        ))
+    return comparisons
+
+
+# Comparaison élémentaire compilée : f[plus] - f[minus] (en valeur absolue si
+# abs), comparée au seuil par < (less) ou > ; f est le vecteur de caractéristiques
+Comparison = namedtuple("Comparison", ["plus", "minus", "abs", "less", "threshold"])
+
+
+def _indexes(terms, constants):
+    """
+    Coefficients (+1 / -1) d'une comparaison -> (index +1, index -1)
+    """
+    positive = [key for key, value in terms.items() if value == 1.0 and key != _CONSTANT]
+    negative = [key for key, value in terms.items() if value == -1.0 and key != _CONSTANT]
+    constant = terms.get(_CONSTANT)
+    if len(positive) + len(negative) + (constant is not None) != len(terms):
+        raise RuleError("Coefficients autres que +1 / -1 non supportés")
+    if constant is not None:
+        # x - 0.5 : la constante 0.5 est soustraite
+        if negative or len(positive) != 1:
+            raise RuleError("Une constante ne se combine qu'avec une coordonnée positive")
+        if -constant not in constants:
+            constants.append(-constant)
+        negative = [_ZERO + 1 + constants.index(-constant)]
+    if len(positive) > 1 or len(negative) > 1:
+        raise RuleError("Comparaison non supportée")
+    return (positive[0] if positive else _ZERO), (negative[0] if negative else _ZERO)
+
+
+def compile_definitions(definitions, constants=None):
+    """
+    definitions : {signe: [condition, ...]}, dans l'ordre de priorité.
+    Retourne (signes, comparisons de chaque signe, constantes) ; les
+    comparaisons sont normalisées (y6 > y8 et y8 < y6 donnent la même) pour que
+    les conditions partagées entre signes soient reconnues. constants : liste
+    de constantes d'une compilation précédente, complétée (index partagés)
+    """
+    signs, comparisons = [], []
+    if constants is None:
+        constants = []
+    else:
+        constants = constants[1:]
+    for sign, conditions in definitions.items():
+        if isinstance(conditions, str):
+            conditions = [conditions]
+        compiled = []
+        for condition in conditions:
+            try:
+                for terms, use_abs, op, threshold in parse_condition(condition):
+                    plus, minus = _indexes(terms, constants)
+                    if op == _NE:
+                        # a != t  <=>  abs(a - t) > 0
+                        if threshold:
+                            raise RuleError("!= ne compare que deux valeurs entre elles")
+                        use_abs, op = True, _GT
+                    if minus < plus and minus != _ZERO:
+                        # abs(b - a) = abs(a - b), et b - a < t  <=>  a - b > -t
+                        plus, minus = minus, plus
+                        if not use_abs:
+                            op, threshold = _SWAPPED[op], -threshold
+                    compiled.append(Comparison(plus, minus, use_abs, op == _LT, threshold + 0.0))
+            except RuleError as error:
+                raise RuleError(f"{sign} : {error}") from None
+        if not compiled:
+            raise RuleError(f"{sign} : aucune condition")
+        signs.append(sign)
+        comparisons.append(compiled)
+    return signs, comparisons, [0.0] + constants
+
+
+def describe(comparison, constants):
+    """
+    Texte d'une comparaison compilée, ex. "abs(x8 - x12) < 0.05"
+    """
+    def name(index):
+        if index >= _ZERO:
+            return repr(constants[index - _ZERO])
+        return f"{AXES[index % len(AXES)]}{index // len(AXES)}"
+
+    plus, minus = name(comparison.plus), name(comparison.minus)
+    operator = "<" if comparison.less else ">"
+    if comparison.minus < _ZERO and comparison.threshold == 0:
+        # Comparaison de deux coordonnées : "y8 < y6", "x8 != x0"
+        if comparison.abs:
+            return f"{plus} != {minus}" if not comparison.less else f"abs({plus} - {minus}) < 0.0"
+        return f"{plus} {operator} {minus}"
+    text = plus if comparison.minus == _ZERO else f"{plus} - {minus}"
+    if comparison.abs:
+        text = f"abs({text})"
+    return f"{text} {operator} {comparison.threshold!r}"
+
+
+class CompiledRules:
+    """
+    Vocabulaire compilé : une ligne de la matrice de comparaison par
+    comparaison élémentaire, les lignes d'un même signe étant contiguës.
+    L'ordre des signes est celui des définitions (priorité au premier signe
+    reconnu).
+    """
+    def __init__(self, definitions):
+        """
+        definitions : {signe: [condition, ...]}, dans l'ordre de priorité
+        """
+        self.signs, comparisons, constants = compile_definitions(definitions)
+        rows = [row for compiled in comparisons for row in compiled]
+        self.plus = np.array([row.plus for row in rows], dtype=np.intp)
+        self.minus = np.array([row.minus for row in rows], dtype=np.intp)
+        # abs(a) = max(a, -a) : -1 sur les lignes en abs, 1 ailleurs
+        self.abs_factors = np.array([-1.0 if row.abs else 1.0 for row in rows])
+        # Toutes les comparaisons en "<" : a > t  <=>  -a < -t
+        self.directions = np.array([1.0 if row.less else -1.0 for row in rows])
+        self.thresholds = self.directions * [row.threshold for row in rows]
+        self.constants = np.array(constants)
+        self.counts = np.array([len(compiled) for compiled in comparisons], dtype=np.intp)
+        self.starts = np.cumsum(self.counts) - self.counts
+
+    def __len__(self):
+        return len(self.signs)
+
+    def features(self, pose):
+        """
+        Vecteur de caractéristiques (float64) d'une HandPose
+        """
+        return np.concatenate((pose.points.ravel(), self.constants))
+
+    def conditions(self, features):
+        """
+        Résultat (bool) de chaque comparaison élémentaire
+        """
+        values = features[self.plus] - features[self.minus]
+        np.maximum(values, values * self.abs_factors, out=values)
+        values *= self.directions
+        return values < self.thresholds
+
+    def evaluate(self, pose):
+        """
+        Vecteur booléen : signes dont toutes les conditions sont vraies
+        """
+        return np.logical_and.reduceat(self.conditions(self.features(pose)), self.starts)
+
+    def scores(self, pose):
+        """
+        Part des conditions vraies pour chaque signe (1.0 = signe reconnu)
+        """
+        satisfied = np.add.reduceat(self.conditions(self.features(pose)), self.starts)
+        return satisfied / self.counts
+
+    def match(self, pose):
+        """
+        Premier signe reconnu dans l'ordre de priorité, ou None
+        """
+        matched = self.evaluate(pose)
+        index = int(matched.argmax())
+        return self.signs[index] if matched[index] else None
+
+
+# Connaissance accumulée sur une valeur f[plus] - f[minus] (ou sa valeur
+# absolue) le long d'un chemin de l'arbre : bornes (inférieure, stricte,
+# supérieure, stricte). Un test déjà tranché par les bornes n'est pas réévalué
+# (ex. y0 < 0.25 vrai implique y0 < 0.3 vrai).
+_UNBOUNDED = (-np.inf, False, np.inf, False)
+_NON_NEGATIVE = (0.0, False, np.inf, False)
+
+
+def _expression(test):
+    return test.plus, test.minus, test.abs
+
+
+def _outcome(test, bounds):
+    """
+    Résultat du test déduit des bornes : True, False ou None (inconnu)
+    """
+    low, low_strict, high, high_strict = bounds
+    threshold = test.threshold
+    if test.less:
+        if high < threshold or (high == threshold and high_strict):
+            return True
+        if low >= threshold:
+            return False
+    else:
+        if low > threshold or (low == threshold and low_strict):
+            return True
+        if high <= threshold:
+            return False
+    return None
+
+
+def _learn(test, outcome, bounds):
+    """
+    Bornes après le résultat d'un test
+    """
+    low, low_strict, high, high_strict = bounds
+    threshold = test.threshold
+    if test.less == outcome:
+        # valeur < seuil (test "<" vrai) ou valeur <= seuil (test ">" faux)
+        strict = test.less
+        if threshold < high or (threshold == high and strict):
+            high, high_strict = threshold, strict
+    else:
+        # valeur > seuil (test ">" vrai) ou valeur >= seuil (test "<" faux)
+        strict = not test.less
+        if threshold > low or (threshold == low and strict):
+            low, low_strict = threshold, strict
+    return low, low_strict, high, high_strict
+
+
+def _initial_bounds(test):
+    return _NON_NEGATIVE if test.abs else _UNBOUNDED
+
+
+def _list_index(index):
+    """
+    Index du vecteur de caractéristiques -> index dans pose.x + pose.y + pose.z
+    """
+    if index >= _ZERO:
+        return index
+    return (index % len(AXES)) * NUM_LANDMARKS + index // len(AXES)
+
+
+class DecisionTree:
+    """
+    Vocabulaire compilé en arbre de décision : chaque nœud évalue une
+    comparaison élémentaire, partagée par tous les signes encore possibles,
+    et les feuilles donnent le premier signe reconnu dans l'ordre de priorité
+    (ou None). Les sous-arbres identiques sont partagés (DAG). Sur un chemin,
+    une comparaison n'est évaluée qu'une fois, et pas du tout si les
+    comparaisons précédentes la tranchent déjà.
+    """
+    # Au-delà, les définitions sont refusées (arbre trop grand à construire)
+    MAX_NODES = 200000
+
+    def __init__(self, definitions):
+        self.signs, comparisons, self.constants = compile_definitions(definitions)
+        self.tests = list(dict.fromkeys(test for compiled in comparisons for test in compiled))
+        index = {test: position for position, test in enumerate(self.tests)}
+        self._sign_tests = [
+            tuple(dict.fromkeys(index[test] for test in compiled)) for compiled in comparisons
+        ]
+        self.node_count = 0
+        self.test_nodes = [0] * len(self.tests)  # Nombre de nœuds par comparaison
+        self._memo = {}
+        try:
+            self.root = self._build(tuple(range(len(self.signs))), {})
+        except RecursionError:
+            raise RuleError("Définitions trop nombreuses pour l'arbre de décision") from None
+        finally:
+            del self._memo
+
+    def _bounds(self, test_id, knowledge):
+        test = self.tests[test_id]
+        return knowledge.get(_expression(test), _initial_bounds(test))
+
+    def _build(self, candidates, knowledge):
+        # Signes encore possibles, avec leurs comparaisons non tranchées
+        live = []
+        for sign in candidates:
+            remaining = []
+            for test_id in self._sign_tests[sign]:
+                outcome = _outcome(self.tests[test_id], self._bounds(test_id, knowledge))
+                if outcome is False:
+                    break
+                if outcome is None:
+                    remaining.append(test_id)
+            else:
+                if not remaining and not live:
+                    return self.signs[sign]
+                live.append((sign, tuple(remaining)))
+        if not live:
+            return None
+
+        expressions = {_expression(self.tests[test_id]) for _, remaining in live for test_id in remaining}
+        key = (tuple(live), tuple(sorted(
+            (expression, bounds) for expression, bounds in knowledge.items()
+            if expression in expressions
+        )))
+        node = self._memo.get(key)
+        if node is not None:
+            return node
+
+        # Tester d'abord, parmi les comparaisons du premier signe possible,
+        # celle que partagent le plus de signes
+        shared = {}
+        for _, remaining in live:
+            for test_id in remaining:
+                shared[test_id] = shared.get(test_id, 0) + 1
+        test_id = max(live[0][1], key=shared.__getitem__)
+        test = self.tests[test_id]
+        self.node_count += 1
+        if self.node_count > self.MAX_NODES:
+            raise RuleError(f"Arbre de décision trop grand (plus de {self.MAX_NODES} nœuds)")
+        self.test_nodes[test_id] += 1
+
+        signs = [sign for sign, _ in live]
+        bounds = self._bounds(test_id, knowledge)
+        branches = []
+        for outcome in (True, False):
+            learned = dict(knowledge)
+            learned[_expression(test)] = _learn(test, outcome, bounds)
+            branches.append(self._build(signs, learned))
+        node = (
+            _list_index(test.plus), _list_index(test.minus), test.abs, test.less,
+            test.threshold, branches[0], branches[1]
+        )
+        self._memo[key] = node
+        return node
+
+    def __len__(self):
+        return len(self.signs)
+
+    def depth(self):
+        """
+        Nombre maximal de comparaisons évaluées pour une image
+        """
+        depths = {}
+
+        def visit(node):
+            if node.__class__ is not tuple:
+                return 0
+            if id(node) not in depths:
+                depths[id(node)] = 1 + max(visit(node[5]), visit(node[6]))
+            return depths[id(node)]
+
+        return visit(self.root)
+
+    def elimination(self):
+        """
+        Pour chaque comparaison : nombre de définitions qui l'utilisent, et
+        nombre de définitions éliminées lorsqu'elle est vraie ou fausse
+        (y compris par déduction : y0 < 0.25 vrai élimine les signes qui
+        exigent y0 > 0.3)
+        """
+        report = []
+        for test_id, test in enumerate(self.tests):
+            row = {
+                "condition": describe(test, self.constants),
+                "signs": sum(test_id in tests for tests in self._sign_tests),
+                "nodes": self.test_nodes[test_id],
+            }
+            for outcome in (True, False):
+                knowledge = {_expression(test): _learn(test, outcome, _initial_bounds(test))}
+                row[f"eliminated_if_{str(outcome).lower()}"] = sum(
+                    any(
+                        _outcome(self.tests[other], self._bounds(other, knowledge)) is False
+                        for other in tests
+                    )
+                    for tests in self._sign_tests
+                )
+            report.append(row)
+        return report
+
+    def shadowed(self):
+        """
+        Signes jamais retournés : {signe: signe prioritaire qui le masque}.
+        Un signe est masqué quand ses conditions impliquent toutes celles d'un
+        signe placé avant lui (ex. "malade" : y0 < 0.3, après "manger" :
+        y0 < 0.3), ou None si ses conditions sont contradictoires.
+        """
+        shadowed = {}
+        for sign, tests in enumerate(self._sign_tests):
+            knowledge = {}
+            for test_id in tests:
+                test = self.tests[test_id]
+                if _outcome(test, self._bounds(test_id, knowledge)) is False:
+                    shadowed[self.signs[sign]] = None
+                    break
+                knowledge[_expression(test)] = _learn(test, True, self._bounds(test_id, knowledge))
+            else:
+                for earlier in range(sign):
+                    if all(
+                        _outcome(self.tests[test_id], self._bounds(test_id, knowledge)) is True
+                        for test_id in self._sign_tests[earlier]
+                    ):
+                        shadowed[self.signs[sign]] = self.signs[earlier]
+                        break
+        return shadowed
+
+    def unreachable(self):
+        """
+        Signes jamais retournés, dans l'ordre de priorité : masqués par un
+        seul signe (shadowed), ou par plusieurs signes prioritaires ensemble
+        (ex. "il" : x8 > 0.7, reconnu seulement quand une coordonnée tombe
+        exactement sur le seuil d'un signe placé avant lui). Les branches de
+        l'arbre où une valeur est réduite à un point (y12 - y0 vaut
+        exactement 0) ne comptent pas.
+        """
+        found = set()
+        visited = set()
+
+        def visit(candidates, knowledge):
+            # Même parcours que _build, sans construire les nœuds
+            live = []
+            for sign in candidates:
+                remaining = []
+                for test_id in self._sign_tests[sign]:
+                    outcome = _outcome(self.tests[test_id], self._bounds(test_id, knowledge))
+                    if outcome is False:
+                        break
+                    if outcome is None:
+                        remaining.append(test_id)
+                else:
+                    if not remaining and not live:
+                        found.add(sign)
+                        return
+                    live.append((sign, tuple(remaining)))
+            if not live:
+                return
+            expressions = {_expression(self.tests[test_id]) for _, remaining in live for test_id in remaining}
+            key = (tuple(live), tuple(sorted(
+                (expression, bounds) for expression, bounds in knowledge.items()
+                if expression in expressions
+            )))
+            if key in visited:
+                return
+            visited.add(key)
+            shared = {}
+            for _, remaining in live:
+                for test_id in remaining:
+                    shared[test_id] = shared.get(test_id, 0) + 1
+            test_id = max(live[0][1], key=shared.__getitem__)
+            test = self.tests[test_id]
+            bounds = self._bounds(test_id, knowledge)
+            signs = [sign for sign, _ in live]
+            for outcome in (True, False):
+                low, low_strict, high, high_strict = _learn(test, outcome, bounds)
+                if low < high:
+                    learned = dict(knowledge)
+                    learned[_expression(test)] = (low, low_strict, high, high_strict)
+                    visit(signs, learned)
+
+        visit(tuple(range(len(self.signs))), {})
+        return [name for sign, name in enumerate(self.signs) if sign not in found]
+
+    def match(self, pose):
+        """
+        Premier signe reconnu dans l'ordre de priorité, ou None
+        """
+        features = pose.x + pose.y + pose.z
+        features += self.constants
+        node = self.root
+        while node.__class__ is tuple:
+            plus, minus, use_abs, less, threshold, yes, no = node
+            value = features[plus] - features[minus]
+            if use_abs and value < 0:
+                value = -value
+            if less:
+                node = yes if value < threshold else no
+            else:
+                node = yes if value > threshold else no
+        return node
+
+
+# Code de forme de la main (HandshapeIndex) : une comparaison par bit
+HANDSHAPE = (
+    # Doigts tendus (bout au-dessus de l'articulation) : pouce, index, majeur,
+    # annulaire, auriculaire
+    "y4 < y3", "y8 < y6", "y12 < y10", "y16 < y14", "y20 < y18",
+    # Orientation : main vers le haut, main inclinée
+    "y12 < y0", "abs(x12 - x0) > 0.1",
+    # Position du poignet : haut, milieu ou bas de l'image
+    "y0 < 0.3", "y0 < 0.4",
+)
+
+
+def _node(test):
+    return _list_index(test.plus), _list_index(test.minus), test.abs, test.less, test.threshold
+
+
+class HandshapeIndex:
+    """
+    Vocabulaire indexé par code de forme de la main : les comparaisons de
+    HANDSHAPE (doigts tendus ou repliés, orientation, position) donnent un
+    code de quelques bits, calculé une fois par image. Pour chaque code, la
+    table donne les signes compatibles, dans l'ordre de priorité, avec les
+    seules comparaisons que le code ne tranche pas encore ; les autres signes
+    ne sont pas testés.
+    """
+    def __init__(self, definitions, handshape=HANDSHAPE):
+        self.signs, comparisons, constants = compile_definitions(definitions)
+        _, keys, self.constants = compile_definitions(
+            {condition: [condition] for condition in handshape}, constants
+        )
+        if any(len(compiled) != 1 for compiled in keys):
+            raise RuleError("Une seule comparaison par bit du code de forme de la main")
+        self.keys = [compiled[0] for compiled in keys]
+        self._key_nodes = [_node(key) for key in self.keys]
+
+        # Table : code -> ((signe, comparisons restantes), ...) ; les codes
+        # impossibles (ex. y0 < 0.3 vrai et y0 < 0.4 faux) restent vides
+        self.table = []
+        self.code_count = 0
+        for code in range(1 << len(self.keys)):
+            knowledge = self._knowledge(code)
+            candidates = []
+            if knowledge is not None:
+                self.code_count += 1
+                for sign, compiled in zip(self.signs, comparisons):
+                    remaining = []
+                    for test in compiled:
+                        outcome = _outcome(test, knowledge.get(_expression(test), _initial_bounds(test)))
+                        if outcome is False:
+                            break
+                        if outcome is None:
+                            remaining.append(_node(test))
+                    else:
+                        candidates.append((sign, tuple(remaining)))
+                        if not remaining:
+                            # Toujours reconnu avec ce code : les suivants sont masqués
+                            break
+            self.table.append(tuple(candidates))
+
+    def _knowledge(self, code):
+        """
+        Bornes déduites d'un code, ou None si le code est impossible
+        """
+        knowledge = {}
+        for bit, key in enumerate(self.keys):
+            outcome = bool(code >> bit & 1)
+            bounds = knowledge.get(_expression(key), _initial_bounds(key))
+            if _outcome(key, bounds) not in (None, outcome):
+                return None
+            knowledge[_expression(key)] = _learn(key, outcome, bounds)
+        return knowledge
+
+    def __len__(self):
+        return len(self.signs)
+
+    def mean_candidates(self):
+        """
+        Nombre moyen de signes candidats par code possible
+        """
+        return sum(len(candidates) for candidates in self.table) / max(self.code_count, 1)
+
+    def _features(self, pose):
+        features = pose.x + pose.y + pose.z
+        features += self.constants
+        return features
+
+    def code(self, pose, features=None):
+        """
+        Code de forme de la main : bit i = résultat de la comparaison HANDSHAPE[i]
+        """
+        if features is None:
+            features = self._features(pose)
+        code = 0
+        for bit, (plus, minus, use_abs, less, threshold) in enumerate(self._key_nodes):
+            value = features[plus] - features[minus]
+            if use_abs and value < 0:
+                value = -value
+            if (value < threshold) if less else (value > threshold):
+                code |= 1 << bit
+        return code
+
+    def candidates(self, pose):
+        """
+        Signes compatibles avec le code de la pose, dans l'ordre de priorité
+        """
+        return [sign for sign, _ in self.table[self.code(pose)]]
+
+    def match(self, pose):
+        """
+        Premier signe reconnu dans l'ordre de priorité, ou None
+        """
+        features = self._features(pose)
+        for sign, remaining in self.table[self.code(pose, features)]:
+            for plus, minus, use_abs, less, threshold in remaining:
+                value = features[plus] - features[minus]
+                if use_abs and value < 0:
+                    value = -value
+                if not ((value < threshold) if less else (value > threshold)):
+                    break
+            else:
+                return sign
+        return None
@@ -0,0 +1,106 @@
+import threading
+from contextlib import contextmanager
+from .buffers import FrameBuffers
+from .pose import HandPose
+from .lsf_recognizer import LSFRecognizer
+from .streams import create_stream_decoder
+
+
+class RecognitionSession:
+    """
+    Session de reconnaissance propre à une connexion WebSocket.
+    Elle possède son propre détecteur MediaPipe (mode suivi) et son propre
+    historique de signes, indépendants des autres clients.
+    """
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.recognizer = LSFRecognizer()
+        # Tampons réutilisés pour la conversion des images YUV
+        self.buffers = FrameBuffers()
+        # Décodeur du flux vidéo en cours (MJPEG ou H.264), ouvert au premier morceau
+        self.stream = None
+        # Tenu pendant chaque traitement et pendant la fermeture : MediaPipe
+        # ne doit pas être fermé par un thread pendant qu'un autre l'utilise.
+        # Réentrant : InferenceExecutor.run_inline le prend avant la tâche,
+        # qui le reprend dans use_session
+        self.lock = threading.RLock()
+        self.closed = False
+
+    def recognize(self, frame):
+        return self.recognizer.recognize_sign(frame)
+
+    def recognize_rgb(self, image_rgb):
+        """
+        Reconnaît le signe dans une image déjà en RGB (convertie depuis le YUV)
+        """
+        return self.recognizer.recognize_sign(image_rgb, rgb=True)
+
+    def recognize_landmarks(self, points):
+        """
+        Reconnaît le signe à partir des landmarks (21, 3) envoyés par le client
+        """
+        return self.recognizer.recognize_landmarks(HandPose(points))
+
+    def feed_stream(self, codec, chunk):
+        """
+        Transmet un morceau du flux vidéo au décodeur de la session ;
+        retourne les images complètes décodées (BGR pour MJPEG, RGB pour H.264)
+        """
+        if self.stream is None or self.stream.codec != codec:
+            self.close_stream()
+            self.stream = create_stream_decoder(codec)
+        return self.stream.feed(chunk)
+
+    def close_stream(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def close(self):
+        self.close_stream()
+        self.recognizer.close()
+        self.buffers.clear()
+
+
+# Sessions ouvertes dans ce processus (le serveur en mode thread,
+# ou chaque worker en mode process)
+_sessions = {}
+
+
+def open_session(session_id):
+    """
+    Crée la session de reconnaissance d'une connexion
+    """
+    _sessions[session_id] = RecognitionSession(session_id)
+
+
+def close_session(session_id):
+    """
+    Détruit la session de reconnaissance d'une connexion
+    """
+    session = _sessions.pop(session_id, None)
+    if session is not None:
+        # Attendre la fin de l'image en cours de traitement dans un autre thread
+        with session.lock:
+            session.closed = True
+            session.close()
+
+
+def get_session(session_id):
+    session = _sessions.get(session_id)
+    if session is None:
+        raise KeyError(f"Session de reconnaissance inconnue : {session_id}")
+    return session
+
+
+@contextmanager
+def use_session(session_id):
+    """
+    Session d'une connexion, réservée au thread appelant le temps du bloc
+    (close_session attend la fin du bloc)
+    """
+    session = get_session(session_id)
+    with session.lock:
+        if session.closed:
+            raise KeyError(f"Session de reconnaissance fermée : {session_id}")
+        yield session
@@ -0,0 +1,264 @@
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+import numpy as np
+from . import config
+from .landmarks import NUM_LANDMARKS
+from .pose import HandPose
+from .rules import CompiledRules, DecisionTree, HandshapeIndex, RuleError
+
+# PyYAML est optionnel (fichiers de règles .yaml / .yml)
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Définitions des signes, lues dans un fichier JSON (ou YAML) plutôt que dans
+# le code : ajouter ou corriger un signe ne demande pas de redéploiement.
+# Chaque signe est une liste de conditions sur les coordonnées normalisées des
+# landmarks (x<i>, y<i>, z<i> pour le point i, 0 = poignet, 4 = bout du pouce,
+# 8 / 12 / 16 / 20 = bouts de l'index / du majeur / de l'annulaire / de
+# l'auriculaire), toutes vraies pour que le signe soit reconnu ; l'ordre du
+# fichier est l'ordre de priorité. Voir rules.py pour la grammaire.
+#
+# {"signs": [{"name": "bonjour", "description": "...",
+#             "conditions": ["y8 < y6", "y12 < y10"]}, ...]}
+#
+# Un signe marqué "enabled": false est ignoré.
+
+logger = logging.getLogger('LSF_Rules')
+
+# Fichier fourni avec le serveur : les prédicats _is_* de LSFRecognizer
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "signs.json")
+
+# Compilation des définitions selon LSF_SIGN_MATCHER
+MATCHERS = {
+    "tree": DecisionTree,
+    "index": HandshapeIndex,
+    "matrix": CompiledRules,
+}
+
+
+def load_definitions(path):
+    """
+    Lit un fichier de règles ; retourne {signe: [condition, ...]} (signes
+    activés, dans l'ordre de priorité)
+    """
+    with open(path, encoding="utf-8") as rules_file:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise RuntimeError("PyYAML n'est pas installé (pip install pyyaml) : règles YAML indisponibles")
+            document = yaml.safe_load(rules_file)
+        else:
+            document = json.load(rules_file)
+
+    if not isinstance(document, dict) or not isinstance(document.get("signs"), list):
+        raise RuleError(f"{path} : liste \"signs\" attendue")
+    definitions = {}
+    for entry in document["signs"]:
+        name = entry.get("name") if isinstance(entry, dict) else None
+        if not isinstance(name, str) or not name:
+            raise RuleError(f"{path} : signe sans nom : {entry!r}")
+        conditions = entry.get("conditions")
+        if isinstance(conditions, str):
+            conditions = [conditions]
+        if not isinstance(conditions, list) or not all(isinstance(c, str) for c in conditions):
+            raise RuleError(f"{path} : {name} : liste \"conditions\" attendue")
+        if name in definitions:
+            raise RuleError(f"{path} : signe défini deux fois : {name}")
+        if entry.get("enabled", True):
+            definitions[name] = conditions
+    return definitions
+
+
+class SignRules:
+    """
+    Définitions d'un fichier de règles, compilées pour LSF_SIGN_MATCHER et
+    rechargées quand le fichier change (vérifié au plus toutes les
+    reload_ms millisecondes, 0 = jamais). En cas d'erreur dans le nouveau
+    fichier, les règles précédentes restent en place.
+    """
+    def __init__(self, path, matcher, reload_ms=0):
+        if matcher not in MATCHERS:
+            raise ValueError(f"Méthode de reconnaissance inconnue : {matcher}")
+        self.path = path
+        self.matcher = matcher
+        self.reload_interval = reload_ms / 1000
+        self._lock = threading.Lock()
+        self._mtime = os.stat(path).st_mtime_ns
+        self.rules = self._compile()
+        self._next_check = time.monotonic() + self.reload_interval
+
+    def _compile(self):
+        start = time.perf_counter()
+        rules = MATCHERS[self.matcher](load_definitions(self.path))
+        elapsed = (time.perf_counter() - start) * 1000
+        if isinstance(rules, DecisionTree):
+            logger.info(
+                f"Règles des signes chargées depuis {self.path} : {len(rules)} signes, "
+                f"{len(rules.tests)} comparaisons, arbre de {rules.node_count} nœuds ({elapsed:.0f} ms)"
+            )
+            unreachable = rules.unreachable()
+            if unreachable:
+                logger.warning(
+                    f"{len(unreachable)} signes jamais reconnus (masqués par les signes prioritaires) : "
+                    + ", ".join(unreachable)
+                )
+        elif isinstance(rules, HandshapeIndex):
+            logger.info(
+                f"Règles des signes chargées depuis {self.path} : {len(rules)} signes, "
+                f"{rules.code_count} codes de forme de la main, "
+                f"{rules.mean_candidates():.1f} candidats par code ({elapsed:.0f} ms)"
+            )
+        else:
+            logger.info(f"Règles des signes chargées depuis {self.path} : {len(rules)} signes ({elapsed:.0f} ms)")
+        return rules
+
+    def current(self):
+        """
+        Règles compilées à utiliser pour l'image courante
+        """
+        if self.reload_interval and time.monotonic() >= self._next_check:
+            self._check()
+        return self.rules
+
+    def _check(self):
+        # Un seul thread vérifie le fichier ; les autres gardent les règles en place
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = time.monotonic() + self.reload_interval
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError as error:
+                logger.warning(f"Fichier de règles illisible, règles inchangées : {error}")
+                return
+            if mtime == self._mtime:
+                return
+            try:
+                self.rules = self._compile()
+            except Exception as error:
+                # Toute erreur (syntaxe JSON / YAML, condition invalide, arbre trop
+                # grand...) : le fichier est refusé et les règles précédentes restent
+                logger.error(f"Règles des signes non rechargées ({self.path}) : {error}")
+            self._mtime = mtime
+        finally:
+            self._lock.release()
+
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def shared_rules(matcher=None, path=None):
+    """
+    Règles partagées par toutes les sessions du processus
+    (LSF_SIGN_RULES_PATH, LSF_SIGN_MATCHER, LSF_SIGN_RULES_RELOAD_MS)
+    """
+    matcher = matcher or config.SIGN_MATCHER
+    path = path or config.SIGN_RULES_PATH or DEFAULT_PATH
+    with _shared_lock:
+        rules = _shared.get((path, matcher))
+        if rules is None:
+            rules = SignRules(path, matcher, config.SIGN_RULES_RELOAD_MS)
+            _shared[(path, matcher)] = rules
+    return rules
+
+
+def predicates(recognizer, definitions):
+    """
+    Prédicats _is_* de LSFRecognizer des signes définis, {signe: prédicat}
+    dans l'ordre de priorité. Tous les signes doivent avoir un prédicat.
+    """
+    missing = [name for name in definitions if not hasattr(recognizer, f"_is_{name}")]
+    if missing:
+        raise RuleError(f"Signes sans prédicat _is_* : {', '.join(missing)}")
+    return {name: getattr(recognizer, f"_is_{name}") for name in definitions}
+
+
+def validate(definitions, count, seed=0):
+    """
+    Compare chaque méthode de LSF_SIGN_MATCHER aux prédicats _is_* de
+    LSFRecognizer sur des poses aléatoires ; retourne {méthode: nombre de
+    poses avec un signe différent}. Tous les signes doivent avoir un prédicat.
+    """
+    from .lsf_recognizer import LSFRecognizer
+
+    checks = list(predicates(LSFRecognizer(), definitions).items())
+    matchers = {name: cls(definitions) for name, cls in MATCHERS.items()}
+
+    rng = np.random.default_rng(seed)
+    mismatches = dict.fromkeys(matchers, 0)
+    for index in range(count):
+        # Main aléatoire plus ou moins ouverte ; une pose sur quatre en
+        # coordonnées arrondies, pour tester les égalités
+        points = rng.random((1, 3)) + rng.normal(0, rng.choice((0.05, 0.1, 0.2)), (NUM_LANDMARKS, 3))
+        if index % 4 == 3:
+            points = np.round(points * 20) / 20
+        pose = HandPose(points.astype(np.float32))
+        expected = next((name for name, check in checks if check(pose)), None)
+        for name, matcher in matchers.items():
+            if matcher.match(pose) != expected:
+                mismatches[name] += 1
+    return mismatches
+
+
+def main():
+    """
+    Rapport sur un fichier de règles : taille de l'arbre de décision et de
+    l'index des formes de la main, nombre de définitions éliminées par chaque
+    comparaison et signes masqués
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("path", nargs="?", default=config.SIGN_RULES_PATH or DEFAULT_PATH)
+    parser.add_argument("--validate", type=int, default=0, metavar="N",
+                        help="comparer chaque méthode aux prédicats _is_* sur N poses aléatoires")
+    args = parser.parse_args()
+
+    definitions = load_definitions(args.path)
+    if args.validate:
+        mismatches = validate(definitions, args.validate)
+        for name, count in mismatches.items():
+            print(f"{name:<8} {count} poses sur {args.validate} avec un signe différent des prédicats")
+        raise SystemExit(1 if any(mismatches.values()) else 0)
+
+    tree = DecisionTree(definitions)
+    index = HandshapeIndex(definitions)
+    print(
+        f"{len(tree)} signes, {len(tree.tests)} comparaisons distinctes, "
+        f"arbre de {tree.node_count} nœuds, profondeur {tree.depth()}"
+    )
+    print(
+        f"Index des formes de la main : {index.code_count} codes possibles, "
+        f"{index.mean_candidates():.1f} signes candidats par code "
+        f"(maximum {max(len(candidates) for candidates in index.table)})"
+    )
+    print(f"{'comparaison':<32} {'signes':>6} {'nœuds':>6} {'élim. si vrai':>14} {'élim. si faux':>14}")
+    report = sorted(
+        tree.elimination(),
+        key=lambda row: -max(row["eliminated_if_true"], row["eliminated_if_false"])
+    )
+    for row in report:
+        print(
+            f"{row['condition']:<32} {row['signs']:>6} {row['nodes']:>6} "
+            f"{row['eliminated_if_true']:>14} {row['eliminated_if_false']:>14}"
+        )
+
+    unreachable = tree.unreachable()
+    if unreachable:
+        shadowed = tree.shadowed()
+        print(f"\n{len(unreachable)} signes jamais reconnus :")
+        for sign in unreachable:
+            if sign not in shadowed:
+                print(f"  {sign} : masqué par plusieurs signes prioritaires")
+            elif shadowed[sign]:
+                print(f"  {sign} : masqué par {shadowed[sign]}")
+            else:
+                print(f"  {sign} : conditions contradictoires")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+from .decoder import choose_scale, decode_image
+from .validation import check_image, check_resolution
+
+# PyAV (décodeur H.264 de FFmpeg) est optionnel
+try:
+    import av
+except ImportError:
+    av = None
+
+# Flux vidéo envoyés par morceaux sur la connexion WebSocket : chaque session
+# garde un décodeur ouvert pendant toute la durée du flux, qui reçoit les
+# morceaux dans l'ordre et produit les images complètes au fil de l'eau.
+
+# Taille maximale des données en attente d'une image MJPEG complète
+MAX_PENDING_BYTES = 8 * 1024 * 1024
+
+_SOI = b"\xff\xd8"
+_EOI = b"\xff\xd9"
+
+
+def _scan_start(buffer, start):
+    """
+    Position des données compressées d'une image JPEG commençant à start
+    (après l'en-tête du segment SOS). Les segments de l'en-tête sont sautés
+    d'après leur longueur : une miniature EXIF (APP1) a ses propres SOI et
+    EOI, qui ne doivent pas couper l'image. Retourne None si l'en-tête n'est
+    pas encore complet, -1 s'il est invalide.
+    """
+    pos = start + 2
+    while pos + 4 <= len(buffer):
+        if buffer[pos] != 0xFF:
+            return -1
+        marker = buffer[pos + 1]
+        if marker == 0xFF:
+            # Octet de bourrage
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            # Marqueurs sans longueur
+            pos += 2
+            continue
+        if marker in (0xD8, 0xD9):
+            return -1
+        end = pos + 2 + (buffer[pos + 2] << 8 | buffer[pos + 3])
+        if marker == 0xDA:
+            return end if end <= len(buffer) else None
+        pos = end
+    return None
+
+
+class MJPEGStreamDecoder:
+    """
+    Flux MJPEG : suite d'images JPEG concaténées, découpées sur les marqueurs
+    SOI (début d'image) et EOI (fin d'image) quelle que soit la façon dont
+    elles sont réparties entre les morceaux ; EOI n'est cherché qu'après
+    l'en-tête de l'image (segments APPn, COM, tables...)
+    """
+    codec = "mjpeg"
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, chunk):
+        """
+        Ajoute un morceau du flux ; retourne la liste des images décodées (BGR)
+        """
+        self._buffer += chunk
+        frames = []
+        while True:
+            start = self._buffer.find(_SOI)
+            if start < 0:
+                # Conserver un éventuel 0xFF final, début d'un SOI coupé en deux
+                del self._buffer[:-1]
+                break
+            scan = _scan_start(self._buffer, start)
+            if scan is None:
+                del self._buffer[:start]
+                break
+            if scan < 0:
+                # Pas un début d'image (octets FF D8 isolés) : chercher le suivant
+                del self._buffer[:start + 2]
+                continue
+            end = self._buffer.find(_EOI, scan)
+            if end < 0:
+                del self._buffer[:start]
+                break
+            # Copie de l'image : le tampon est ensuite raccourci
+            frame_bytes = self._buffer[start:end + 2]
+            del self._buffer[:end + 2]
+            # Dimensions lues dans l'en-tête JPEG, comme pour une image seule
+            check_image(frame_bytes)
+            frame = decode_image(frame_bytes)
+            if frame is not None:
+                frames.append(frame)
+        if len(self._buffer) > MAX_PENDING_BYTES:
+            self._buffer.clear()
+            raise ValueError("Flux MJPEG invalide : aucune fin d'image trouvée.")
+        return frames
+
+    def close(self):
+        self._buffer.clear()
+
+
+class H264StreamDecoder:
+    """
+    Flux H.264 Annex B (unités NAL précédées de 00 00 01), décodé par FFmpeg
+    via PyAV ; les images sont produites directement en RGB, à la taille utile
+    au détecteur
+    """
+    codec = "h264"
+
+    def __init__(self):
+        if av is None:
+            raise RuntimeError("PyAV n'est pas installé (pip install av) : flux H.264 indisponible")
+        self._codec = av.CodecContext.create("h264", "r")
+
+    def feed(self, chunk):
+        frames = []
+        for packet in self._codec.parse(bytes(chunk)):
+            for frame in self._codec.decode(packet):
+                # Refusée avant la conversion en RGB (LSF_MAX_IMAGE_PIXELS)
+                check_resolution(frame.width, frame.height)
+                scale = choose_scale(frame.width, frame.height)
+                frames.append(frame.to_ndarray(
+                    width=frame.width // scale,
+                    height=frame.height // scale,
+                    format="rgb24"
+                ))
+        return frames
+
+    def close(self):
+        self._codec.close()
+
+
+STREAM_DECODERS = {
+    MJPEGStreamDecoder.codec: MJPEGStreamDecoder,
+    H264StreamDecoder.codec: H264StreamDecoder,
+}
+
+
+def create_stream_decoder(codec):
+    cls = STREAM_DECODERS.get(codec)
+    if cls is None:
+        raise ValueError(f"Codec de flux inconnu : {codec}")
+    return cls()
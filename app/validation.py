@@ -0,0 +1,86 @@
+import base64
+import binascii
+from . import config
+from .decoder import image_info
+from .protocol import ProtocolError
+
+# Validation des images reçues avant tout décodage complet : le format et les
+# dimensions sont lus dans l'en-tête JPEG/PNG (quelques octets), pour rejeter
+# à moindre coût les charges utiles invalides, trop grandes ou hostiles
+# (ex. petit JPEG annonçant 60000 × 60000 pixels).
+
+# Nombre de caractères base64 décodés pour lire l'en-tête d'une image JSON
+BASE64_SNIFF_CHARS = 4096
+
+_JPEG_SIGNATURE = b"\xff\xd8\xff"
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class PayloadRejected(ProtocolError):
+    """
+    Charge utile refusée avant décodage ; code identifie la cause :
+    "unsupported_format", "image_too_large" ou "invalid_image"
+    """
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def check_resolution(width, height):
+    """
+    Refuse les images vides ou au-delà de LSF_MAX_IMAGE_PIXELS
+    """
+    if width == 0 or height == 0:
+        raise PayloadRejected("invalid_image", f"Dimensions d'image invalides : {width}x{height}")
+    if width * height > config.MAX_IMAGE_PIXELS:
+        raise PayloadRejected(
+            "image_too_large",
+            f"Image trop grande : {width}x{height} (maximum {config.MAX_IMAGE_PIXELS} pixels)"
+        )
+
+
+def check_image(data):
+    """
+    Vérifie le format (JPEG ou PNG) et les dimensions d'une image complète
+    """
+    info = image_info(data)
+    if info is None:
+        if bytes(data[:3]) == _JPEG_SIGNATURE or bytes(data[:8]) == _PNG_SIGNATURE:
+            raise PayloadRejected("invalid_image", "En-tête d'image JPEG/PNG invalide ou tronqué.")
+        raise PayloadRejected("unsupported_format", "Format d'image non supporté (JPEG ou PNG attendu).")
+    check_resolution(info[1], info[2])
+    return info
+
+
+def base64_prefix(image_b64):
+    """
+    Premiers octets d'une image base64 (au plus BASE64_SNIFF_CHARS
+    caractères), ou None s'ils ne peuvent pas être décodés seuls : l'image
+    complète doit alors être vérifiée. Les retours à la ligne du base64 MIME
+    (ou de Base64.DEFAULT sur Android) sont ignorés.
+
+    >>> base64_prefix("/9j/4AAQ\\nSkZJRgAB\\nAQ==")
+    b'\\xff\\xd8\\xff\\xe0\\x00\\x10JFIF\\x00\\x01\\x01'
+    """
+    chars = "".join(image_b64[:BASE64_SNIFF_CHARS].split())
+    chars = chars[:len(chars) - len(chars) % 4]
+    try:
+        return base64.b64decode(chars)
+    except (binascii.Error, ValueError):
+        return None
+
+
+def check_image_prefix(prefix):
+    """
+    Vérifie le début d'une image (ex. premiers octets base64 décodés) :
+    la signature doit être JPEG ou PNG, et les dimensions, si l'en-tête est
+    déjà présent, sous la limite. Retourne False si l'en-tête n'a pas pu être lu
+    (segments EXIF volumineux) : l'image complète doit alors être vérifiée.
+    """
+    if not (prefix.startswith(_JPEG_SIGNATURE) or prefix.startswith(_PNG_SIGNATURE)):
+        raise PayloadRejected("unsupported_format", "Format d'image non supporté (JPEG ou PNG attendu).")
+    info = image_info(prefix)
+    if info is None:
+        return False
+    check_resolution(info[1], info[2])
+    return True
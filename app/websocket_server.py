@@ -2,104 +2,434 @@ import asyncio
 import websockets
 import json
 import base64
-import cv2
-import numpy as np
 import logging
-from .lsf_recognizer import recognize_lsf_sign
-
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+import itertools
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from . import config
+from .batching import BatchScheduler
+from .frame_cache import FrameCache, frame_phash
+from . import metrics
+from .recording import SessionRecorder
+from .validation import (
+    PayloadRejected, base64_prefix, check_image, check_image_prefix, check_resolution
+)
+from .responses import SignResponses, dumps, loads
+from .lsf_recognizer import vocabulary
+from .logging_config import setup_logging, format_fields, LogSampler
+from .inference import (
+    InferenceExecutor, InferenceQueueFull,
+    process_image, process_yuv, process_landmarks, process_stream, process_stream_end
 )
+from .protocol import (
+    parse_frame, unpack_landmarks, unpack_yuv, ProtocolError,
+    IMAGE_FORMATS, YUV_FORMATS, STREAM_FORMATS, LANDMARK_FORMATS, FORMAT_NAMES
+)
+
+# Configuration du logging : voir logging_config.setup_logging (appelé au démarrage)
 logger = logging.getLogger('LSF_Server')
 
-class LSFWebSocketServer:
+
+class LatestFrameSlot:
+    """
+    Emplacement d'image en attente d'une connexion : seule la plus récente
+    est conservée, les images plus anciennes non traitées sont abandonnées
+    """
     def __init__(self):
+        self._frame = None
+        self._event = asyncio.Event()
+        self.dropped = 0
+
+    def put(self, frame):
+        if self._frame is not None:
+            self.dropped += 1
+            metrics.DROPPED_FRAMES.inc()
+        self._frame = frame
+        self._event.set()
+
+    async def get(self):
+        await self._event.wait()
+        self._event.clear()
+        frame, self._frame = self._frame, None
+        return frame
+
+
+class ClientConnection:
+    """
+    État d'une connexion WebSocket côté serveur
+    """
+    def __init__(self, websocket, session_id, latest_frame_only=False):
+        self.websocket = websocket
+        # Identifiant de la session de reconnaissance (suivi MediaPipe et historique des signes)
+        self.session_id = session_id
+        # Mode "dernière image gagnante" : les images en retard sont abandonnées
+        self.latest_frame_only = latest_frame_only
+        self.slot = LatestFrameSlot()
+        self.worker = None
+        # Enregistrement des messages reçus (LSF_RECORD_DIR)
+        self.recorder = None
+        # Cache des images en double (LSF_FRAME_CACHE_SIZE)
+        self.frame_cache = FrameCache() if config.FRAME_CACHE_SIZE > 0 else None
+
+
+class LSFWebSocketServer:
+    def __init__(self, executor=None, latest_frame_only=None):
         self.clients = set()
-        logger.info("Serveur LSF initialisé")
+        # État de chaque connexion : websocket -> ClientConnection
+        self.connections = {}
+        self._session_ids = itertools.count()
+        # Pool d'inférence : la reconnaissance ne bloque pas la boucle asyncio
+        self.executor = executor or InferenceExecutor()
+        # Micro-batching des images de plusieurs clients (désactivé si la taille de lot vaut 1)
+        self.scheduler = None
+        if config.BATCH_MAX_SIZE > 1:
+            self.scheduler = BatchScheduler(self.executor)
+        if latest_frame_only is None:
+            latest_frame_only = config.LATEST_FRAME_ONLY
+        self.latest_frame_only = latest_frame_only
+        # Réponses sign_detected pré-sérialisées pour tout le vocabulaire
+        self.responses = SignResponses(vocabulary())
+        # Journalisation échantillonnée des signes détectés (chemin critique)
+        self.sign_log = LogSampler(config.LOG_SAMPLE_EVERY)
+        metrics.ACTIVE_CLIENTS.set_function(lambda: len(self.clients))
+        metrics.QUEUE_DEPTH.set_function(lambda: self.executor.queue_depth)
+        logger.info(
+            f"Serveur LSF initialisé (inférence : {self.executor.mode}, "
+            f"{self.executor.max_workers} workers, file max {self.executor.max_queue})"
+        )
 
     async def register(self, websocket):
         self.clients.add(websocket)
+        # Chaque client a sa propre session (suivi MediaPipe et historique des signes)
+        connection = ClientConnection(
+            websocket, next(self._session_ids), self.latest_frame_only
+        )
+        self.connections[websocket] = connection
+        if config.RECORD_DIR:
+            path = os.path.join(
+                config.RECORD_DIR,
+                f"session-{int(time.time())}-{os.getpid()}-{connection.session_id}.lsfrec"
+            )
+            try:
+                connection.recorder = SessionRecorder(path)
+            except OSError as e:
+                logger.error(f"Enregistrement de la session impossible ({path}) : {str(e)}")
+        await self.executor.open_session(connection.session_id)
         logger.info(f"Nouvelle connexion WebSocket. Clients connectés : {len(self.clients)}")
         # Envoie le message de connexion à chaque nouveau client
-        await websocket.send(json.dumps({"type": "connection_established"}))
+        await websocket.send(dumps({"type": "connection_established"}))
+        return connection
 
     async def unregister(self, websocket):
-        self.clients.remove(websocket)
+        self.clients.discard(websocket)
+        connection = self.connections.pop(websocket, None)
+        if connection is not None:
+            if connection.worker is not None:
+                connection.worker.cancel()
+            if connection.recorder is not None:
+                connection.recorder.close()
+            # Une image peut encore être en cours dans le pool malgré l'annulation :
+            # close_session attend qu'elle libère la session (RecognitionSession.lock)
+            await self.executor.close_session(connection.session_id)
         logger.info(f"Client déconnecté. Clients connectés : {len(self.clients)}")
 
     def fix_base64_padding(self, b64_string):
         return b64_string + '=' * (-len(b64_string) % 4)
 
+    async def handle_json_message(self, connection, message):
+        """
+        Traite un message texte JSON
+        """
+        websocket = connection.websocket
+        # Décoder le message JSON
+        data = loads(message)
+        if data.get("type") == "image":
+            image_b64 = data.get("data")
+            if not image_b64:
+                raise ValueError("Champ 'data' manquant ou vide dans le message JSON.")
+            # Lire le format et les dimensions sur les premiers octets, avant
+            # de décoder tout le base64
+            prefix = base64_prefix(image_b64)
+            header_checked = prefix is not None and check_image_prefix(prefix)
+            # Corriger le padding base64 si besoin
+            start = time.perf_counter()
+            image_b64 = self.fix_base64_padding(image_b64)
+            image_data = base64.b64decode(image_b64)
+            metrics.STAGE_DURATION.labels("base64_decode").observe(time.perf_counter() - start)
+            if not header_checked:
+                check_image(image_data)
+            metrics.FRAMES.labels("json").inc()
+            await self.submit_frame(connection, process_image, (image_data,), {})
+        elif data.get("type") == "stream_end":
+            # Fermer le décodeur du flux vidéo de la session
+            await self.executor.run(connection.session_id, process_stream_end)
+            await websocket.send(dumps({"type": "stream_end"}))
+        elif data.get("type") == "config":
+            if "latest_frame_only" in data:
+                connection.latest_frame_only = bool(data["latest_frame_only"])
+            await websocket.send(dumps({
+                "type": "config",
+                "latest_frame_only": connection.latest_frame_only
+            }))
+        elif data.get("type") == "status":
+            await websocket.send(dumps({
+                "type": "status",
+                "clients": len(self.clients),
+                "queue_depth": self.executor.queue_depth,
+                "dropped_frames": connection.slot.dropped
+            }))
+        else:
+            # Message non reconnu
+            await websocket.send(dumps({
+                "type": "error",
+                "message": f"Type de message non supporté : {data.get('type')}"
+            }))
+
+    async def handle_binary_message(self, connection, message):
+        """
+        Traite un message binaire (en-tête fixe + image ou landmarks, voir protocol.py)
+        """
+        header, payload = parse_frame(message)
+        extra = {
+            "frame_id": header.frame_id,
+            "timestamp": header.timestamp
+        }
+        metrics.FRAMES.labels(FORMAT_NAMES.get(header.format, header.format)).inc()
+        if header.format in IMAGE_FORMATS:
+            # Format et dimensions lus dans l'en-tête, avant tout décodage
+            check_image(payload)
+            # L'image est passée sans copie (memoryview) à cv2.imdecode
+            await self.submit_frame(connection, process_image, (payload,), extra)
+        elif header.format in YUV_FORMATS:
+            layout, planes = unpack_yuv(payload, header.format)
+            check_resolution(layout.width, layout.height)
+            await self.submit_frame(connection, process_yuv, (planes, layout), extra)
+        elif header.format in STREAM_FORMATS:
+            codec = FORMAT_NAMES[header.format]
+            await self.submit_frame(
+                connection, process_stream,
+                (payload, codec, connection.latest_frame_only), extra
+            )
+        elif header.format in LANDMARK_FORMATS:
+            points = unpack_landmarks(payload, header.format)
+            await self.submit_frame(connection, process_landmarks, (points,), extra)
+        else:
+            raise ProtocolError(f"Format d'image non supporté : {header.format}")
+
+    async def submit_frame(self, connection, func, args, extra):
+        """
+        Traite une image tout de suite, ou la dépose dans l'emplacement
+        "dernière image" de la connexion si ce mode est actif
+        """
+        received = time.perf_counter()
+        # Les morceaux d'un flux vidéo ne peuvent pas être abandonnés : le
+        # décodeur doit tous les recevoir, dans l'ordre
+        if not connection.latest_frame_only or func is process_stream:
+            await self.process_frame(connection, func, args, extra, received)
+            return
+        connection.slot.put((func, args, extra, received))
+        if connection.worker is None or connection.worker.done():
+            connection.worker = asyncio.create_task(self.frame_worker(connection))
+
+    async def frame_worker(self, connection):
+        """
+        Traite en continu la dernière image reçue d'une connexion
+        """
+        while True:
+            func, args, extra, received = await connection.slot.get()
+            try:
+                try:
+                    await self.process_frame(connection, func, args, extra, received)
+                except websockets.exceptions.ConnectionClosed:
+                    raise
+                except Exception as e:
+                    await self.report_error(connection.websocket, e)
+            except websockets.exceptions.ConnectionClosed:
+                return
+
+    async def process_frame(self, connection, func, args, extra, received):
+        """
+        Reconnaît le signe (image décodée dans le pool d'inférence,
+        ou landmarks envoyés par le client), puis envoie la réponse
+        """
+        cache = connection.frame_cache
+        cache_keys = None
+        sign = None
+        if cache is not None and func in (process_image, process_yuv):
+            # Image déjà vue récemment : réutiliser le signe, sans décodage ni MediaPipe
+            start = time.perf_counter()
+            cache_keys = cache.keys(*args)
+            if cache.needs_phash(cache_keys):
+                # Le dHash décode un aperçu de l'image : dans le pool, hors de la boucle asyncio
+                phash = await self.executor.run(connection.session_id, frame_phash, *args)
+                cache_keys = cache_keys._replace(phash=phash)
+            sign = cache.get(cache_keys)
+            metrics.STAGE_DURATION.labels("frame_cache").observe(time.perf_counter() - start)
+        if sign is None:
+            if func is process_landmarks:
+                sign, timings = await self.executor.run_inline(connection.session_id, func, *args)
+            elif func is process_image and self.scheduler is not None:
+                sign, timings = await self.scheduler.run(connection.session_id, *args)
+            else:
+                sign, timings = await self.executor.run(connection.session_id, func, *args)
+            metrics.observe_stages(timings)
+            if sign is None:
+                # Morceau de flux sans image complète : pas de réponse
+                return
+            if cache_keys is not None:
+                cache.put(cache_keys, sign)
+        # Envoyer la réponse (pré-sérialisée pour chaque signe)
+        fields = extra
+        if connection.latest_frame_only:
+            fields = dict(extra, dropped_frames=connection.slot.dropped)
+        await connection.websocket.send(self.responses.render(sign, fields))
+        metrics.FRAME_DURATION.observe(time.perf_counter() - received)
+        if self.sign_log.should_log():
+            logger.info("Signe détecté et envoyé : " + format_fields(
+                session=connection.session_id, sign=repr(sign), **extra
+            ))
+
+    async def report_error(self, websocket, e):
+        """
+        Journalise une erreur de traitement et la renvoie au client
+        """
+        metrics.ERRORS.labels(type(e).__name__).inc()
+        if isinstance(e, PayloadRejected):
+            metrics.REJECTED_PAYLOADS.labels(e.code).inc()
+            logger.warning(f"Image refusée ({e.code}) : {str(e)}")
+            await websocket.send(dumps({
+                "type": "error",
+                "code": e.code,
+                "message": str(e)
+            }))
+        elif isinstance(e, InferenceQueueFull):
+            logger.warning(f"File d'inférence pleine : {e.queue_depth} images en attente")
+            await websocket.send(dumps({
+                "type": "error",
+                "message": str(e),
+                "queue_depth": e.queue_depth
+            }))
+        elif isinstance(e, json.JSONDecodeError):
+            logger.error(f"Erreur de décodage JSON : {str(e)}")
+            await websocket.send(dumps({
+                "type": "error",
+                "message": "Format JSON invalide"
+            }))
+        else:
+            logger.error(f"Erreur lors du traitement de l'image : {str(e)}")
+            await websocket.send(dumps({
+                "type": "error",
+                "message": str(e)
+            }))
+
     async def handle_client(self, websocket):
-        await self.register(websocket)
         try:
+            connection = await self.register(websocket)
             async for message in websocket:
                 try:
-                    # Log the received message for debugging
-                    logger.info(f"Message received: {message[:200]}...") # Log first 200 chars
-                    # Décoder le message JSON
-                    data = json.loads(message)
-                    if data.get("type") == "image":
-                        image_b64 = data.get("data")
-                        if not image_b64:
-                            raise ValueError("Champ 'data' manquant ou vide dans le message JSON.")
-                        # Corriger le padding base64 si besoin
-                        image_b64 = self.fix_base64_padding(image_b64)
-                        image_data = base64.b64decode(image_b64)
-                        nparr = np.frombuffer(image_data, np.uint8)
-                        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                        if frame is None:
-                            raise ValueError("Impossible de décoder l'image envoyée.")
-                        # Reconnaître le signe
-                        sign = recognize_lsf_sign(frame)
-                        # Envoyer la réponse
-                        response = {
-                            "type": "sign_detected",
-                            "sign": sign
-                        }
-                        await websocket.send(json.dumps(response))
-                        logger.info(f"Signe détecté et envoyé : {sign}")
+                    if connection.recorder is not None:
+                        if connection.recorder.failed:
+                            # Erreur d'écriture (journalisée par le recorder) : arrêter l'enregistrement
+                            connection.recorder.close()
+                            connection.recorder = None
+                        else:
+                            connection.recorder.write(message)
+                    # Journaliser le début du message seulement si explicitement demandé
+                    if config.LOG_PAYLOADS and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Message received: {message[:200]}...") # Log first 200 chars
+                    if isinstance(message, bytes):
+                        await self.handle_binary_message(connection, message)
                     else:
-                        # Message non reconnu
-                        await websocket.send(json.dumps({
-                            "type": "error",
-                            "message": f"Type de message non supporté : {data.get('type')}"
-                        }))
-                except json.JSONDecodeError as e:
-                    logger.error(f"Erreur de décodage JSON : {str(e)}")
-                    await websocket.send(json.dumps({
-                        "type": "error",
-                        "message": "Format JSON invalide"
-                    }))
+                        await self.handle_json_message(connection, message)
+                except websockets.exceptions.ConnectionClosed:
+                    raise
                 except Exception as e:
-                    logger.error(f"Erreur lors du traitement de l'image : {str(e)}")
-                    await websocket.send(json.dumps({
-                        "type": "error",
-                        "message": str(e)
-                    }))
+                    await self.report_error(websocket, e)
 
         except websockets.exceptions.ConnectionClosed:
             logger.info("Connexion WebSocket fermée")
         finally:
             await self.unregister(websocket)
 
-async def start_server():
+async def start_server(reuse_port=False, metrics_port=None):
     server = LSFWebSocketServer()
+    if metrics_port is None:
+        metrics_port = config.METRICS_PORT
+    metrics_server = None
     try:
-        async with websockets.serve(server.handle_client, "0.0.0.0", 8765):
-            logger.info("Serveur LSF démarré sur ws://0.0.0.0:8765")
+        if metrics_port:
+            metrics_server = await metrics.start_metrics_server(config.HOST, metrics_port)
+        async with websockets.serve(
+            server.handle_client, config.HOST, config.PORT, reuse_port=reuse_port,
+            # Les messages plus grands ferment la connexion (code 1009) avant d'être lus en entier
+            max_size=config.MAX_MESSAGE_SIZE or None
+        ):
+            logger.info(f"Serveur LSF démarré sur ws://{config.HOST}:{config.PORT} (pid {os.getpid()})")
             await asyncio.Future()  # Garde le serveur en vie
     except Exception as e:
         logger.error(f"Erreur lors du démarrage du serveur : {str(e)}")
         raise
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+        server.executor.shutdown(wait=False)
 
-def start_lsf_server():
+def _run_worker(worker_id):
+    """
+    Point d'entrée d'un processus serveur en mode multi-workers
+    """
+    setup_logging()
+    logger.info(f"Démarrage du worker {worker_id} (pid {os.getpid()})")
     try:
-        asyncio.run(start_server())
+        # Chaque worker expose ses propres métriques sur METRICS_PORT + numéro du worker
+        metrics_port = config.METRICS_PORT + worker_id if config.METRICS_PORT else 0
+        asyncio.run(start_server(reuse_port=True, metrics_port=metrics_port))
+    except KeyboardInterrupt:
+        pass
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+def start_lsf_workers(workers):
+    """
+    Lance plusieurs processus serveur qui écoutent le même port (SO_REUSEPORT).
+    Le noyau répartit les connexions entre les processus et chaque connexion
+    reste sur le même processus toute sa durée de vie, avec son état de suivi.
+    """
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("SO_REUSEPORT n'est pas disponible sur cette plateforme")
+    processes = [
+        multiprocessing.Process(target=_run_worker, args=(worker_id,), name=f"lsf-worker-{worker_id}")
+        for worker_id in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    # docker stop envoie SIGTERM au processus parent uniquement
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    logger.info(f"Serveur LSF démarré avec {workers} workers sur ws://{config.HOST}:{config.PORT}")
+    try:
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+
+def start_lsf_server(workers=None):
+    setup_logging()
+    workers = workers or config.SERVER_WORKERS
+    try:
+        if workers > 1:
+            start_lsf_workers(workers)
+        else:
+            asyncio.run(start_server())
     except KeyboardInterrupt:
         logger.info("Arrêt du serveur LSF")
     except Exception as e:
         logger.error(f"Erreur fatale : {str(e)}")
-        raise 
\ No newline at end of file
+        raise
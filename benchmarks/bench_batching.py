@@ -0,0 +1,94 @@
+"""
+Benchmark du micro-batching entre clients : débit, latence et temps CPU du
+serveur par image, image par image (LSF_BATCH_MAX_SIZE=1) ou par lots.
+
+Lance `run_server.py` une fois par taille de lot, puis envoie des images depuis
+plusieurs clients simultanés pendant une durée fixe. MediaPipe Hands traite
+une image par appel (un graphe par session, avec son état de suivi) : un lot
+ne fait que regrouper les soumissions au pool d'inférence, sans backend de
+landmarks batché. Le temps CPU par image (lu dans /proc, Linux uniquement)
+montre si le regroupement fait gagner quelque chose.
+
+Exemple :
+    python benchmarks/bench_batching.py --batch-sizes 1 4 8 --clients 16 --duration 20
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_workers import make_frame, run_load, wait_for_server  # noqa: E402
+
+
+def cpu_seconds(pid):
+    """
+    Temps CPU (utilisateur + système) d'un processus, ou None hors Linux
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    # Champs 14 et 15 de /proc/<pid>/stat (utime, stime), après le nom du processus
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def bench(batch_size, args, payload):
+    env = dict(os.environ)
+    env["LSF_BATCH_MAX_SIZE"] = str(batch_size)
+    env["LSF_BATCH_MAX_WAIT_MS"] = str(args.max_wait_ms)
+    env["LSF_SERVER_WORKERS"] = "1"
+    env["LSF_PORT"] = str(args.port)
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "run_server.py")],
+        cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    url = f"ws://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(wait_for_server(url))
+        cpu_start = cpu_seconds(server.pid)
+        latencies = asyncio.run(run_load(url, payload, args.clients, args.duration))
+        cpu_end = cpu_seconds(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+    latencies.sort()
+    throughput = len(latencies) / args.duration
+    p50 = latencies[len(latencies) // 2] * 1000 if latencies else float("nan")
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000 if latencies else float("nan")
+    cpu_per_frame = None
+    if cpu_start is not None and cpu_end is not None and latencies:
+        cpu_per_frame = (cpu_end - cpu_start) / len(latencies) * 1000
+    return throughput, p50, p95, cpu_per_frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8],
+                        help="valeurs de LSF_BATCH_MAX_SIZE (1 = image par image)")
+    parser.add_argument("--max-wait-ms", type=int, default=5, help="LSF_BATCH_MAX_WAIT_MS")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--port", type=int, default=18766)
+    parser.add_argument("--image", help="image JPEG à envoyer (par défaut : image synthétique)")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    args = parser.parse_args()
+
+    payload = make_frame(args.image, args.width, args.height)
+    print(f"CPU : {os.cpu_count()}, clients : {args.clients}, durée : {args.duration}s")
+    print(f"{'lot':>5} {'images/s':>10} {'p50 (ms)':>10} {'p95 (ms)':>10} {'CPU/image (ms)':>15}")
+    for batch_size in args.batch_sizes:
+        throughput, p50, p95, cpu_per_frame = bench(batch_size, args, payload)
+        cpu = f"{cpu_per_frame:.2f}" if cpu_per_frame is not None else "n/d"
+        print(f"{batch_size:>5} {throughput:>10.1f} {p50:>10.1f} {p95:>10.1f} {cpu:>15}")
+
+
+if __name__ == "__main__":
+    main()
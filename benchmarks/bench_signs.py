@@ -0,0 +1,130 @@
+"""
+Benchmark de la reconnaissance des signes : coût par image en fonction de la
+taille du vocabulaire, pour chaque méthode (LSF_SIGN_MATCHER).
+
+Les N premiers signes du fichier de règles (ordre de priorité) sont reconnus
+sur des poses de main synthétiques. Les prédicats s'arrêtent au premier signe
+reconnu, souvent l'un des premiers de la liste ; la ligne "predicates (tous)"
+mesure le pire cas, payé quand aucun signe n'est reconnu ou que le signe est
+en fin de liste (ex. un signe ajouté au fichier de règles). L'arbre de
+décision évalue au pire autant de comparaisons que sa profondeur ; l'index
+des formes de la main ne teste que les signes compatibles avec le code de la
+pose. Toutes les méthodes doivent retourner le même signe pour chaque pose. Tout fonctionne
+hors ligne, sans MediaPipe ni caméra.
+
+Exemples :
+    python benchmarks/bench_signs.py --sizes 44 142 --frames 5000
+    python benchmarks/bench_signs.py --rules mes_signes.yaml --sizes 20
+"""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import config  # noqa: E402
+from app.landmarks import NUM_LANDMARKS  # noqa: E402
+from app.pose import HandPose  # noqa: E402
+from app.rules import CompiledRules, DecisionTree, HandshapeIndex  # noqa: E402
+from app.sign_rules import DEFAULT_PATH, load_definitions, predicates  # noqa: E402
+
+
+def make_points(rng, count):
+    """
+    Poses synthétiques : une position de main aléatoire, plus un bruit par
+    point (main plus ou moins ouverte)
+    """
+    points = []
+    for _ in range(count):
+        spread = rng.choice((0.05, 0.1, 0.2))
+        points.append((rng.random((1, 3)) + rng.normal(0, spread, (NUM_LANDMARKS, 3))).astype(np.float32))
+    return points
+
+
+def predicates_matchers(definitions):
+    """
+    Prédicats _is_* de LSFRecognizer appelés un par un (LSF_SIGN_MATCHER=predicates) :
+    jusqu'au premier signe reconnu, et pour tout le vocabulaire
+    """
+    config.SIGN_MATCHER = "predicates"
+    from app.lsf_recognizer import LSFRecognizer
+    checks = list(predicates(LSFRecognizer(), definitions).items())
+
+    def match(pose):
+        for name, check in checks:
+            if check(pose):
+                return name
+        return None
+
+    def match_all(pose):
+        matched = [name for name, check in checks if check(pose)]
+        return matched[0] if matched else None
+
+    return match, match_all
+
+
+def bench(match, points, repeat):
+    """
+    Meilleur temps moyen par image (µs) ; chaque passe reçoit des poses neuves
+    (les grandeurs dérivées de HandPose sont mises en cache)
+    """
+    best = float("inf")
+    results = None
+    for _ in range(repeat):
+        poses = [HandPose(p) for p in points]
+        start = time.perf_counter()
+        results = [match(pose) for pose in poses]
+        best = min(best, (time.perf_counter() - start) / len(poses))
+    return best * 1e6, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rules", default=DEFAULT_PATH, help="fichier de règles (défaut : app/signs.json)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[44, 142],
+                        help="tailles de vocabulaire (N premiers signes du fichier)")
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    definitions = load_definitions(args.rules)
+    sizes = [min(size, len(definitions)) for size in args.sizes]
+    points = make_points(np.random.default_rng(args.seed), args.frames)
+
+    timings = {}
+    depths = []
+    for size in sizes:
+        subset = dict(list(definitions.items())[:size])
+        match, match_all = predicates_matchers(subset)
+        tree = DecisionTree(subset)
+        depths.append(tree.depth())
+        expected = bench(match, points, 1)[1]
+        for name, matcher in (
+            ("predicates", match),
+            ("predicates (tous)", match_all),
+            ("matrix", CompiledRules(subset).match),
+            ("tree", tree.match),
+            ("index", HandshapeIndex(subset).match),
+        ):
+            elapsed, results = bench(matcher, points, args.repeat)
+            if results != expected:
+                raise SystemExit(f"{name} : résultats différents des prédicats ({size} signes)")
+            timings.setdefault(name, []).append(elapsed)
+
+    print(f"{len(definitions)} signes dans {args.rules}, {len(points)} poses")
+    print(f"{'méthode':<18}" + "".join(f"{f'{size} signes':>12}" for size in sizes) + f"{'rapport':>9}")
+    for name, values in timings.items():
+        print(
+            f"{name:<18}" + "".join(f"{f'{value:.2f} µs':>12}" for value in values)
+            + f"{f'×{values[-1] / values[0]:.2f}':>9}"
+        )
+    print(f"{'profondeur arbre':<18}" + "".join(f"{depth:>12}" for depth in depths)
+          + f"{f'×{depths[-1] / depths[0]:.2f}':>9}")
+
+
+if __name__ == "__main__":
+    main()
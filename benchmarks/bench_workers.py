@@ -0,0 +1,117 @@
+"""
+Benchmark du mode multi-workers : débit du serveur en fonction du nombre de processus.
+
+Lance `run_server.py` avec LSF_SERVER_WORKERS = 1, 2, 4, ... puis envoie des images
+depuis plusieurs clients simultanés pendant une durée fixe et affiche le débit.
+
+Exemple :
+    python benchmarks/bench_workers.py --workers 1 2 4 --clients 16 --duration 20
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import cv2
+import numpy as np
+import websockets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.protocol import pack_frame, FORMAT_JPEG  # noqa: E402
+
+
+def make_frame(image_path, width, height):
+    """
+    Image JPEG envoyée par les clients (image fournie ou image synthétique)
+    """
+    if image_path:
+        with open(image_path, "rb") as f:
+            return f.read()
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+    ok, encoded = cv2.imencode(".jpg", image)
+    if not ok:
+        raise RuntimeError("Impossible d'encoder l'image de test")
+    return encoded.tobytes()
+
+
+async def run_client(url, payload, deadline, latencies):
+    async with websockets.connect(url, max_size=None) as websocket:
+        await websocket.recv()  # connection_established
+        frame_id = 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await websocket.send(pack_frame(payload, FORMAT_JPEG, frame_id))
+            await websocket.recv()
+            latencies.append(time.perf_counter() - start)
+            frame_id += 1
+
+
+async def run_load(url, payload, clients, duration):
+    latencies = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(run_client(url, payload, deadline, latencies) for _ in range(clients)))
+    return latencies
+
+
+async def wait_for_server(url, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            async with websockets.connect(url):
+                return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Le serveur ne répond pas sur {url}")
+
+
+def bench(workers, args, payload):
+    env = dict(os.environ)
+    env["LSF_SERVER_WORKERS"] = str(workers)
+    env["LSF_PORT"] = str(args.port)
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "run_server.py")],
+        cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    url = f"ws://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(wait_for_server(url))
+        latencies = asyncio.run(run_load(url, payload, args.clients, args.duration))
+    finally:
+        server.terminate()
+        server.wait()
+    latencies.sort()
+    throughput = len(latencies) / args.duration
+    p50 = latencies[len(latencies) // 2] * 1000 if latencies else float("nan")
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000 if latencies else float("nan")
+    return throughput, p50, p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--port", type=int, default=18765)
+    parser.add_argument("--image", help="image JPEG à envoyer (par défaut : image synthétique)")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    args = parser.parse_args()
+
+    payload = make_frame(args.image, args.width, args.height)
+    print(f"CPU : {os.cpu_count()}, clients : {args.clients}, durée : {args.duration}s")
+    print(f"{'workers':>8} {'images/s':>10} {'p50 (ms)':>10} {'p95 (ms)':>10} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        throughput, p50, p95 = bench(workers, args, payload)
+        baseline = baseline or throughput
+        speedup = throughput / baseline if baseline else 0.0
+        print(f"{workers:>8} {throughput:>10.1f} {p50:>10.1f} {p95:>10.1f} {speedup:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+Générateur de charge : rejoue des sessions clientes enregistrées contre un serveur local.
+
+Les sessions sont enregistrées par le serveur lui-même (LSF_RECORD_DIR=chemin,
+un fichier .lsfrec par connexion), ou construites à partir d'un dossier d'images
+avec la sous-commande `from-images`. Tout fonctionne hors ligne.
+
+Exemples :
+    # Enregistrer de vraies sessions
+    LSF_RECORD_DIR=recordings python run_server.py
+
+    # Construire une session à 30 images/s à partir d'images JPEG
+    python benchmarks/replay.py from-images images/ session.lsfrec --fps 30
+
+    # Rejouer à vitesse réelle, 2× et au maximum avec 20 clients simultanés
+    python benchmarks/replay.py replay recordings/*.lsfrec --clients 20 --speed 1
+    python benchmarks/replay.py replay recordings/*.lsfrec --clients 20 --speed 2
+    python benchmarks/replay.py replay recordings/*.lsfrec --clients 20 --speed 0
+
+--speed 0 rejoue au maximum : chaque client envoie l'image suivante dès la
+réponse précédente reçue (boucle fermée).
+"""
+import argparse
+import asyncio
+import base64
+import glob
+import json
+import os
+import sys
+import time
+import websockets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.protocol import FRAME_HEADER, STREAM_FORMATS  # noqa: E402
+from app.recording import read_recording, write_recording  # noqa: E402
+
+RESPONSE_TYPES = ("sign_detected", "error")
+
+
+def is_frame(message):
+    """
+    Un message "image" attend une réponse sign_detected (ou error) ; un
+    morceau de flux vidéo n'en reçoit une que s'il complète une image
+    """
+    if isinstance(message, bytes):
+        if len(message) < FRAME_HEADER.size:
+            return True  # Refusé par le serveur avec une erreur
+        return FRAME_HEADER.unpack_from(message)[1] not in STREAM_FORMATS
+    try:
+        return json.loads(message).get("type") == "image"
+    except (ValueError, AttributeError):
+        return False
+
+
+def frame_id_of(message):
+    if isinstance(message, bytes) and len(message) >= FRAME_HEADER.size:
+        return FRAME_HEADER.unpack_from(message)[3]
+    return None
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class ClientStats:
+    def __init__(self):
+        self.sent = 0
+        self.answered = 0
+        self.errors = 0
+        self.dropped = 0
+        self.latencies = []
+
+
+async def replay_client(url, records, speed, loops, stats, reply_timeout):
+    """
+    Rejoue un enregistrement sur une connexion et mesure la latence de bout en bout
+    (records : liste de (offset, message, est une image, frame_id))
+    """
+    async with websockets.connect(url, max_size=None) as websocket:
+        await websocket.recv()  # connection_established
+        # Images envoyées et pas encore répondues, dans l'ordre d'envoi
+        pending = []
+        by_frame_id = {}
+        answered = asyncio.Event()
+        done_sending = asyncio.Event()
+        last_dropped = 0
+
+        async def receive():
+            nonlocal last_dropped
+            async for reply in websocket:
+                data = json.loads(reply)
+                if data.get("type") not in RESPONSE_TYPES or not pending:
+                    continue
+                now = time.perf_counter()
+                frame_id = data.get("frame_id")
+                if frame_id is not None and frame_id in by_frame_id:
+                    entry = by_frame_id.pop(frame_id)
+                    # Les images plus anciennes sans réponse ont été abandonnées
+                    while pending and pending[0] is not entry:
+                        stale = pending.pop(0)
+                        by_frame_id.pop(stale[1], None)
+                    pending.pop(0)
+                elif frame_id is not None:
+                    # Image d'un flux vidéo, ou déjà comptée comme abandonnée
+                    continue
+                else:
+                    # Messages JSON : les images abandonnées sont les plus anciennes en attente
+                    dropped = data.get("dropped_frames", last_dropped)
+                    for _ in range(min(dropped - last_dropped, len(pending) - 1)):
+                        pending.pop(0)
+                    last_dropped = dropped
+                    entry = pending.pop(0)
+                stats.answered += 1
+                if data.get("type") == "error":
+                    stats.errors += 1
+                else:
+                    stats.latencies.append(now - entry[0])
+                if "dropped_frames" in data:
+                    stats.dropped = max(stats.dropped, data["dropped_frames"])
+                answered.set()
+                if done_sending.is_set() and not pending:
+                    return
+
+        receiver = asyncio.create_task(receive())
+        try:
+            for _ in range(loops):
+                start = time.perf_counter()
+                for offset, message, frame, frame_id in records:
+                    if speed > 0:
+                        delay = start + offset / speed - time.perf_counter()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                    if not frame:
+                        await websocket.send(message)
+                        continue
+                    if speed <= 0:
+                        # Boucle fermée : attendre la réponse précédente
+                        while pending:
+                            answered.clear()
+                            try:
+                                await asyncio.wait_for(answered.wait(), timeout=reply_timeout)
+                            except asyncio.TimeoutError:
+                                # Images restées sans réponse : passer à la suivante
+                                pending.clear()
+                                by_frame_id.clear()
+                    entry = (time.perf_counter(), frame_id)
+                    pending.append(entry)
+                    if entry[1] is not None:
+                        by_frame_id[entry[1]] = entry
+                    await websocket.send(message)
+                    stats.sent += 1
+            done_sending.set()
+            if pending:
+                await asyncio.wait_for(receiver, timeout=30.0)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            receiver.cancel()
+
+
+async def run_replay(args):
+    files = sorted(set(path for pattern in args.recordings for path in glob.glob(pattern)))
+    if not files:
+        raise SystemExit("Aucun enregistrement trouvé")
+    # Classer les messages une fois pour toutes, hors de la boucle de rejeu
+    recordings = [
+        [(offset, message, is_frame(message), frame_id_of(message)) for offset, message in read_recording(path)]
+        for path in files
+    ]
+    stats = [ClientStats() for _ in range(args.clients)]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        replay_client(
+            args.url, recordings[i % len(recordings)], args.speed, args.loops, stats[i], args.reply_timeout
+        )
+        for i in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for s in stats for latency in s.latencies)
+    sent = sum(s.sent for s in stats)
+    answered = sum(s.answered for s in stats)
+    speed = "max" if args.speed <= 0 else f"{args.speed:g}x"
+    print(f"enregistrements : {len(files)}, clients : {args.clients}, vitesse : {speed}, durée : {elapsed:.1f}s")
+    print(f"images envoyées : {sent}, réponses : {answered}, erreurs : {sum(s.errors for s in stats)}")
+    print(f"images abandonnées (serveur) : {sum(s.dropped for s in stats)}, sans réponse : {sent - answered}")
+    print(f"débit : {answered / elapsed:.1f} réponses/s")
+    print(
+        "latence de bout en bout (ms) : "
+        f"p50 {percentile(latencies, 0.50) * 1000:.1f}  "
+        f"p95 {percentile(latencies, 0.95) * 1000:.1f}  "
+        f"p99 {percentile(latencies, 0.99) * 1000:.1f}"
+    )
+
+
+def from_images(args):
+    """
+    Construit un enregistrement de messages JSON image à partir d'un dossier d'images
+    """
+    paths = sorted(
+        path for path in glob.glob(os.path.join(args.directory, "*"))
+        if path.lower().endswith((".jpg", ".jpeg", ".png"))
+    )
+    if not paths:
+        raise SystemExit(f"Aucune image dans {args.directory}")
+    records = []
+    for i, path in enumerate(paths):
+        with open(path, "rb") as f:
+            data = base64.b64encode(f.read()).decode("ascii")
+        records.append((i / args.fps, json.dumps({"type": "image", "data": data})))
+    write_recording(args.output, records)
+    print(f"{len(records)} images enregistrées dans {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    replay = commands.add_parser("replay", help="rejouer des enregistrements contre un serveur")
+    replay.add_argument("recordings", nargs="+", help="fichiers .lsfrec (motifs glob acceptés)")
+    replay.add_argument("--url", default="ws://127.0.0.1:8765")
+    replay.add_argument("--clients", type=int, default=1, help="nombre de clients simultanés")
+    replay.add_argument("--speed", type=float, default=1.0, help="facteur de vitesse (0 = maximum)")
+    replay.add_argument("--loops", type=int, default=1, help="nombre de passages par client")
+    replay.add_argument("--reply-timeout", type=float, default=10.0,
+                        help="attente maximale d'une réponse en boucle fermée (secondes)")
+
+    images = commands.add_parser("from-images", help="construire un enregistrement à partir d'images")
+    images.add_argument("directory")
+    images.add_argument("output")
+    images.add_argument("--fps", type=float, default=30.0)
+
+    args = parser.parse_args()
+    if args.command == "replay":
+        asyncio.run(run_replay(args))
+    else:
+        from_images(args)
+
+
+if __name__ == "__main__":
+    main()